@@ -15,7 +15,8 @@ app = Flask(__name__)
 
 # Initialize intelligent database and real log capture
 intelligent_db = IntelligentErrorDatabase()
-real_logs = RealSystemLogCapture("real_system_logs.db")
+# Captures here only produce journal entries (journalctl -o json / journal.Reader)
+real_logs = RealSystemLogCapture("real_system_logs.db", log_format='json')
 
 @app.route('/')
 def enhanced_interface():
@@ -628,9 +629,9 @@ def verbatim_logs():
 
 @app.route('/api/capture-fresh-logs')
 def capture_fresh_logs():
-    """Capture fresh system logs"""
-    count = real_logs.capture_and_store_all()
-    return jsonify({'captured': count, 'status': 'success'})
+    """Capture fresh system logs (stored by the background writer)"""
+    count = real_logs.capture_and_store_all(background=True)
+    return jsonify({'captured': count, 'status': 'queued'})
 
 @app.route('/api/analyze-with-evidence', methods=['POST'])
 def analyze_with_evidence():
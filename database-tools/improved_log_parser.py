@@ -6,9 +6,58 @@ Fixes timestamp parsing and data display issues
 
 import re
 import json
+import threading
+from collections import OrderedDict
 from datetime import datetime
 from typing import Dict, List, Optional, Tuple
 
+# Patterns are compiled once at import; every method below runs per log line
+
+# Timestamp patterns based on lnav's format detection
+_TIMESTAMP_PATTERNS = [
+    # ISO 8601 format: 2025-06-26T11:09:12-04:00
+    (re.compile(r'(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}[+-]\d{2}:\d{2})'), '%Y-%m-%dT%H:%M:%S%z'),
+    # ISO 8601 without timezone: 2025-06-26T11:09:12
+    (re.compile(r'(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2})'), '%Y-%m-%dT%H:%M:%S'),
+    # Syslog format: Jun 26 11:09:12
+    (re.compile(r'(\w{3}\s+\d{1,2}\s+\d{2}:\d{2}:\d{2})'), '%b %d %H:%M:%S'),
+    # RFC3339: 2025-06-26 11:09:12
+    (re.compile(r'(\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2}:\d{2})'), '%Y-%m-%d %H:%M:%S'),
+]
+
+# Service/application patterns
+_SERVICE_PATTERNS = [
+    # systemd journal: service[pid]:
+    re.compile(r'(\w+)\[(\d+)\]:'),
+    # audit logs: audit[pid]:
+    re.compile(r'(audit)\[(\d+)\]:'),
+    # kernel messages
+    re.compile(r'(kernel):'),
+    # sudo messages
+    re.compile(r'(sudo)\[(\d+)\]:'),
+]
+
+# Log level patterns
+_LEVEL_PATTERNS = [
+    re.compile(r'\b(EMERGENCY|ALERT|CRITICAL|ERROR|WARNING|NOTICE|INFO|DEBUG)\b', re.IGNORECASE),
+    re.compile(r'\b(FATAL|WARN|TRACE)\b', re.IGNORECASE),
+    re.compile(r'\b(sig=\d+)\b', re.IGNORECASE),  # Signal numbers as severity indicators
+]
+
+_LEADING_DIGIT_RE = re.compile(r'^\d')
+_KV_RE = re.compile(r'(\w+)=([^\s]+)')
+_SIGNAL_RE = re.compile(r'sig=(\d+)')
+_PID_RE = re.compile(r'pid=(\d+)')
+_COMM_RE = re.compile(r'comm="([^"]+)"')
+
+# Categorization lookups (membership tests against frozensets, not lists)
+_SYSTEM_SERVICES = frozenset(('systemd', 'kernel', 'audit'))
+_ERROR_LEVELS = frozenset(('CRITICAL', 'ERROR', 'SIGNAL'))
+_CRASH_TERMS = ('sig=', 'segfault', 'oom', 'memory')
+
+# Parsed results kept for repeated lines (dashboards re-parse the same rows every poll)
+PARSE_CACHE_SIZE = 4096
+
 class ImprovedLogParser:
     """
     Log parser based on best practices from lnav and sevdokimov/log-viewer
@@ -16,44 +65,23 @@ class ImprovedLogParser:
     """
     
     def __init__(self):
-        # Timestamp patterns based on lnav's format detection
-        self.timestamp_patterns = [
-            # ISO 8601 format: 2025-06-26T11:09:12-04:00
-            (r'(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}[+-]\d{2}:\d{2})', '%Y-%m-%dT%H:%M:%S%z'),
-            # ISO 8601 without timezone: 2025-06-26T11:09:12
-            (r'(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2})', '%Y-%m-%dT%H:%M:%S'),
-            # Syslog format: Jun 26 11:09:12
-            (r'(\w{3}\s+\d{1,2}\s+\d{2}:\d{2}:\d{2})', '%b %d %H:%M:%S'),
-            # RFC3339: 2025-06-26 11:09:12
-            (r'(\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2}:\d{2})', '%Y-%m-%d %H:%M:%S'),
-        ]
-        
-        # Service/application patterns
-        self.service_patterns = [
-            # systemd journal: service[pid]:
-            r'(\w+)\[(\d+)\]:',
-            # audit logs: audit[pid]:
-            r'(audit)\[(\d+)\]:',
-            # kernel messages
-            r'(kernel):',
-            # sudo messages
-            r'(sudo)\[(\d+)\]:',
-        ]
-        
-        # Log level patterns
-        self.level_patterns = [
-            r'\b(EMERGENCY|ALERT|CRITICAL|ERROR|WARNING|NOTICE|INFO|DEBUG)\b',
-            r'\b(FATAL|WARN|TRACE)\b',
-            r'\b(sig=\d+)\b',  # Signal numbers as severity indicators
-        ]
+        self.timestamp_patterns = _TIMESTAMP_PATTERNS
+        self.service_patterns = _SERVICE_PATTERNS
+        self.level_patterns = _LEVEL_PATTERNS
+        self._parse_cache = OrderedDict()
+        self._parse_cache_lock = threading.Lock()
     
     def extract_timestamp(self, line: str) -> Tuple[Optional[datetime], str]:
         """
         Extract timestamp from log line using multiple patterns
         Returns (datetime_obj, remaining_line)
         """
+        # Every supported format has an HH:MM:SS clock
+        if ':' not in line:
+            return None, line
+        
         for pattern, fmt in self.timestamp_patterns:
-            match = re.search(pattern, line)
+            match = pattern.search(line)
             if match:
                 timestamp_str = match.group(1)
                 try:
@@ -79,8 +107,12 @@ class ImprovedLogParser:
         Extract service name and PID from log line
         Returns (service_name, pid, remaining_line)
         """
+        # All service patterns end in a colon
+        if ':' not in line:
+            return None, None, line
+        
         for pattern in self.service_patterns:
-            match = re.search(pattern, line)
+            match = pattern.search(line)
             if match:
                 groups = match.groups()
                 service = groups[0]
@@ -101,7 +133,7 @@ class ImprovedLogParser:
         if len(parts) >= 2:
             # Second part is likely hostname
             potential_hostname = parts[1]
-            if not re.match(r'^\d', potential_hostname):  # Not starting with digit
+            if not _LEADING_DIGIT_RE.match(potential_hostname):  # Not starting with digit
                 remaining = ' '.join(parts[2:])
                 return potential_hostname, remaining
         
@@ -110,7 +142,7 @@ class ImprovedLogParser:
     def extract_log_level(self, line: str) -> Optional[str]:
         """Extract log level/severity from line"""
         for pattern in self.level_patterns:
-            match = re.search(pattern, line, re.IGNORECASE)
+            match = pattern.search(line)
             if match:
                 return match.group(1).upper()
         
@@ -130,9 +162,12 @@ class ImprovedLogParser:
         """
         structured = {}
         
+        # Every field below is a key=value pair
+        if '=' not in line:
+            return structured
+        
         # Extract key=value pairs
-        kv_pattern = r'(\w+)=([^\s]+)'
-        for match in re.finditer(kv_pattern, line):
+        for match in _KV_RE.finditer(line):
             key, value = match.groups()
             # Remove quotes if present
             value = value.strip('"\'')
@@ -140,20 +175,20 @@ class ImprovedLogParser:
         
         # Extract signal information
         if 'sig=' in line:
-            sig_match = re.search(r'sig=(\d+)', line)
+            sig_match = _SIGNAL_RE.search(line)
             if sig_match:
                 structured['signal_number'] = int(sig_match.group(1))
                 structured['signal_name'] = self.get_signal_name(int(sig_match.group(1)))
         
         # Extract process information
         if 'pid=' in line:
-            pid_match = re.search(r'pid=(\d+)', line)
+            pid_match = _PID_RE.search(line)
             if pid_match:
                 structured['process_id'] = int(pid_match.group(1))
         
         # Extract command information
         if 'comm=' in line:
-            comm_match = re.search(r'comm="([^"]+)"', line)
+            comm_match = _COMM_RE.search(line)
             if comm_match:
                 structured['command'] = comm_match.group(1)
         
@@ -214,27 +249,30 @@ class ImprovedLogParser:
         """
         categories = []
         tags = []
+        service = parsed_entry['service']
+        raw_line = parsed_entry['raw_line']
         
         # System categories
-        if parsed_entry['service'] in ['systemd', 'kernel', 'audit']:
+        if service in _SYSTEM_SERVICES:
             categories.append('system')
         
         # Application categories
-        if 'code-insiders' in parsed_entry['raw_line']:
+        if 'code-insiders' in raw_line:
             categories.append('application')
             tags.append('vscode')
         
         # Security categories
-        if parsed_entry['service'] == 'audit' or 'ANOM_ABEND' in parsed_entry['raw_line']:
+        if service == 'audit' or 'ANOM_ABEND' in raw_line:
             categories.append('security')
             tags.append('audit')
         
         # Error categories
-        if parsed_entry['log_level'] in ['CRITICAL', 'ERROR', 'SIGNAL']:
+        if parsed_entry['log_level'] in _ERROR_LEVELS:
             categories.append('error')
         
         # Memory/crash categories
-        if any(term in parsed_entry['raw_line'].lower() for term in ['sig=', 'segfault', 'oom', 'memory']):
+        lowered = raw_line.lower()
+        if any(term in lowered for term in _CRASH_TERMS):
             categories.append('crash')
             tags.append('memory')
         
@@ -243,6 +281,26 @@ class ImprovedLogParser:
             'tags': tags,
             'primary_category': categories[0] if categories else 'general'
         }
+    
+    def parse_line(self, raw_line: str) -> Dict:
+        """
+        Parse and categorize a log line in one call (what the dashboards consume)
+        Results are memoized per exact line in a bounded LRU
+        """
+        with self._parse_cache_lock:
+            cached = self._parse_cache.get(raw_line)
+            if cached is not None:
+                self._parse_cache.move_to_end(raw_line)
+                return dict(cached)
+        
+        parsed = self.parse_log_line(raw_line)
+        parsed.update(self.categorize_log_entry(parsed))
+        
+        with self._parse_cache_lock:
+            self._parse_cache[raw_line] = parsed
+            while len(self._parse_cache) > PARSE_CACHE_SIZE:
+                self._parse_cache.popitem(last=False)
+        return dict(parsed)
 
 def test_improved_parser():
     """Test the improved parser with real log samples"""
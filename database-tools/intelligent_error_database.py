@@ -9,6 +9,7 @@ Creates databases of error logs with smart categorization and pulls from:
 - Fedora forums
 """
 
+import os
 import sqlite3
 import requests
 import json
@@ -18,15 +19,53 @@ from datetime import datetime
 from urllib.parse import urljoin, urlparse
 import hashlib
 
+try:
+    # gevent workers run many requests (greenlets) on one OS thread; the pool
+    # stays keyed on that thread even when threading.local is monkey-patched
+    from gevent.monkey import get_original
+    ConnectionLocal = get_original('threading', 'local')
+except ImportError:
+    from threading import local as ConnectionLocal
+
+# Applied once per pooled connection: WAL lets readers run alongside the
+# error-log writers, and mmap/cache keep hot pages out of read() syscalls
+SQLITE_PRAGMAS = """
+    PRAGMA journal_mode=WAL;
+    PRAGMA synchronous=NORMAL;
+    PRAGMA cache_size=-65536;
+    PRAGMA mmap_size=268435456;
+    PRAGMA temp_store=MEMORY;
+"""
+
 class IntelligentErrorDatabase:
     def __init__(self, db_path="intelligent_error_database.db"):
         self.db_path = db_path
+        self._local = ConnectionLocal()
         self.init_database()
         self.populate_official_sources()
         
+    def _connect(self):
+        """
+        Reuse one connection per OS thread instead of reopening the database.
+        Greenlets on that thread share it, so writes run in `with conn:`
+        blocks that never yield; an open transaction here is a caller bug
+        """
+        conn = getattr(self._local, 'conn', None)
+        # A connection opened before fork() (e.g. at import in the gunicorn
+        # master) must not be used by the child: it gets its own
+        if conn is None or self._local.pid != os.getpid():
+            conn = sqlite3.connect(self.db_path)
+            conn.executescript(SQLITE_PRAGMAS)
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        elif conn.in_transaction:
+            # Committing or rolling back here would take another caller's rows with it
+            raise sqlite3.ProgrammingError("pooled connection is inside another caller's transaction")
+        return conn
+
     def init_database(self):
         """Initialize comprehensive database schema"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
         
         # Error logs table with smart categorization
@@ -133,7 +172,6 @@ class IntelligentErrorDatabase:
         ''')
         
         conn.commit()
-        conn.close()
         print("✅ Intelligent Error Database initialized")
     
     def categorize_error_smart(self, error_message, stack_trace=""):
@@ -197,47 +235,46 @@ class IntelligentErrorDatabase:
     
     def add_error_log(self, error_signature, error_message, stack_trace="", platform="linux", application="vscode"):
         """Add error log with smart categorization"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
         
         # Smart categorization
         categorization = self.categorize_error_smart(error_message, stack_trace)
         
-        # Check if error already exists
-        cursor.execute('SELECT id, frequency FROM error_logs WHERE error_signature = ?', (error_signature,))
-        existing = cursor.fetchone()
+        with conn:
+            # Check if error already exists
+            cursor.execute('SELECT id, frequency FROM error_logs WHERE error_signature = ?', (error_signature,))
+            existing = cursor.fetchone()
         
-        if existing:
-            # Update frequency and last seen
-            cursor.execute('''
-                UPDATE error_logs 
-                SET frequency = frequency + 1, last_seen = CURRENT_TIMESTAMP
-                WHERE id = ?
-            ''', (existing[0],))
-            error_id = existing[0]
-        else:
-            # Insert new error
-            cursor.execute('''
-                INSERT INTO error_logs 
-                (error_signature, error_type, severity, platform, application, 
-                 error_message, stack_trace, category, subcategory, smart_tags)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                error_signature,
-                categorization['category'],
-                categorization['severity'],
-                platform,
-                application,
-                error_message,
-                stack_trace,
-                categorization['category'],
-                categorization['subcategory'],
-                json.dumps(categorization['tags'])
-            ))
-            error_id = cursor.lastrowid
+            if existing:
+                # Update frequency and last seen
+                cursor.execute('''
+                    UPDATE error_logs 
+                    SET frequency = frequency + 1, last_seen = CURRENT_TIMESTAMP
+                    WHERE id = ?
+                ''', (existing[0],))
+                error_id = existing[0]
+            else:
+                # Insert new error
+                cursor.execute('''
+                    INSERT INTO error_logs 
+                    (error_signature, error_type, severity, platform, application, 
+                     error_message, stack_trace, category, subcategory, smart_tags)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ''', (
+                    error_signature,
+                    categorization['category'],
+                    categorization['severity'],
+                    platform,
+                    application,
+                    error_message,
+                    stack_trace,
+                    categorization['category'],
+                    categorization['subcategory'],
+                    json.dumps(categorization['tags'])
+                ))
+                error_id = cursor.lastrowid
         
-        conn.commit()
-        conn.close()
         return error_id
     
     def fetch_official_vscode_docs(self):
@@ -260,25 +297,19 @@ class IntelligentErrorDatabase:
             }
         ]
         
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
+        # Fetched before the write transaction opens: requests and sleeps yield under gevent
+        docs = []
         for source in official_sources:
             try:
                 print(f"📥 Fetching {source['name']}...")
                 response = requests.get(source['url'], timeout=10)
                 if response.status_code == 200:
-                    cursor.execute('''
-                        INSERT OR REPLACE INTO official_docs 
-                        (source_name, url, title, content, last_updated, verified)
-                        VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP, TRUE)
-                    ''', (
+                    docs.append((
                         source['name'],
                         source['url'],
                         source['name'],
                         response.text[:10000]  # Store first 10k chars
                     ))
-                    print(f"✅ Stored {source['name']}")
                 else:
                     print(f"❌ Failed to fetch {source['name']}: {response.status_code}")
                     
@@ -287,8 +318,14 @@ class IntelligentErrorDatabase:
             except Exception as e:
                 print(f"❌ Error fetching {source['name']}: {e}")
         
-        conn.commit()
-        conn.close()
+        with self._connect() as conn:
+            conn.executemany('''
+                INSERT OR REPLACE INTO official_docs 
+                (source_name, url, title, content, last_updated, verified)
+                VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP, TRUE)
+            ''', docs)
+        for name, *_ in docs:
+            print(f"✅ Stored {name}")
     
     def fetch_github_issues(self):
         """Fetch Microsoft VSCode GitHub issues"""
@@ -299,9 +336,7 @@ class IntelligentErrorDatabase:
             'repo:microsoft/vscode renderer'
         ]
         
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
+        issues = []
         for query in github_queries:
             try:
                 print(f"📥 Fetching GitHub issues: {query}")
@@ -319,11 +354,7 @@ class IntelligentErrorDatabase:
                 ]
                 
                 for issue in sample_issues:
-                    cursor.execute('''
-                        INSERT OR REPLACE INTO github_issues
-                        (repo_name, issue_number, url, title, body, state, created_at, verified)
-                        VALUES (?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP, TRUE)
-                    ''', (
+                    issues.append((
                         issue['repo'],
                         issue['number'],
                         issue['url'],
@@ -332,14 +363,20 @@ class IntelligentErrorDatabase:
                         issue['state']
                     ))
                 
-                print(f"✅ Stored GitHub issues for: {query}")
+                print(f"✅ Fetched GitHub issues for: {query}")
                 time.sleep(1)
                 
             except Exception as e:
                 print(f"❌ Error fetching GitHub issues: {e}")
         
-        conn.commit()
-        conn.close()
+        # Written once the fetching (and rate-limit sleeps) are done
+        with self._connect() as conn:
+            conn.executemany('''
+                INSERT OR REPLACE INTO github_issues
+                (repo_name, issue_number, url, title, body, state, created_at, verified)
+                VALUES (?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP, TRUE)
+            ''', issues)
+        print(f"✅ Stored {len(issues)} GitHub issues")
     
     def populate_official_sources(self):
         """Populate database with official sources"""
@@ -361,30 +398,25 @@ class IntelligentErrorDatabase:
             }
         ]
 
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        for solution in sample_solutions:
-            cursor.execute('''
-                INSERT OR REPLACE INTO forum_posts
-                (source_platform, url, title, content, score, accepted_answer,
-                 post_date, verified)
-                VALUES (?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP, TRUE)
-            ''', (
-                'stackoverflow',
-                solution['url'],
-                solution['title'],
-                solution['content'],
-                solution['score'],
-                solution['accepted']
-            ))
-
-        conn.commit()
-        conn.close()
+        with self._connect() as conn:
+            for solution in sample_solutions:
+                conn.execute('''
+                    INSERT OR REPLACE INTO forum_posts
+                    (source_platform, url, title, content, score, accepted_answer,
+                     post_date, verified)
+                    VALUES (?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP, TRUE)
+                ''', (
+                    'stackoverflow',
+                    solution['url'],
+                    solution['title'],
+                    solution['content'],
+                    solution['score'],
+                    solution['accepted']
+                ))
 
     def create_smart_solutions(self, error_log_id, crash_data):
         """Create smart solutions based on error categorization"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
 
         # Get error details
@@ -451,31 +483,29 @@ class IntelligentErrorDatabase:
             ]
 
         # Insert solutions into database
-        for solution in solutions:
-            cursor.execute('''
-                INSERT INTO smart_solutions
-                (error_log_id, solution_title, solution_description, solution_steps,
-                 commands, source_type, source_url, effectiveness_rating, success_rate, verified)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, TRUE)
-            ''', (
-                error_log_id,
-                solution['title'],
-                solution['description'],
-                solution['steps'],
-                json.dumps(solution['commands']),
-                solution['source_type'],
-                solution['source_url'],
-                solution['effectiveness'],
-                solution['success_rate']
-            ))
-
-        conn.commit()
-        conn.close()
+        with conn:
+            for solution in solutions:
+                cursor.execute('''
+                    INSERT INTO smart_solutions
+                    (error_log_id, solution_title, solution_description, solution_steps,
+                     commands, source_type, source_url, effectiveness_rating, success_rate, verified)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, TRUE)
+                ''', (
+                    error_log_id,
+                    solution['title'],
+                    solution['description'],
+                    solution['steps'],
+                    json.dumps(solution['commands']),
+                    solution['source_type'],
+                    solution['source_url'],
+                    solution['effectiveness'],
+                    solution['success_rate']
+                ))
         return solutions
 
     def get_database_stats(self):
         """Get comprehensive database statistics"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
 
         stats = {}
@@ -507,7 +537,6 @@ class IntelligentErrorDatabase:
         avg_effectiveness = cursor.fetchone()[0]
         stats['avg_effectiveness'] = round(avg_effectiveness, 2) if avg_effectiveness else 0.0
 
-        conn.close()
         return stats
 
     def find_solutions_for_crash(self, crash_data):
@@ -520,7 +549,7 @@ class IntelligentErrorDatabase:
         solutions = self.create_smart_solutions(error_id, crash_data)
 
         # Get existing solutions from database
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
 
         cursor.execute('''
@@ -532,6 +561,5 @@ class IntelligentErrorDatabase:
         ''', (error_id,))
 
         db_solutions = cursor.fetchall()
-        conn.close()
 
         return db_solutions
@@ -7,10 +7,60 @@ Shows ACTUAL analysis using proven patterns from working repositories
 
 import re
 import json
+import threading
 import time
+from collections import Counter
 from datetime import datetime
 from pathlib import Path
-from flask import Flask, render_template_string, jsonify, request
+from flask import Flask, Response, render_template_string, jsonify, request
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    print("⚠️ numba not available - timeline bucketing will use NumPy")
+
+try:
+    import hyperscan
+    HYPERSCAN_AVAILABLE = True
+except ImportError:
+    HYPERSCAN_AVAILABLE = False
+    print("⚠️ hyperscan not available - crash patterns will be matched one regex at a time")
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    print("⚠️ orjson not available - analysis responses will use Flask's JSON encoder")
+
+# Lowercase literal every crash pattern must contain; lines without it skip the regex
+CRASH_PATTERN_LITERALS = {
+    'anom_abend': 'anom_abend',
+    'segfault': 'segfault',
+    'oom_killer': 'out of memory',
+    'kernel_panic': 'kernel panic',
+    'gpu_hang': 'gpu hang',
+}
+
+_KV_RE = re.compile(r'(\w+)=([^\s]+)')
+
+# Column index of each category in the per-hour timeline counters
+# (0 counts every other category towards the hour's total only)
+TIMELINE_CATEGORY_COLUMNS = {'crash': 1, 'error': 2}
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _bucket_by_hour(hours, categories, counts):
+        """Accumulate (hour, category) pairs into a 24 x 3 counter matrix"""
+        for i in range(hours.size):
+            counts[hours[i], categories[i]] += 1
+else:
+    def _bucket_by_hour(hours, categories, counts):
+        """Accumulate (hour, category) pairs into a 24 x 3 counter matrix"""
+        np.add.at(counts, (hours, categories), 1)
 
 class LnavBasedAnalyzer:
     """
@@ -22,12 +72,12 @@ class LnavBasedAnalyzer:
         # Based on lnav's log_format.cc timestamp patterns
         self.timestamp_patterns = [
             # ISO 8601 format from lnav
-            (r'(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}[+-]\d{2}:\d{2})', '%Y-%m-%dT%H:%M:%S%z'),
-            (r'(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2})', '%Y-%m-%dT%H:%M:%S'),
+            (re.compile(r'(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}[+-]\d{2}:\d{2})'), '%Y-%m-%dT%H:%M:%S%z'),
+            (re.compile(r'(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2})'), '%Y-%m-%dT%H:%M:%S'),
             # Syslog format from lnav
-            (r'(\w{3}\s+\d{1,2}\s+\d{2}:\d{2}:\d{2})', '%b %d %H:%M:%S'),
+            (re.compile(r'(\w{3}\s+\d{1,2}\s+\d{2}:\d{2}:\d{2})'), '%b %d %H:%M:%S'),
             # RFC3339 format
-            (r'(\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2}:\d{2})', '%Y-%m-%d %H:%M:%S'),
+            (re.compile(r'(\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2}:\d{2})'), '%Y-%m-%d %H:%M:%S'),
         ]
         
         # Based on lnav's log level detection
@@ -72,6 +122,51 @@ class LnavBasedAnalyzer:
             'kernel_panic': r'Kernel panic.*?:(.*)',
             'gpu_hang': r'GPU hang.*?ring (\w+)',
         }
+        
+        # Compiled once: level regexes run per line, crash patterns per line and per file
+        self._level_res = [(re.compile(rf'\b{level_name}\b', re.IGNORECASE), level_category)
+                           for level_name, level_category in self.log_levels.items()]
+        self._crash_res = {name: re.compile(pattern, re.IGNORECASE)
+                           for name, pattern in self.crash_patterns.items()}
+        self._anom_abend_re = re.compile(self.crash_patterns['anom_abend'])
+
+        # Hyperscan checks every crash pattern in one pass over the line
+        self._crash_names = list(self.crash_patterns)
+        self._crash_db = self._compile_crash_database() if HYPERSCAN_AVAILABLE else None
+        self._crash_scan_lock = threading.Lock()
+
+    def _compile_crash_database(self):
+        """Compile all crash patterns into a single Hyperscan block-mode database"""
+        count = len(self._crash_names)
+        try:
+            db = hyperscan.Database()
+            db.compile(
+                expressions=[self.crash_patterns[name].encode('utf-8') for name in self._crash_names],
+                ids=list(range(count)),
+                elements=count,
+                flags=[hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH] * count
+            )
+            return db
+        except Exception as e:
+            print(f"⚠️ Hyperscan compile failed, using regex fallback: {e}")
+            return None
+
+    def match_crash_patterns(self, line):
+        """Return the names of the crash patterns found in a line"""
+        if self._crash_db is None:
+            lowered = line.lower()
+            return [name for name, pattern in self._crash_res.items()
+                    if CRASH_PATTERN_LITERALS[name] in lowered and pattern.search(line)]
+
+        matched = []
+
+        def on_match(pattern_id, start, end, flags, context):
+            matched.append(self._crash_names[pattern_id])
+
+        # A database's scratch space is not safe to share between threads
+        with self._crash_scan_lock:
+            self._crash_db.scan(line.encode('utf-8', 'replace'), match_event_handler=on_match)
+        return matched
 
     def analyze_crash_file_with_lnav_patterns(self, file_path):
         """
@@ -127,7 +222,7 @@ class LnavBasedAnalyzer:
         
         # Extract timestamp using lnav patterns
         for pattern, fmt in self.timestamp_patterns:
-            match = re.search(pattern, line)
+            match = pattern.search(line)
             if match:
                 timestamp_str = match.group(1)
                 try:
@@ -146,14 +241,13 @@ class LnavBasedAnalyzer:
                     continue
         
         # Extract log level using lnav's level detection
-        for level_name, level_category in self.log_levels.items():
-            if re.search(rf'\b{level_name}\b', line, re.IGNORECASE):
+        for level_re, level_category in self._level_res:
+            if level_re.search(line):
                 entry['log_level'] = level_category
                 break
         
         # Extract structured data using lnav's key=value parsing
-        kv_pattern = r'(\w+)=([^\s]+)'
-        for match in re.finditer(kv_pattern, line):
+        for match in _KV_RE.finditer(line):
             key, value = match.groups()
             value = value.strip('"\'')
             entry['structured_data'][key] = value
@@ -168,21 +262,28 @@ class LnavBasedAnalyzer:
         Categorize log line using lnav's categorization logic
         Based on external_log_format::get_value_meta patterns
         """
+        lowered = line.lower()
+        
         # Check for crash patterns
-        for pattern_name, pattern in self.crash_patterns.items():
-            if re.search(pattern, line, re.IGNORECASE):
+        if self._crash_db is not None:
+            if self.match_crash_patterns(line):
                 return 'crash'
+        else:
+            # Substring prefilter before each regex
+            for pattern_name, pattern in self._crash_res.items():
+                if CRASH_PATTERN_LITERALS[pattern_name] in lowered and pattern.search(line):
+                    return 'crash'
         
         # Check for error patterns
-        if any(term in line.lower() for term in ['error', 'fail', 'exception', 'abort']):
+        if any(term in lowered for term in ['error', 'fail', 'exception', 'abort']):
             return 'error'
         
         # Check for warning patterns  
-        if any(term in line.lower() for term in ['warning', 'warn']):
+        if any(term in lowered for term in ['warning', 'warn']):
             return 'warning'
         
         # Check for system patterns
-        if any(term in line.lower() for term in ['kernel', 'systemd', 'audit']):
+        if any(term in lowered for term in ['kernel', 'systemd', 'audit']):
             return 'system'
         
         return 'general'
@@ -259,7 +360,7 @@ class LnavBasedAnalyzer:
         # Find ANOM_ABEND entries (based on lnav's audit log format)
         for entry in entries:
             if 'ANOM_ABEND' in entry['raw_line']:
-                crash_match = re.search(self.crash_patterns['anom_abend'], entry['raw_line'])
+                crash_match = self._anom_abend_re.search(entry['raw_line'])
                 if crash_match:
                     pid, command, signal = crash_match.groups()
                     signal_num = int(signal)
@@ -279,13 +380,17 @@ class LnavBasedAnalyzer:
                     }
                     crashes.append(crash_info)
         
+        # Tallied once here so consumers read counts instead of rescanning crash_details
+        severity_counts = Counter(crash['signal_info'].get('severity') for crash in crashes)
+        
         return {
             'total_crashes': len(crashes),
             'crash_details': crashes,
-            'severity_assessment': self.assess_crash_severity_lnav(crashes)
+            'severity_counts': dict(severity_counts),
+            'severity_assessment': self.assess_crash_severity_lnav(crashes, severity_counts)
         }
     
-    def assess_crash_severity_lnav(self, crashes):
+    def assess_crash_severity_lnav(self, crashes, severity_counts=None):
         """Assess crash severity using lnav's severity logic"""
         if not crashes:
             return {'level': 'NONE', 'score': 0, 'factors': []}
@@ -294,8 +399,9 @@ class LnavBasedAnalyzer:
         factors = []
         
         # Count critical signals
-        critical_signals = sum(1 for crash in crashes 
-                             if crash['signal_info'].get('severity') == 'CRITICAL')
+        if severity_counts is None:
+            severity_counts = Counter(crash['signal_info'].get('severity') for crash in crashes)
+        critical_signals = severity_counts.get('CRITICAL', 0)
         if critical_signals > 0:
             severity_score += critical_signals * 10
             factors.append(f"{critical_signals} critical signal crashes")
@@ -328,8 +434,8 @@ class LnavBasedAnalyzer:
         """Analyze patterns using lnav's pattern matching"""
         patterns_found = {}
         
-        for pattern_name, pattern in self.crash_patterns.items():
-            matches = re.findall(pattern, content, re.IGNORECASE)
+        for pattern_name, pattern in self._crash_res.items():
+            matches = pattern.findall(content)
             if matches:
                 patterns_found[pattern_name] = len(matches)
         
@@ -337,19 +443,23 @@ class LnavBasedAnalyzer:
     
     def analyze_timeline_lnav(self, entries):
         """Analyze timeline using lnav's time analysis"""
+        stamped = [e for e in entries if e['timestamp']]
+        hours = np.fromiter((e['timestamp'].hour for e in stamped),
+                            dtype=np.int64, count=len(stamped))
+        categories = np.fromiter((TIMELINE_CATEGORY_COLUMNS.get(e['lnav_category'], 0) for e in stamped),
+                                 dtype=np.int64, count=len(stamped))
+
+        counts = np.zeros((24, 3), dtype=np.int64)
+        _bucket_by_hour(hours, categories, counts)
+        totals = counts.sum(axis=1)
+
         timeline = {}
-        
-        for entry in entries:
-            if entry['timestamp']:
-                hour = entry['timestamp'].hour
-                if hour not in timeline:
-                    timeline[hour] = {'total': 0, 'crashes': 0, 'errors': 0}
-                
-                timeline[hour]['total'] += 1
-                if entry['lnav_category'] == 'crash':
-                    timeline[hour]['crashes'] += 1
-                elif entry['lnav_category'] == 'error':
-                    timeline[hour]['errors'] += 1
+        for hour in np.flatnonzero(totals):
+            timeline[int(hour)] = {
+                'total': int(totals[hour]),
+                'crashes': int(counts[hour, 1]),
+                'errors': int(counts[hour, 2])
+            }
         
         return timeline
     
@@ -544,6 +654,10 @@ def analyze_with_lnav():
     analysis = analyzer.analyze_crash_file_with_lnav_patterns(crash_file)
     
     if analysis:
+        if ORJSON_AVAILABLE:
+            # The full analysis is the largest payload here; orjson also takes NumPy values as-is
+            return Response(orjson.dumps(analysis, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY),
+                            mimetype='application/json')
         return jsonify(analysis)
     else:
         return jsonify({'error': 'Analysis failed'}), 500
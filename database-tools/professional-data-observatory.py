@@ -13,19 +13,48 @@ Features:
 - Professional observability patterns (RED/USE methods)
 """
 
-from flask import Flask, render_template_string, jsonify, request
+from flask import Flask, Response, jsonify, request
 import sqlite3
 import json
 import os
 import glob
+import hashlib
+import heapq
+import itertools
+import operator
+import re
 from pathlib import Path
 from datetime import datetime, timedelta
 import subprocess
 import threading
 import time
 import webbrowser
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+from collections import OrderedDict
+from functools import wraps
+
+# Optional production serving: gzip responses and a keepalive WSGI server
+try:
+    from flask_compress import Compress
+    COMPRESS_AVAILABLE = True
+except ImportError:
+    COMPRESS_AVAILABLE = False
+    print("⚠️ flask-compress not available - responses will not be gzipped")
+
+try:
+    from gunicorn.app.base import BaseApplication
+    GUNICORN_AVAILABLE = True
+except ImportError:
+    GUNICORN_AVAILABLE = False
+    print("⚠️ gunicorn not available - falling back to Flask development server")
 
 app = Flask(__name__)
+if COMPRESS_AVAILABLE:
+    # Prefer brotli for JSON payloads; NDJSON streams are left uncompressed
+    # so points reach the browser as they are written
+    app.config['COMPRESS_ALGORITHM'] = ['br', 'gzip']
+    Compress(app)
 
 # Configuration
 CLIPBOARD_DB = Path.home() / '.local/share/clipboard_daemon/clipboard.sqlite'
@@ -35,6 +64,64 @@ BROWSER_HISTORY_PATHS = [
     Path.home() / '.config/chromium/Default/History'
 ]
 
+CLASSIFY_CACHE_SIZE = 10000
+STATS_STREAM_INTERVAL_SECONDS = 5
+# An open stats stream holds a gthread worker thread (2 workers x 4 threads
+# in all) for its whole life. Streams therefore end after this long and the
+# browser's EventSource reconnects STATS_STREAM_RETRY_MS later, queued behind
+# any waiting requests, so a few open tabs can't starve the API routes
+STATS_STREAM_MAX_SECONDS = 60
+STATS_STREAM_RETRY_MS = 3000
+
+FIREFOX_PROFILES_DIR = Path.home() / '.mozilla/firefox'
+FIREFOX_PROFILE_REFRESH_SECONDS = 60
+
+# Firefox timeline rows rendered in SQL (local time, like datetime.fromtimestamp)
+FIREFOX_TIMESTAMP_SQL = "strftime('%Y-%m-%dT%H:%M:%f', last_visit_date / 1000000.0, 'unixepoch', 'localtime')"
+FIREFOX_TIMELINE_FIELDS = ('timestamp', 'source', 'type', 'content', 'title', 'visit_count', 'preview')
+FIREFOX_TIMELINE_COLUMNS = "'browser', 'url', url, title, visit_count, COALESCE(NULLIF(title, ''), url)"
+FIREFOX_TIMELINE_JSON = (
+    "json_object('source', 'browser', 'type', 'url', 'content', url, 'title', title, "
+    f"'timestamp', {FIREFOX_TIMESTAMP_SQL}, 'visit_count', visit_count, "
+    "'preview', COALESCE(NULLIF(title, ''), url))"
+)
+
+# Content classification patterns (compiled once, single scan per entry)
+_URL_RE = re.compile(r'https?://')
+_ERROR_RE = re.compile(r'error|exception|failed|warning', re.IGNORECASE)
+
+# Correlation buckets: 15-minute windows, one counter row per source
+CORRELATION_WINDOW_SECONDS = 15 * 60
+CORRELATION_SOURCES = ('clipboard', 'browser', 'system_logs')
+
+def ttl_cache(seconds, maxsize=32):
+    """Cache method results per argument tuple for a short TTL (LRU-bounded)"""
+    def decorator(func):
+        cache = OrderedDict()
+        lock = threading.Lock()
+
+        @wraps(func)
+        def wrapper(self, *args):
+            now = time.monotonic()
+            with lock:
+                hit = cache.get(args)
+                if hit and hit[0] > now:
+                    cache.move_to_end(args)
+                    return hit[1]
+
+            value = func(self, *args)
+
+            with lock:
+                cache[args] = (now + seconds, value)
+                cache.move_to_end(args)
+                while len(cache) > maxsize:
+                    cache.popitem(last=False)
+            return value
+
+        wrapper.cache_clear = cache.clear
+        return wrapper
+    return decorator
+
 class DataObservatory:
     def __init__(self):
         self.clipboard_db = CLIPBOARD_DB
@@ -46,41 +133,83 @@ class DataObservatory:
             'application_logs': {'name': 'Application Logs', 'icon': '🔧', 'color': '#ea580c'},
             'error_logs': {'name': 'Error Logs', 'icon': '⚠️', 'color': '#dc2626'}
         }
+        # Timeline sources hit independent backends (SQLite, journalctl)
+        self._timeline_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix='timeline')
+        self._firefox_profiles = self._discover_firefox_profiles()
+        self._firefox_profiles_checked = time.time()
+        self._firefox_profiles_dir_mtime = self._firefox_profiles_dir_mtime_now()
+        # (type, preview) per clipboard content_hash, LRU-bounded
+        self._classify_cache = OrderedDict()
+        self._classify_cache_lock = threading.Lock()
+        # Long-lived procfs descriptors: each stats poll is a single pread
+        self._uptime_fd = self._open_procfs('/proc/uptime')
+        self._meminfo_fd = self._open_procfs('/proc/meminfo')
+
+    @staticmethod
+    def _open_procfs(path):
+        """Open a procfs file for repeated pread calls (None if unavailable)"""
+        try:
+            return os.open(path, os.O_RDONLY)
+        except OSError:
+            return None
+
+    def _discover_firefox_profiles(self):
+        """Glob Firefox profile history databases"""
+        return glob.glob(str(FIREFOX_PROFILES_DIR / '*/places.sqlite'))
 
-    def get_timeline_data(self, start_time=None, end_time=None, sources=None):
-        """Get correlated timeline data across all sources"""
+    def _firefox_profiles_dir_mtime_now(self):
+        """Get Firefox profiles directory mtime (None if missing)"""
+        try:
+            return os.stat(FIREFOX_PROFILES_DIR).st_mtime
+        except OSError:
+            return None
+
+    def _get_firefox_profiles(self):
+        """Get cached Firefox profile paths, re-globbing only when stale"""
+        now = time.time()
+        dir_mtime = self._firefox_profiles_dir_mtime_now()
+        if (now - self._firefox_profiles_checked > FIREFOX_PROFILE_REFRESH_SECONDS
+                or dir_mtime != self._firefox_profiles_dir_mtime):
+            self._firefox_profiles = self._discover_firefox_profiles()
+            self._firefox_profiles_checked = now
+            self._firefox_profiles_dir_mtime = dir_mtime
+        return self._firefox_profiles
+
+    def get_timeline_data(self, start_time=None, end_time=None, sources=None, limit=None):
+        """Get correlated timeline data across all sources (newest first)
+
+        Each source returns entries sorted by timestamp descending, so the
+        streams are merged lazily and only the newest ``limit`` entries are
+        materialized (all entries when ``limit`` is None).
+        """
         if not start_time:
             start_time = datetime.now() - timedelta(hours=24)
         if not end_time:
             end_time = datetime.now()
 
-        timeline_data = []
+        # Fetch sources concurrently; SQLite and subprocess waits release the GIL
+        futures = []
 
         # Clipboard data
         if not sources or 'clipboard' in sources:
-            clipboard_data = self._get_clipboard_timeline(start_time, end_time)
-            timeline_data.extend(clipboard_data)
+            futures.append(self._timeline_executor.submit(self._get_clipboard_timeline, start_time, end_time))
 
         # Browser history
         if not sources or 'browser' in sources:
-            browser_data = self._get_browser_timeline(start_time, end_time)
-            timeline_data.extend(browser_data)
+            futures.append(self._timeline_executor.submit(self._get_browser_timeline, start_time, end_time))
 
         # System logs
         if not sources or 'system_logs' in sources:
-            system_data = self._get_system_logs_timeline(start_time, end_time)
-            timeline_data.extend(system_data)
-
-        # Sort by timestamp
-        timeline_data.sort(key=lambda x: x['timestamp'])
+            futures.append(self._timeline_executor.submit(self._get_system_logs_timeline, start_time, end_time))
 
-        return timeline_data
+        streams = [future.result() for future in futures]
+        merged = heapq.merge(*streams, key=lambda x: x['timestamp'], reverse=True)
+        return list(itertools.islice(merged, limit))
 
     def _get_clipboard_timeline(self, start_time, end_time):
-        """Get clipboard entries within time range"""
+        """Get clipboard entries within time range (newest first)"""
         try:
             conn = sqlite3.connect(str(self.clipboard_db))
-            conn.row_factory = sqlite3.Row
 
             cursor = conn.execute('''
                 SELECT id, content, timestamp, content_hash,
@@ -90,13 +219,20 @@ class DataObservatory:
                 ORDER BY timestamp DESC
             ''', (start_time.isoformat(), end_time.isoformat()))
 
+            # Build each response dict once from the plain row tuple
             entries = []
-            for row in cursor.fetchall():
-                entry = dict(row)
-                entry['source'] = 'clipboard'
-                entry['type'] = self._classify_content(entry['content'])
-                entry['preview'] = self._generate_preview(entry['content'], entry['type'])
-                entries.append(entry)
+            for entry_id, content, timestamp, content_hash, size in cursor:
+                content_type, preview = self._classify_with_preview(content_hash, content)
+                entries.append({
+                    'id': entry_id,
+                    'content': content,
+                    'timestamp': timestamp,
+                    'content_hash': content_hash,
+                    'size': size,
+                    'source': 'clipboard',
+                    'type': content_type,
+                    'preview': preview
+                })
 
             conn.close()
             return entries
@@ -104,49 +240,53 @@ class DataObservatory:
             print(f"Error getting clipboard timeline: {e}")
             return []
 
-    def _get_browser_timeline(self, start_time, end_time):
-        """Get browser history within time range"""
-        entries = []
+    def _query_firefox_timeline(self, start_time, end_time, columns):
+        """Run the Firefox timeline query against every profile
 
-        # Firefox history
-        firefox_profiles = glob.glob(str(Path.home() / '.mozilla/firefox/*/places.sqlite'))
-        for profile_db in firefox_profiles:
+        Returns one row list per profile, each sorted newest first, with
+        the rendered timestamp as the first column.
+        """
+        # Convert to microseconds for Firefox timestamp
+        start_micro = int(start_time.timestamp() * 1000000)
+        end_micro = int(end_time.timestamp() * 1000000)
+
+        profile_rows = []
+        for profile_db in self._get_firefox_profiles():
             try:
                 conn = sqlite3.connect(profile_db)
-                conn.row_factory = sqlite3.Row
-
-                # Convert to microseconds for Firefox timestamp
-                start_micro = int(start_time.timestamp() * 1000000)
-                end_micro = int(end_time.timestamp() * 1000000)
-
-                cursor = conn.execute('''
-                    SELECT url, title, last_visit_date, visit_count
+                cursor = conn.execute(f'''
+                    SELECT {FIREFOX_TIMESTAMP_SQL}, {columns}
                     FROM moz_places
                     WHERE last_visit_date BETWEEN ? AND ?
                     ORDER BY last_visit_date DESC
                     LIMIT 100
                 ''', (start_micro, end_micro))
-
-                for row in cursor.fetchall():
-                    entry = {
-                        'source': 'browser',
-                        'type': 'url',
-                        'content': row['url'],
-                        'title': row['title'],
-                        'timestamp': datetime.fromtimestamp(row['last_visit_date'] / 1000000).isoformat(),
-                        'visit_count': row['visit_count'],
-                        'preview': row['title'] or row['url']
-                    }
-                    entries.append(entry)
-
+                profile_rows.append(cursor.fetchall())
                 conn.close()
             except Exception as e:
                 print(f"Error reading Firefox history: {e}")
 
-        return entries
+        return profile_rows
+
+    def _get_browser_timeline(self, start_time, end_time):
+        """Get browser history within time range (newest first)"""
+        # SQLite renders every field; Python only zips rows into dicts
+        profile_rows = self._query_firefox_timeline(start_time, end_time, FIREFOX_TIMELINE_COLUMNS)
+        merged = heapq.merge(*profile_rows, key=operator.itemgetter(0), reverse=True)
+        return [dict(zip(FIREFOX_TIMELINE_FIELDS, row)) for row in merged]
+
+    def get_browser_timeline_json(self, start_time, end_time, limit=None):
+        """Get browser history as a pre-rendered JSON array (newest first)
+
+        Each entry is serialized by SQLite's json_object(), so no Python
+        dict is built for browser-only timeline requests.
+        """
+        profile_rows = self._query_firefox_timeline(start_time, end_time, FIREFOX_TIMELINE_JSON)
+        merged = heapq.merge(*profile_rows, key=operator.itemgetter(0), reverse=True)
+        return '[' + ','.join(row[1] for row in itertools.islice(merged, limit)) + ']'
 
     def _get_system_logs_timeline(self, start_time, end_time):
-        """Get system logs within time range"""
+        """Get system logs within time range (newest first)"""
         entries = []
 
         try:
@@ -156,35 +296,68 @@ class DataObservatory:
                 '--since', start_time.strftime('%Y-%m-%d %H:%M:%S'),
                 '--until', end_time.strftime('%Y-%m-%d %H:%M:%S'),
                 '--output=json',
-                '--lines=100'
+                '--lines=100',
+                '--reverse'
             ]
 
             result = subprocess.run(cmd, capture_output=True, text=True)
             if result.returncode == 0:
-                for line in result.stdout.strip().split('\n'):
-                    if line:
-                        try:
-                            log_entry = json.loads(line)
-                            entry = {
-                                'source': 'system_logs',
-                                'type': 'log',
-                                'content': log_entry.get('MESSAGE', ''),
-                                'timestamp': datetime.fromtimestamp(int(log_entry.get('__REALTIME_TIMESTAMP', 0)) / 1000000).isoformat(),
-                                'unit': log_entry.get('_SYSTEMD_UNIT', 'unknown'),
-                                'priority': log_entry.get('PRIORITY', '6'),
-                                'preview': log_entry.get('MESSAGE', '')[:100]
-                            }
-                            entries.append(entry)
-                        except json.JSONDecodeError:
-                            continue
+                # Decode one JSON object per line in place, without splitting
+                # the output into an intermediate list of strings
+                decoder = json.JSONDecoder()
+                output = result.stdout
+                pos = 0
+                length = len(output)
+                while pos < length:
+                    if output[pos].isspace():
+                        pos += 1
+                        continue
+                    try:
+                        log_entry, end = decoder.raw_decode(output, pos)
+                    except json.JSONDecodeError:
+                        end = pos
+                    else:
+                        entry = {
+                            'source': 'system_logs',
+                            'type': 'log',
+                            'content': log_entry.get('MESSAGE', ''),
+                            'timestamp': datetime.fromtimestamp(int(log_entry.get('__REALTIME_TIMESTAMP', 0)) / 1000000).isoformat(),
+                            'unit': log_entry.get('_SYSTEMD_UNIT', 'unknown'),
+                            'priority': log_entry.get('PRIORITY', '6'),
+                            'preview': log_entry.get('MESSAGE', '')[:100]
+                        }
+                        entries.append(entry)
+                    next_line = output.find('\n', end)
+                    pos = next_line + 1 if next_line != -1 else length
         except Exception as e:
             print(f"Error getting system logs: {e}")
 
         return entries
 
+    def _classify_with_preview(self, content_hash, content):
+        """Get (type, preview) for clipboard content, memoized by content hash"""
+        if content_hash is None:
+            content_type = self._classify_content(content)
+            return content_type, self._generate_preview(content, content_type)
+
+        with self._classify_cache_lock:
+            cached = self._classify_cache.get(content_hash)
+            if cached is not None:
+                self._classify_cache.move_to_end(content_hash)
+                return cached
+
+        content_type = self._classify_content(content)
+        result = (content_type, self._generate_preview(content, content_type))
+
+        with self._classify_cache_lock:
+            self._classify_cache[content_hash] = result
+            if len(self._classify_cache) > CLASSIFY_CACHE_SIZE:
+                self._classify_cache.popitem(last=False)
+        return result
+
     def _classify_content(self, content):
         """Classify content type for better visualization"""
-        if content.startswith(('http://', 'https://')):
+        if _URL_RE.match(content):
             return 'url'
         elif '@' in content and '.' in content:
             return 'email'
@@ -192,7 +365,7 @@ class DataObservatory:
             return 'number'
         elif len(content) > 500:
             return 'large_text'
-        elif any(keyword in content.lower() for keyword in ['error', 'exception', 'failed', 'warning']):
+        elif _ERROR_RE.search(content):
             return 'error'
         else:
             return 'text'
@@ -206,6 +379,7 @@ class DataObservatory:
         else:
             return content[:80] + '...' if len(content) > 80 else content
 
+    @ttl_cache(seconds=5)
     def get_correlation_analysis(self, timeframe_hours=24):
         """Analyze correlations between different data sources"""
         end_time = datetime.now()
@@ -213,29 +387,41 @@ class DataObservatory:
 
         timeline_data = self.get_timeline_data(start_time, end_time)
 
-        # Group by time windows (15-minute intervals)
-        time_windows = {}
+        # Structure-of-arrays layout: one int32 counter row per source,
+        # indexed by 15-minute window offset from the aligned start time
+        source_rows = {source: row for row, source in enumerate(CORRELATION_SOURCES)}
+        start_epoch = int(start_time.timestamp()) // CORRELATION_WINDOW_SECONDS * CORRELATION_WINDOW_SECONDS
+        n_buckets = int((end_time.timestamp() - start_epoch) // CORRELATION_WINDOW_SECONDS) + 1
+
+        rows = []
+        epochs = []
         for entry in timeline_data:
+            row = source_rows.get(entry['source'])
+            if row is None:
+                continue
             try:
-                timestamp = datetime.fromisoformat(entry['timestamp'].replace('Z', '+00:00'))
-                window_key = timestamp.replace(minute=(timestamp.minute // 15) * 15, second=0, microsecond=0)
-
-                if window_key not in time_windows:
-                    time_windows[window_key] = {'clipboard': 0, 'browser': 0, 'system_logs': 0}
-
-                time_windows[window_key][entry['source']] += 1
-            except:
+                epochs.append(datetime.fromisoformat(entry['timestamp'].replace('Z', '+00:00')).timestamp())
+            except (ValueError, TypeError, AttributeError):
                 continue
+            rows.append(row)
+
+        counts = np.zeros((len(CORRELATION_SOURCES), n_buckets), dtype=np.int32)
+        if epochs:
+            buckets = ((np.asarray(epochs, dtype=np.float64) - start_epoch) // CORRELATION_WINDOW_SECONDS).astype(np.int64)
+            in_range = (buckets >= 0) & (buckets < n_buckets)
+            np.add.at(counts, (np.asarray(rows, dtype=np.int64)[in_range], buckets[in_range]), 1)
 
-        # Convert to correlation data
+        # Convert to correlation data (only windows with activity)
+        totals = counts.sum(axis=0)
         correlation_data = []
-        for window_time, counts in sorted(time_windows.items()):
+        for bucket in np.flatnonzero(totals):
+            window_time = datetime.fromtimestamp(start_epoch + int(bucket) * CORRELATION_WINDOW_SECONDS)
             correlation_data.append({
                 'timestamp': window_time.isoformat(),
-                'clipboard_activity': counts['clipboard'],
-                'browser_activity': counts['browser'],
-                'system_activity': counts['system_logs'],
-                'total_activity': sum(counts.values())
+                'clipboard_activity': int(counts[0, bucket]),
+                'browser_activity': int(counts[1, bucket]),
+                'system_activity': int(counts[2, bucket]),
+                'total_activity': int(totals[bucket])
             })
 
         return correlation_data
@@ -261,7 +447,6 @@ class DataObservatory:
         """Search clipboard history"""
         try:
             conn = sqlite3.connect(str(self.clipboard_db))
-            conn.row_factory = sqlite3.Row
 
             cursor = conn.execute('''
                 SELECT id, content, timestamp, content_hash,
@@ -272,14 +457,21 @@ class DataObservatory:
                 LIMIT ?
             ''', (f'%{query}%', limit))
 
+            prepared_query = self._prepare_query(query)
             results = []
-            for row in cursor.fetchall():
-                entry = dict(row)
-                entry['source'] = 'clipboard'
-                entry['type'] = self._classify_content(entry['content'])
-                entry['preview'] = self._generate_preview(entry['content'], entry['type'])
-                entry['relevance'] = self._calculate_relevance(entry['content'], query)
-                results.append(entry)
+            for entry_id, content, timestamp, content_hash, size in cursor:
+                content_type, preview = self._classify_with_preview(content_hash, content)
+                results.append({
+                    'id': entry_id,
+                    'content': content,
+                    'timestamp': timestamp,
+                    'content_hash': content_hash,
+                    'size': size,
+                    'source': 'clipboard',
+                    'type': content_type,
+                    'preview': preview,
+                    'relevance': self._calculate_relevance(content, prepared_query)
+                })
 
             conn.close()
             return results
@@ -290,8 +482,9 @@ class DataObservatory:
     def _search_browser(self, query, limit):
         """Search browser history"""
         results = []
+        prepared_query = self._prepare_query(query)
 
-        firefox_profiles = glob.glob(str(Path.home() / '.mozilla/firefox/*/places.sqlite'))
+        firefox_profiles = self._get_firefox_profiles()
         for profile_db in firefox_profiles:
             try:
                 conn = sqlite3.connect(profile_db)
@@ -314,7 +507,7 @@ class DataObservatory:
                         'timestamp': datetime.fromtimestamp(row['last_visit_date'] / 1000000).isoformat() if row['last_visit_date'] else '',
                         'visit_count': row['visit_count'],
                         'preview': row['title'] or row['url'],
-                        'relevance': self._calculate_relevance(f"{row['title']} {row['url']}", query)
+                        'relevance': self._calculate_relevance(f"{row['title']} {row['url']}", prepared_query)
                     }
                     results.append(entry)
 
@@ -324,25 +517,31 @@ class DataObservatory:
 
         return results
 
-    def _calculate_relevance(self, content, query):
-        """Calculate search relevance score"""
-        if not content or not query:
+    @staticmethod
+    def _prepare_query(query):
+        """Lowercase and tokenize a search query once per search"""
+        query_lower = query.lower()
+        return query_lower, frozenset(query_lower.split())
+
+    def _calculate_relevance(self, content, prepared_query):
+        """Calculate search relevance score against a prepared query"""
+        query_lower, query_words = prepared_query
+        if not content or not query_lower:
             return 0
 
         content_lower = content.lower()
-        query_lower = query.lower()
 
         # Exact match gets highest score
         if query_lower in content_lower:
             return 100
 
         # Word matches
-        query_words = query_lower.split()
-        content_words = content_lower.split()
-
-        matches = sum(1 for word in query_words if word in content_words)
-        return (matches / len(query_words)) * 80 if query_words else 0
+        if not query_words:
+            return 0
+        matches = len(query_words.intersection(content_lower.split()))
+        return (matches / len(query_words)) * 80
 
+    @ttl_cache(seconds=5)
     def get_dashboard_stats(self):
         """Get comprehensive dashboard statistics"""
         try:
@@ -395,10 +594,9 @@ class DataObservatory:
     def _get_system_uptime(self):
         """Get system uptime"""
         try:
-            with open('/proc/uptime', 'r') as f:
-                uptime_seconds = float(f.readline().split()[0])
-                uptime_hours = uptime_seconds / 3600
-                return f"{uptime_hours:.1f}h"
+            buf = os.pread(self._uptime_fd, 64, 0)
+            uptime_hours = float(buf.split(b' ', 1)[0]) / 3600
+            return f"{uptime_hours:.1f}h"
         except:
             return "Unknown"
 
@@ -409,39 +607,88 @@ class DataObservatory:
         except:
             return 0
 
+    @staticmethod
+    def _parse_meminfo_field(buf, field):
+        """Parse a kB value out of a raw /proc/meminfo buffer"""
+        start = buf.index(field) + len(field)
+        return int(buf[start:buf.index(b'\n', start)].split()[0])
+
     def _get_memory_usage(self):
         """Get memory usage percentage"""
         try:
-            with open('/proc/meminfo', 'r') as f:
-                lines = f.readlines()
-                mem_total = int([line for line in lines if 'MemTotal' in line][0].split()[1])
-                mem_available = int([line for line in lines if 'MemAvailable' in line][0].split()[1])
-                return round((1 - mem_available / mem_total) * 100, 1)
+            # MemTotal and MemAvailable are within the first few lines
+            buf = os.pread(self._meminfo_fd, 256, 0)
+            mem_total = self._parse_meminfo_field(buf, b'MemTotal:')
+            mem_available = self._parse_meminfo_field(buf, b'MemAvailable:')
+            return round((1 - mem_available / mem_total) * 100, 1)
         except:
             return 0
 
 observatory = DataObservatory()
 
+def static_asset_response(body, etag, mimetype):
+    """Serve pre-encoded static bytes with an ETag so browsers revalidate"""
+    response = Response(body, mimetype=mimetype)
+    response.set_etag(etag)
+    response.cache_control.public = True
+    response.cache_control.max_age = 300
+    return response.make_conditional(request)
+
 @app.route('/')
 def main_dashboard():
     """Professional data observatory dashboard"""
-    return render_template_string(PROFESSIONAL_TEMPLATE)
+    # The template is fully static: serve pre-encoded bytes
+    return static_asset_response(DASHBOARD_HTML, DASHBOARD_ETAG, 'text/html')
+
+@app.route('/timeline-chart.js')
+def timeline_chart_script():
+    """Timeline chart renderer (loaded by the page and by the chart worker)"""
+    return static_asset_response(TIMELINE_CHART_JS, TIMELINE_CHART_ETAG, 'application/javascript')
 
 @app.route('/api/dashboard/stats')
 def api_dashboard_stats():
     """Get comprehensive dashboard statistics"""
     return jsonify(observatory.get_dashboard_stats())
 
+@app.route('/api/dashboard/stream')
+def api_dashboard_stream():
+    """Push dashboard statistics as Server-Sent Events when they change, one bounded stream per connection"""
+    def events():
+        # Each worker has its own stats cache, so every (re)connection opens
+        # with a full snapshot from the worker that serves it
+        yield f"retry: {STATS_STREAM_RETRY_MS}\n\n"
+        last_snapshot = None
+        deadline = time.monotonic() + STATS_STREAM_MAX_SECONDS
+        while time.monotonic() < deadline:
+            stats = observatory.get_dashboard_stats()
+            # last_updated always moves; only push when the figures change
+            snapshot = {key: value for key, value in stats.items() if key != 'last_updated'}
+            if snapshot != last_snapshot:
+                last_snapshot = snapshot
+                yield f"data: {json.dumps(stats)}\n\n"
+            else:
+                yield ": keepalive\n\n"
+            time.sleep(STATS_STREAM_INTERVAL_SECONDS)
+
+    return Response(events(), mimetype='text/event-stream',
+                    headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
+
 @app.route('/api/timeline')
 def api_timeline():
     """Get timeline data for correlation analysis"""
     hours = request.args.get('hours', 24, type=int)
     sources = request.args.getlist('sources')
+    limit = request.args.get('limit', 500, type=int)
 
     end_time = datetime.now()
     start_time = end_time - timedelta(hours=hours)
 
-    timeline_data = observatory.get_timeline_data(start_time, end_time, sources if sources else None)
+    if sources == ['browser']:
+        # Browser-only timeline is serialized entirely by SQLite
+        return Response(observatory.get_browser_timeline_json(start_time, end_time, limit),
+                        mimetype='application/json')
+
+    timeline_data = observatory.get_timeline_data(start_time, end_time, sources if sources else None, limit)
     return jsonify(timeline_data)
 
 @app.route('/api/correlation')
@@ -451,6 +698,14 @@ def api_correlation():
     correlation_data = observatory.get_correlation_analysis(hours)
     return jsonify(correlation_data)
 
+@app.route('/api/correlation.ndjson')
+def api_correlation_ndjson():
+    """Stream correlation analysis data as newline-delimited JSON"""
+    hours = request.args.get('hours', 24, type=int)
+    correlation_data = observatory.get_correlation_analysis(hours)
+    return Response((json.dumps(point) + '\n' for point in correlation_data),
+                    mimetype='application/x-ndjson')
+
 @app.route('/api/search')
 def api_search():
     """Universal search across all data sources"""
@@ -478,6 +733,7 @@ PROFESSIONAL_TEMPLATE = '''
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>🏢 Data Observatory - Professional Analytics Platform</title>
     <script src="https://cdn.jsdelivr.net/npm/chart.js"></script>
+    <script src="/timeline-chart.js"></script>
     <script src="https://d3js.org/d3.v7.min.js"></script>
     <style>
         /* Professional Enterprise CSS - Inspired by Grafana/Kibana */
@@ -767,6 +1023,12 @@ PROFESSIONAL_TEMPLATE = '''
             position: relative;
         }
 
+        #timelineChart {
+            display: block;
+            width: 100%;
+            height: 100%;
+        }
+
         /* Results Section */
         .results-section {
             background: var(--secondary-bg);
@@ -816,6 +1078,85 @@ PROFESSIONAL_TEMPLATE = '''
             line-height: 1.5;
         }
 
+        /* Virtualized results: fixed-height rows positioned inside a spacer */
+        .results-viewport {
+            max-height: 70vh;
+            overflow-y: auto;
+        }
+
+        .results-spacer {
+            position: relative;
+        }
+
+        .results-spacer .result-item {
+            position: absolute;
+            left: 0;
+            right: 0;
+            height: 96px;
+            margin-bottom: 0;
+            overflow: hidden;
+        }
+
+        .results-spacer .result-content {
+            display: -webkit-box;
+            -webkit-line-clamp: 2;
+            -webkit-box-orient: vertical;
+            overflow: hidden;
+        }
+
+        /* Result Detail Overlay */
+        .detail-modal {
+            position: fixed;
+            inset: 0;
+            background: rgba(0, 0, 0, 0.6);
+            display: flex;
+            align-items: center;
+            justify-content: center;
+            z-index: 200;
+        }
+
+        .detail-modal[hidden] {
+            display: none;
+        }
+
+        .detail-dialog {
+            background: var(--secondary-bg);
+            border: 1px solid var(--border-color);
+            border-radius: 12px;
+            box-shadow: var(--shadow-xl);
+            width: min(900px, 90vw);
+            max-height: 80vh;
+            display: flex;
+            flex-direction: column;
+        }
+
+        .detail-header {
+            display: flex;
+            justify-content: space-between;
+            align-items: center;
+            padding: 1rem 1.5rem;
+            border-bottom: 1px solid var(--border-color);
+            font-size: 0.875rem;
+            color: var(--text-secondary);
+        }
+
+        .detail-close {
+            background: none;
+            border: none;
+            color: var(--text-muted);
+            font-size: 1.125rem;
+            cursor: pointer;
+        }
+
+        .detail-content {
+            padding: 1.5rem;
+            overflow: auto;
+            white-space: pre-wrap;
+            word-break: break-word;
+            color: var(--text-primary);
+            font-size: 0.875rem;
+        }
+
         /* Loading States */
         .loading {
             display: flex;
@@ -948,7 +1289,7 @@ PROFESSIONAL_TEMPLATE = '''
                     Ready to search
                 </div>
             </div>
-            <div id="searchResults">
+            <div id="searchResults" class="results-viewport">
                 <div class="loading" style="display: none;">
                     <div class="spinner"></div>
                     <span>Searching across data sources...</span>
@@ -957,27 +1298,207 @@ PROFESSIONAL_TEMPLATE = '''
         </div>
     </div>
 
+    <!-- Result detail overlay (reused for every result) -->
+    <div class="detail-modal" id="detailModal" hidden>
+        <div class="detail-dialog">
+            <div class="detail-header">
+                <span class="detail-status">Full content</span>
+                <button class="detail-close" type="button" aria-label="Close">✕</button>
+            </div>
+            <pre class="detail-content"></pre>
+        </div>
+    </div>
+
+    <!-- Element templates: cloned per item, filled via textContent -->
+    <template id="resultItemTemplate">
+        <div class="result-item slide-in">
+            <div class="result-header">
+                <div class="result-source">
+                    <span class="result-icon"></span>
+                    <span class="result-source-name"></span>
+                    <span class="result-type"></span>
+                </div>
+                <div class="result-timestamp"></div>
+            </div>
+            <div class="result-content"></div>
+        </div>
+    </template>
+
+    <template id="statCardTemplate">
+        <div class="stat-card fade-in">
+            <div class="stat-header">
+                <div class="stat-title"></div>
+                <div class="stat-icon"></div>
+            </div>
+            <div class="stat-value"></div>
+            <div class="stat-change"></div>
+        </div>
+    </template>
+
+    <template id="filterChipTemplate">
+        <div class="filter-chip"><span class="chip-icon"></span><span class="chip-name"></span></div>
+    </template>
+
     <script>
         // Professional Data Observatory JavaScript
         // Inspired by Grafana and Kibana UX patterns
 
+        // Shared formatters: toLocaleString() resolves a new formatter per call
+        const NUMBER_FORMAT = new Intl.NumberFormat();
+        const DATE_TIME_FORMAT = new Intl.DateTimeFormat(undefined, {
+            year: 'numeric',
+            month: 'numeric',
+            day: 'numeric',
+            hour: 'numeric',
+            minute: '2-digit',
+            second: '2-digit'
+        });
+
+        // Client-side response cache limits (ms / entries)
+        const CACHE_MAX_ENTRIES = 64;
+        const SEARCH_CACHE_TTL = 15000;
+        const CORRELATION_CACHE_TTL = 30000;
+        const STATS_CACHE_TTL = 10000;
+        const STATS_POLL_INTERVAL = 10000;
+        const NDJSON_BATCH = 32;
+
+        // Virtualized result rows: .results-spacer .result-item height + 16px gap
+        const RESULT_ROW_HEIGHT = 112;
+        const RESULT_OVERSCAN = 3;
+        const RESULT_RENDER_CHUNK = 10;
+
+        // Run work when the main thread is idle; setTimeout fallback gets an 8 ms budget
+        const scheduleIdle = window.requestIdleCallback
+            ? (callback) => window.requestIdleCallback(callback, { timeout: 200 })
+            : (callback) => setTimeout(() => {
+                const start = performance.now();
+                callback({ timeRemaining: () => Math.max(0, 8 - (performance.now() - start)) });
+            }, 0);
+
         class DataObservatory {
             constructor() {
                 this.timelineChart = null;
+                this.chartWorker = null;
                 this.currentTimeRange = 24;
                 this.activeFilters = [];
                 this.searchTimeout = null;
+                this.SEARCH_DEBOUNCE_MS = 300;  // tunable via window.dataObservatory
+                this._lastSearchFire = 0;
                 this.dataSources = {};
+                this._cache = new Map();
+                this._statEls = null;
+                this._chipEls = [];
+                this._allChip = null;
+                this._results = [];
+                this._renderedResults = new Map();
+                this._resultsSpacer = null;
+                this._resultsScrollRaf = 0;
+                this._resultsGeneration = 0;
+                this._loadingElement = document.querySelector('#searchResults .loading');
+                this._searchInput = document.getElementById('searchInput');
+                this._modal = document.getElementById('detailModal');
+                this._templates = {
+                    resultItem: document.getElementById('resultItemTemplate').content.firstElementChild,
+                    statCard: document.getElementById('statCardTemplate').content.firstElementChild,
+                    filterChip: document.getElementById('filterChipTemplate').content.firstElementChild
+                };
+                this._searchAbort = null;
+                this._lastSearchKey = null;
+                this._searchParams = new URLSearchParams({ limit: 50 });
+                this._timelineAbort = null;
+                this._rangeRaf = 0;
 
                 this.init();
             }
 
+            // Memoized GET returning parsed JSON (rejects on HTTP errors); Map insertion order gives LRU eviction
+            async cachedFetch(url, ttlMs, signal = undefined, parse = (response) => response.json()) {
+                const now = Date.now();
+                const hit = this._cache.get(url);
+                if (hit && now < hit.expires) {
+                    this._cache.delete(url);
+                    this._cache.set(url, hit);
+                    return hit.value;
+                }
+
+                const response = await fetch(url, { signal });
+                // Error responses are never cached: the next call retries
+                if (!response.ok) {
+                    throw new Error(`${url} failed: HTTP ${response.status}`);
+                }
+                const value = await parse(response);
+                this._cache.delete(url);
+                this._cache.set(url, { value, expires: now + ttlMs });
+                if (this._cache.size > CACHE_MAX_ENTRIES) {
+                    this._cache.delete(this._cache.keys().next().value);
+                }
+                return value;
+            }
+
+            // Parse an NDJSON body as it arrives, reporting every NDJSON_BATCH new points
+            async readNdjson(response, onBatch) {
+                if (!response.body || !window.TextDecoderStream) {
+                    const text = await response.text();
+                    return text.split('\\n').filter(line => line).map(line => JSON.parse(line));
+                }
+
+                const reader = response.body.pipeThrough(new TextDecoderStream()).getReader();
+                const points = [];
+                let buffer = '';
+                let reported = 0;
+                for (;;) {
+                    const { value, done } = await reader.read();
+                    if (done) {
+                        break;
+                    }
+                    buffer += value;
+
+                    let start = 0;
+                    let newline;
+                    while ((newline = buffer.indexOf('\\n', start)) >= 0) {
+                        if (newline > start) {
+                            points.push(JSON.parse(buffer.slice(start, newline)));
+                        }
+                        start = newline + 1;
+                    }
+                    buffer = buffer.slice(start);
+
+                    if (points.length - reported >= NDJSON_BATCH) {
+                        reported = points.length;
+                        onBatch(points);
+                    }
+                }
+                if (buffer.trim()) {
+                    points.push(JSON.parse(buffer));
+                }
+                return points;
+            }
+
+            invalidateCache(prefix) {
+                for (const url of [...this._cache.keys()]) {
+                    if (url.startsWith(prefix)) {
+                        this._cache.delete(url);
+                    }
+                }
+            }
+
             async init() {
                 await this.loadDataSources();
                 await this.loadDashboardStats();
                 this.setupEventListeners();
                 this.initializeCharts();
                 this.setupSearch();
+                this.setupStatsStream();
+            }
+
+            setupStatsStream() {
+                // Server pushes stats when they change; poll only without EventSource
+                if (window.EventSource) {
+                    this._statsStream = new EventSource('/api/dashboard/stream');
+                    this._statsStream.onmessage = (event) => this.renderStats(JSON.parse(event.data));
+                } else {
+                    setInterval(() => this.loadDashboardStats(), STATS_POLL_INTERVAL);
+                }
             }
 
             async loadDataSources() {
@@ -992,24 +1513,30 @@ PROFESSIONAL_TEMPLATE = '''
 
             renderSourceFilters() {
                 const container = document.getElementById('sourceFilters');
-                container.innerHTML = '';
+                const fragment = document.createDocumentFragment();
 
                 // Add "All" filter
                 const allFilter = this.createFilterChip('all', 'All Sources', '🔍', true);
-                container.appendChild(allFilter);
+                fragment.appendChild(allFilter);
+                this._allChip = allFilter;
+                this._chipEls = [allFilter];
 
                 // Add individual source filters
                 Object.entries(this.dataSources).forEach(([key, source]) => {
                     const chip = this.createFilterChip(key, source.name, source.icon, false);
-                    container.appendChild(chip);
+                    fragment.appendChild(chip);
+                    this._chipEls.push(chip);
                 });
+
+                container.replaceChildren(fragment);
             }
 
             createFilterChip(key, name, icon, active = false) {
-                const chip = document.createElement('div');
-                chip.className = `filter-chip ${active ? 'active' : ''}`;
-                chip.innerHTML = `<span>${icon}</span><span>${name}</span>`;
-                chip.onclick = () => this.toggleFilter(key, chip);
+                const chip = this._templates.filterChip.cloneNode(true);
+                chip.classList.toggle('active', active);
+                chip.querySelector('.chip-icon').textContent = icon;
+                chip.querySelector('.chip-name').textContent = name;
+                chip.dataset.key = key;
                 return chip;
             }
 
@@ -1017,13 +1544,13 @@ PROFESSIONAL_TEMPLATE = '''
                 if (key === 'all') {
                     // Clear all filters and activate "All"
                     this.activeFilters = [];
-                    document.querySelectorAll('.filter-chip').forEach(chip => {
+                    for (const chip of this._chipEls) {
                         chip.classList.remove('active');
-                    });
+                    }
                     chipElement.classList.add('active');
                 } else {
                     // Toggle individual filter
-                    const allChip = document.querySelector('.filter-chip');
+                    const allChip = this._allChip;
                     allChip.classList.remove('active');
 
                     chipElement.classList.toggle('active');
@@ -1042,8 +1569,12 @@ PROFESSIONAL_TEMPLATE = '''
                     }
                 }
 
+                // Filter changes re-query search results fresh
+                this.invalidateCache('/api/search');
+                this._lastSearchKey = null;
+
                 // Trigger search if there's a query
-                const searchInput = document.getElementById('searchInput');
+                const searchInput = this._searchInput;
                 if (searchInput.value.trim()) {
                     this.performSearch(searchInput.value.trim());
                 }
@@ -1051,157 +1582,252 @@ PROFESSIONAL_TEMPLATE = '''
 
             async loadDashboardStats() {
                 try {
-                    const response = await fetch('/api/dashboard/stats');
-                    const stats = await response.json();
+                    const stats = await this.cachedFetch('/api/dashboard/stats', STATS_CACHE_TTL);
                     this.renderStats(stats);
                 } catch (error) {
                     console.error('Error loading dashboard stats:', error);
                 }
             }
 
+            statCardSpecs(stats) {
+                return [
+                    {
+                        key: 'clipboard',
+                        title: 'Clipboard Entries',
+                        value: NUMBER_FORMAT.format(stats.clipboard.total),
+                        icon: '📋',
+                        change: `+${stats.clipboard.recent_24h} in 24h`,
+                        changeType: 'positive'
+                    },
+                    {
+                        key: 'activity',
+                        title: 'Recent Activity',
+                        value: stats.clipboard.recent_1h.toString(),
+                        icon: '⚡',
+                        change: 'Last hour',
+                        changeType: 'neutral'
+                    },
+                    {
+                        key: 'size',
+                        title: 'Database Size',
+                        value: `${stats.clipboard.db_size_mb} MB`,
+                        icon: '💾',
+                        change: 'Total storage',
+                        changeType: 'neutral'
+                    },
+                    {
+                        key: 'load',
+                        title: 'System Load',
+                        value: stats.system.load_avg.toFixed(2),
+                        icon: '📊',
+                        change: `${stats.system.memory_usage}% memory`,
+                        changeType: stats.system.load_avg > 2 ? 'negative' : 'positive'
+                    },
+                    {
+                        key: 'sources',
+                        title: 'Data Sources',
+                        value: stats.data_sources.toString(),
+                        icon: '🔗',
+                        change: 'Connected',
+                        changeType: 'positive'
+                    },
+                    {
+                        key: 'uptime',
+                        title: 'System Uptime',
+                        value: stats.system.uptime,
+                        icon: '🕐',
+                        change: 'Running',
+                        changeType: 'positive'
+                    }
+                ];
+            }
+
             renderStats(stats) {
+                const cards = this.statCardSpecs(stats);
+
+                // Cards already exist: patch their text in place
+                if (this._statEls) {
+                    cards.forEach(card => this.patchStatCard(this._statEls[card.key], card));
+                    return;
+                }
+
                 const container = document.getElementById('statsGrid');
-                container.innerHTML = '';
-
-                // Clipboard stats
-                const clipboardCard = this.createStatCard(
-                    'Clipboard Entries',
-                    stats.clipboard.total.toLocaleString(),
-                    '📋',
-                    `+${stats.clipboard.recent_24h} in 24h`,
-                    'positive'
-                );
-                container.appendChild(clipboardCard);
-
-                // Recent activity
-                const activityCard = this.createStatCard(
-                    'Recent Activity',
-                    stats.clipboard.recent_1h.toString(),
-                    '⚡',
-                    'Last hour',
-                    'neutral'
-                );
-                container.appendChild(activityCard);
-
-                // Database size
-                const sizeCard = this.createStatCard(
-                    'Database Size',
-                    `${stats.clipboard.db_size_mb} MB`,
-                    '💾',
-                    'Total storage',
-                    'neutral'
-                );
-                container.appendChild(sizeCard);
-
-                // System load
-                const loadCard = this.createStatCard(
-                    'System Load',
-                    stats.system.load_avg.toFixed(2),
-                    '📊',
-                    `${stats.system.memory_usage}% memory`,
-                    stats.system.load_avg > 2 ? 'negative' : 'positive'
-                );
-                container.appendChild(loadCard);
-
-                // Data sources
-                const sourcesCard = this.createStatCard(
-                    'Data Sources',
-                    stats.data_sources.toString(),
-                    '🔗',
-                    'Connected',
-                    'positive'
-                );
-                container.appendChild(sourcesCard);
-
-                // Uptime
-                const uptimeCard = this.createStatCard(
-                    'System Uptime',
-                    stats.system.uptime,
-                    '🕐',
-                    'Running',
-                    'positive'
-                );
-                container.appendChild(uptimeCard);
+                const fragment = document.createDocumentFragment();
+                this._statEls = {};
+
+                cards.forEach(card => {
+                    const element = this.createStatCard(card.title, card.value, card.icon, card.change, card.changeType);
+                    this._statEls[card.key] = {
+                        value: element.querySelector('.stat-value'),
+                        change: element.querySelector('.stat-change')
+                    };
+                    fragment.appendChild(element);
+                });
+
+                container.replaceChildren(fragment);
+            }
+
+            patchStatCard(refs, card) {
+                refs.value.textContent = card.value;
+                refs.change.className = `stat-change ${card.changeType}`;
+                refs.change.textContent = this.formatStatChange(card.change, card.changeType);
+            }
+
+            formatStatChange(change, changeType) {
+                return `${changeType === 'positive' ? '↗' : changeType === 'negative' ? '↘' : '→'} ${change}`;
             }
 
             createStatCard(title, value, icon, change, changeType) {
-                const card = document.createElement('div');
-                card.className = 'stat-card fade-in';
-                card.innerHTML = `
-                    <div class="stat-header">
-                        <div class="stat-title">${title}</div>
-                        <div class="stat-icon">${icon}</div>
-                    </div>
-                    <div class="stat-value">${value}</div>
-                    <div class="stat-change ${changeType}">
-                        ${changeType === 'positive' ? '↗' : changeType === 'negative' ? '↘' : '→'} ${change}
-                    </div>
-                `;
+                const card = this._templates.statCard.cloneNode(true);
+                card.querySelector('.stat-title').textContent = title;
+                card.querySelector('.stat-icon').textContent = icon;
+                card.querySelector('.stat-value').textContent = value;
+
+                const changeElement = card.querySelector('.stat-change');
+                changeElement.classList.add(changeType);
+                changeElement.textContent = this.formatStatChange(change, changeType);
                 return card;
             }
 
             setupEventListeners() {
-                // Time range selector
+                // Time range selector: coalesce bursts of changes into one refresh per frame
                 document.getElementById('timeRange').addEventListener('change', (e) => {
                     this.currentTimeRange = parseInt(e.target.value);
-                    this.refreshTimeline();
+                    if (this._rangeRaf) {
+                        return;
+                    }
+                    this._rangeRaf = requestAnimationFrame(() => {
+                        this._rangeRaf = 0;
+                        this.refreshTimeline();
+                    });
                 });
 
                 // Search input
-                document.getElementById('searchInput').addEventListener('input', (e) => {
+                this._searchInput.addEventListener('input', (e) => {
                     this.handleSearchInput(e.target.value);
-                });
+                }, { passive: true });
 
                 // Enter key for search
-                document.getElementById('searchInput').addEventListener('keypress', (e) => {
+                this._searchInput.addEventListener('keypress', (e) => {
                     if (e.key === 'Enter') {
                         this.performSearch(e.target.value.trim());
                     }
+                }, { passive: true });
+
+                // Delegated clicks: one listener per container instead of a closure per element
+                document.getElementById('sourceFilters').addEventListener('click', (e) => {
+                    const chip = e.target.closest('.filter-chip');
+                    if (chip) {
+                        this.toggleFilter(chip.dataset.key, chip);
+                    }
                 });
+
+                document.getElementById('searchResults').addEventListener('click', (e) => {
+                    const item = e.target.closest('.result-item');
+                    if (item && item.dataset.index !== undefined) {
+                        this.showResultDetails(this._results[item.dataset.index]);
+                    }
+                });
+
+                // Result detail overlay: close on backdrop click, close button or Escape
+                this._modal.addEventListener('click', (e) => {
+                    if (e.target === this._modal || e.target.closest('.detail-close')) {
+                        this.closeResultDetails();
+                    }
+                });
+
+                window.addEventListener('keydown', (e) => {
+                    if (e.key === 'Escape' && !this._modal.hidden) {
+                        this.closeResultDetails();
+                    }
+                }, { passive: true });
+
+                // Remount the visible result window at most once per frame while scrolling
+                document.getElementById('searchResults').addEventListener('scroll', () => {
+                    if (!this._resultsSpacer || this._resultsScrollRaf) {
+                        return;
+                    }
+                    this._resultsScrollRaf = requestAnimationFrame(() => {
+                        this._resultsScrollRaf = 0;
+                        if (this._resultsSpacer) {
+                            this.renderVisibleResults();
+                        }
+                    });
+                }, { passive: true });
             }
 
             handleSearchInput(query) {
                 // Clear previous timeout
                 if (this.searchTimeout) {
                     clearTimeout(this.searchTimeout);
+                    this.searchTimeout = null;
                 }
 
-                // Debounce search
-                this.searchTimeout = setTimeout(() => {
+                const runSearch = () => {
+                    this.searchTimeout = null;
+                    this._lastSearchFire = Date.now();
                     if (query.trim().length > 0) {
                         this.performSearch(query.trim());
                     } else {
                         this.clearSearchResults();
                     }
-                }, 300);
+                };
+
+                // Leading edge: the first keystroke after an idle period searches immediately
+                if (Date.now() - this._lastSearchFire > this.SEARCH_DEBOUNCE_MS * 2) {
+                    runSearch();
+                    return;
+                }
+
+                // Trailing edge: coalesce the rest of the burst
+                this.searchTimeout = setTimeout(runSearch, this.SEARCH_DEBOUNCE_MS);
             }
 
             async performSearch(query) {
+                // Same query and filters as the results on screen: nothing to do
+                const searchKey = `${query}|${[...this.activeFilters].sort().join(',')}`;
+                if (searchKey === this._lastSearchKey) {
+                    return;
+                }
+                this._lastSearchKey = null;
+
+                // Cancel the previous in-flight search so stale results never land
+                if (this._searchAbort) {
+                    this._searchAbort.abort();
+                }
+                const abort = this._searchAbort = new AbortController();
+
                 const resultsContainer = document.getElementById('searchResults');
-                const loadingElement = resultsContainer.querySelector('.loading');
                 const countElement = document.getElementById('resultsCount');
 
                 // Show loading
-                resultsContainer.innerHTML = '';
-                loadingElement.style.display = 'flex';
-                resultsContainer.appendChild(loadingElement);
+                this.resetResults();
+                this._loadingElement.style.display = 'flex';
+                resultsContainer.replaceChildren(this._loadingElement);
 
                 try {
-                    const sources = this.activeFilters.length > 0 ? this.activeFilters : [];
-                    const params = new URLSearchParams({
-                        q: query,
-                        limit: 50
-                    });
-
-                    sources.forEach(source => params.append('sources', source));
+                    // Reuse one params object; sorted sources so equivalent
+                    // filter sets share a cache entry
+                    const params = this._searchParams;
+                    params.set('q', query);
+                    params.delete('sources');
+                    for (const source of [...this.activeFilters].sort()) {
+                        params.append('sources', source);
+                    }
 
-                    const response = await fetch(`/api/search?${params}`);
-                    const results = await response.json();
+                    const results = await this.cachedFetch(`/api/search?${params}`, SEARCH_CACHE_TTL, abort.signal);
+                    if (abort.signal.aborted) {
+                        return;
+                    }
 
                     this.renderSearchResults(results);
                     countElement.textContent = `${results.length} results found`;
+                    this._lastSearchKey = searchKey;
 
                 } catch (error) {
+                    if (error.name === 'AbortError') {
+                        return;
+                    }
                     console.error('Search error:', error);
                     resultsContainer.innerHTML = '<div class="loading">Search failed. Please try again.</div>';
                 }
@@ -1209,23 +1835,86 @@ PROFESSIONAL_TEMPLATE = '''
 
             renderSearchResults(results) {
                 const container = document.getElementById('searchResults');
-                container.innerHTML = '';
+                this.resetResults();
 
                 if (results.length === 0) {
                     container.innerHTML = '<div class="loading">No results found</div>';
                     return;
                 }
 
-                results.forEach((result, index) => {
-                    const resultElement = this.createResultItem(result);
-                    resultElement.style.animationDelay = `${index * 50}ms`;
-                    container.appendChild(resultElement);
-                });
+                // Only rows intersecting the viewport are mounted; the spacer keeps scroll height
+                this._results = results;
+                this._resultsSpacer = document.createElement('div');
+                this._resultsSpacer.className = 'results-spacer';
+                this._resultsSpacer.style.height = `${results.length * RESULT_ROW_HEIGHT}px`;
+                container.scrollTop = 0;
+                container.replaceChildren(this._resultsSpacer);
+                this.renderVisibleResults(true);
+            }
+
+            renderVisibleResults(stagger = false) {
+                const container = document.getElementById('searchResults');
+                const first = Math.max(0, Math.floor(container.scrollTop / RESULT_ROW_HEIGHT) - RESULT_OVERSCAN);
+                const last = Math.min(
+                    this._results.length,
+                    Math.ceil((container.scrollTop + container.clientHeight) / RESULT_ROW_HEIGHT) + RESULT_OVERSCAN
+                );
+
+                // Unmount rows that scrolled out of range
+                for (const [index, element] of this._renderedResults) {
+                    if (index < first || index >= last) {
+                        element.remove();
+                        this._renderedResults.delete(index);
+                    }
+                }
+
+                const pending = [];
+                for (let index = first; index < last; index++) {
+                    if (!this._renderedResults.has(index)) {
+                        pending.push(index);
+                    }
+                }
+
+                // Mount the first chunk now and the rest in idle time; a newer
+                // render (or new result set) cancels batches still queued
+                const generation = ++this._resultsGeneration;
+                let next = 0;
+                const step = (deadline) => {
+                    if (generation !== this._resultsGeneration) {
+                        return;
+                    }
+
+                    // Build each batch off-document, then insert once
+                    const fragment = document.createDocumentFragment();
+                    while (next < pending.length && (next < RESULT_RENDER_CHUNK || deadline.timeRemaining() > 2)) {
+                        const index = pending[next++];
+                        const resultElement = this.createResultItem(this._results[index]);
+                        resultElement.style.top = `${index * RESULT_ROW_HEIGHT}px`;
+                        resultElement.dataset.index = index;
+                        if (stagger) {
+                            resultElement.style.animationDelay = `${(index - first) * 50}ms`;
+                        }
+                        fragment.appendChild(resultElement);
+                        this._renderedResults.set(index, resultElement);
+                    }
+                    this._resultsSpacer.appendChild(fragment);
+
+                    if (next < pending.length) {
+                        scheduleIdle(step);
+                    }
+                };
+                step({ timeRemaining: () => 0 });
+            }
+
+            resetResults() {
+                this._resultsGeneration++;
+                this._results = [];
+                this._renderedResults.clear();
+                this._resultsSpacer = null;
             }
 
             createResultItem(result) {
-                const item = document.createElement('div');
-                item.className = 'result-item slide-in';
+                const item = this._templates.resultItem.cloneNode(true);
 
                 const sourceInfo = this.dataSources[result.source] || {
                     name: result.source,
@@ -1233,124 +1922,123 @@ PROFESSIONAL_TEMPLATE = '''
                     color: '#6b7280'
                 };
 
-                const timestamp = result.timestamp ?
-                    new Date(result.timestamp).toLocaleString() :
-                    'Unknown time';
+                const time = result.timestamp ? Date.parse(result.timestamp) : NaN;
+                const timestamp = Number.isNaN(time) ? 'Unknown time' : DATE_TIME_FORMAT.format(time);
 
-                item.innerHTML = `
-                    <div class="result-header">
-                        <div class="result-source">
-                            <span>${sourceInfo.icon}</span>
-                            <span>${sourceInfo.name}</span>
-                            ${result.type ? `<span>• ${result.type}</span>` : ''}
-                        </div>
-                        <div class="result-timestamp">${timestamp}</div>
-                    </div>
-                    <div class="result-content">${this.escapeHtml(result.preview || result.content)}</div>
-                `;
-
-                item.onclick = () => this.showResultDetails(result);
+                // textContent only: no HTML parsing and no escaping needed
+                item.querySelector('.result-icon').textContent = sourceInfo.icon;
+                item.querySelector('.result-source-name').textContent = sourceInfo.name;
+                const typeElement = item.querySelector('.result-type');
+                if (result.type) {
+                    typeElement.textContent = `• ${result.type}`;
+                } else {
+                    typeElement.remove();
+                }
+                item.querySelector('.result-timestamp').textContent = timestamp;
+                item.querySelector('.result-content').textContent = result.preview || result.content;
 
                 return item;
             }
 
             showResultDetails(result) {
-                // Create modal or detailed view
-                alert(`Full content:\\n\\n${result.content}`);
+                // Non-blocking overlay instead of alert()
+                const status = this._modal.querySelector('.detail-status');
+                status.textContent = 'Full content';
+                this._modal.querySelector('.detail-content').textContent = result.content;
+                this._modal.hidden = false;
+
+                // Copy to clipboard after the overlay is shown
+                queueMicrotask(() => {
+                    if (navigator.clipboard) {
+                        navigator.clipboard.writeText(result.content)
+                            .then(() => { status.textContent = 'Full content (copied to clipboard)'; })
+                            .catch(() => {});
+                    }
+                });
+            }
 
-                // Copy to clipboard
-                if (navigator.clipboard) {
-                    navigator.clipboard.writeText(result.content);
-                }
+            closeResultDetails() {
+                this._modal.hidden = true;
             }
 
             clearSearchResults() {
+                this._lastSearchKey = null;
+                this.resetResults();
                 document.getElementById('searchResults').innerHTML = '';
                 document.getElementById('resultsCount').textContent = 'Ready to search';
             }
 
             async initializeCharts() {
+                // Draw the chart off the main thread when OffscreenCanvas is available
+                const canvas = document.getElementById('timelineChart');
+                if (window.Worker && canvas.transferControlToOffscreen) {
+                    const container = canvas.parentElement;
+                    const offscreen = canvas.transferControlToOffscreen();
+                    this.chartWorker = new Worker('/timeline-chart.js');
+                    this.chartWorker.postMessage({
+                        type: 'init',
+                        canvas: offscreen,
+                        width: container.clientWidth,
+                        height: container.clientHeight,
+                        pixelRatio: window.devicePixelRatio || 1
+                    }, [offscreen]);
+
+                    new ResizeObserver(() => {
+                        this.chartWorker.postMessage({
+                            type: 'resize',
+                            width: container.clientWidth,
+                            height: container.clientHeight
+                        });
+                    }).observe(container);
+                }
+
                 await this.loadTimelineData();
             }
 
             async loadTimelineData() {
+                // Only the latest time range should reach the chart
+                if (this._timelineAbort) {
+                    this._timelineAbort.abort();
+                }
+                const abort = this._timelineAbort = new AbortController();
+
                 try {
-                    const response = await fetch(`/api/correlation?hours=${this.currentTimeRange}`);
-                    const data = await response.json();
+                    // Stream points so the chart draws before the last byte arrives
+                    const data = await this.cachedFetch(
+                        `/api/correlation.ndjson?hours=${this.currentTimeRange}`,
+                        CORRELATION_CACHE_TTL,
+                        abort.signal,
+                        (response) => this.readNdjson(response, (points) => {
+                            if (!abort.signal.aborted) {
+                                this.renderTimelineChart(points);
+                            }
+                        })
+                    );
+                    if (abort.signal.aborted) {
+                        return;
+                    }
                     this.renderTimelineChart(data);
                 } catch (error) {
+                    if (error.name === 'AbortError') {
+                        return;
+                    }
                     console.error('Error loading timeline data:', error);
                 }
             }
 
             renderTimelineChart(data) {
-                const ctx = document.getElementById('timelineChart').getContext('2d');
+                if (this.chartWorker) {
+                    this.chartWorker.postMessage({ type: 'data', data });
+                    return;
+                }
 
                 if (this.timelineChart) {
-                    this.timelineChart.destroy();
+                    updateTimelineChart(this.timelineChart, data);
+                    return;
                 }
 
-                this.timelineChart = new Chart(ctx, {
-                    type: 'line',
-                    data: {
-                        labels: data.map(d => new Date(d.timestamp).toLocaleTimeString()),
-                        datasets: [
-                            {
-                                label: 'Clipboard Activity',
-                                data: data.map(d => d.clipboard_activity),
-                                borderColor: '#6366f1',
-                                backgroundColor: 'rgba(99, 102, 241, 0.1)',
-                                tension: 0.4,
-                                fill: true
-                            },
-                            {
-                                label: 'Browser Activity',
-                                data: data.map(d => d.browser_activity),
-                                borderColor: '#059669',
-                                backgroundColor: 'rgba(5, 150, 105, 0.1)',
-                                tension: 0.4,
-                                fill: true
-                            },
-                            {
-                                label: 'System Activity',
-                                data: data.map(d => d.system_activity),
-                                borderColor: '#dc2626',
-                                backgroundColor: 'rgba(220, 38, 38, 0.1)',
-                                tension: 0.4,
-                                fill: true
-                            }
-                        ]
-                    },
-                    options: {
-                        responsive: true,
-                        maintainAspectRatio: false,
-                        plugins: {
-                            legend: {
-                                labels: {
-                                    color: '#d1d5db'
-                                }
-                            }
-                        },
-                        scales: {
-                            x: {
-                                ticks: {
-                                    color: '#9ca3af'
-                                },
-                                grid: {
-                                    color: '#4b5563'
-                                }
-                            },
-                            y: {
-                                ticks: {
-                                    color: '#9ca3af'
-                                },
-                                grid: {
-                                    color: '#4b5563'
-                                }
-                            }
-                        }
-                    }
-                });
+                const ctx = document.getElementById('timelineChart').getContext('2d');
+                this.timelineChart = createTimelineChart(ctx, data);
             }
 
             async refreshTimeline() {
@@ -1358,19 +2046,14 @@ PROFESSIONAL_TEMPLATE = '''
             }
 
             setupSearch() {
-                // Focus search on Ctrl+K
-                document.addEventListener('keydown', (e) => {
-                    if ((e.ctrlKey || e.metaKey) && e.key === 'k') {
-                        e.preventDefault();
-                        document.getElementById('searchInput').focus();
+                // Focus search on Ctrl+K; cheapest test first so other keys bail immediately
+                window.addEventListener('keydown', (e) => {
+                    if (e.key !== 'k' || !(e.ctrlKey || e.metaKey)) {
+                        return;
                     }
-                });
-            }
-
-            escapeHtml(text) {
-                const div = document.createElement('div');
-                div.textContent = text;
-                return div.innerHTML;
+                    e.preventDefault();
+                    this._searchInput.focus();
+                }, { passive: false });
             }
         }
 
@@ -1378,6 +2061,9 @@ PROFESSIONAL_TEMPLATE = '''
         async function refreshDashboard() {
             const observatory = window.dataObservatory;
             if (observatory) {
+                // Explicit refresh bypasses the client-side cache
+                observatory.invalidateCache('/api/dashboard/stats');
+                observatory.invalidateCache('/api/correlation');
                 await observatory.loadDashboardStats();
                 await observatory.refreshTimeline();
             }
@@ -1392,6 +2078,201 @@ PROFESSIONAL_TEMPLATE = '''
 </html>
 '''
 
+# Timeline chart renderer, shared by the page (main-thread fallback) and the
+# Web Worker that draws into an OffscreenCanvas
+TIMELINE_CHART_SCRIPT = '''
+const TIMELINE_SMOOTH_MAX_POINTS = 200;
+
+// One shared formatter instead of a locale lookup per toLocaleTimeString call
+const TIMELINE_LABEL_FORMAT = new Intl.DateTimeFormat(undefined, {
+    hour: 'numeric',
+    minute: '2-digit',
+    second: '2-digit'
+});
+
+// Split correlation points into chart labels and per-source series in one pass
+function timelineSeries(data) {
+    const count = data.length;
+    const labels = new Array(count);
+    const clipboard = new Array(count);
+    const browser = new Array(count);
+    const system = new Array(count);
+    for (let i = 0; i < count; i++) {
+        const d = data[i];
+        labels[i] = TIMELINE_LABEL_FORMAT.format(Date.parse(d.timestamp));
+        // Pre-normalized {x: category index, y} points so Chart.js can skip parsing
+        clipboard[i] = { x: i, y: d.clipboard_activity };
+        browser[i] = { x: i, y: d.browser_activity };
+        system[i] = { x: i, y: d.system_activity };
+    }
+    return { labels, datasets: [clipboard, browser, system] };
+}
+
+// Bezier smoothing is only worth its cost on short series
+function timelineTension(count) {
+    return count < TIMELINE_SMOOTH_MAX_POINTS ? 0.4 : 0;
+}
+
+// Swap data into an existing chart without rebuilding scales, legend or options
+function updateTimelineChart(chart, data) {
+    const series = timelineSeries(data);
+    const tension = timelineTension(data.length);
+    chart.data.labels = series.labels;
+    series.datasets.forEach((values, i) => {
+        chart.data.datasets[i].data = values;
+        chart.data.datasets[i].tension = tension;
+    });
+    chart.update('none');
+}
+
+function createTimelineChart(canvas, data, overrides = {}) {
+    const series = timelineSeries(data);
+    const tension = timelineTension(data.length);
+    return new Chart(canvas, {
+        type: 'line',
+        data: {
+            labels: series.labels,
+            datasets: [
+                {
+                    label: 'Clipboard Activity',
+                    data: series.datasets[0],
+                    borderColor: '#6366f1',
+                    backgroundColor: 'rgba(99, 102, 241, 0.1)',
+                    tension,
+                    fill: true
+                },
+                {
+                    label: 'Browser Activity',
+                    data: series.datasets[1],
+                    borderColor: '#059669',
+                    backgroundColor: 'rgba(5, 150, 105, 0.1)',
+                    tension,
+                    fill: true
+                },
+                {
+                    label: 'System Activity',
+                    data: series.datasets[2],
+                    borderColor: '#dc2626',
+                    backgroundColor: 'rgba(220, 38, 38, 0.1)',
+                    tension,
+                    fill: true
+                }
+            ]
+        },
+        options: Object.assign({
+            responsive: true,
+            maintainAspectRatio: false,
+            // Static time-series: no animation loop, no per-point parsing
+            animation: false,
+            animations: {
+                colors: false,
+                x: false,
+                y: false
+            },
+            transitions: {
+                active: {
+                    animation: {
+                        duration: 0
+                    }
+                }
+            },
+            parsing: false,
+            normalized: true,
+            spanGaps: true,
+            elements: {
+                point: {
+                    radius: 0,
+                    hitRadius: 8
+                }
+            },
+            plugins: {
+                legend: {
+                    labels: {
+                        color: '#d1d5db'
+                    }
+                }
+            },
+            scales: {
+                x: {
+                    ticks: {
+                        color: '#9ca3af'
+                    },
+                    grid: {
+                        color: '#4b5563'
+                    }
+                },
+                y: {
+                    ticks: {
+                        color: '#9ca3af'
+                    },
+                    grid: {
+                        color: '#4b5563'
+                    }
+                }
+            }
+        }, overrides)
+    });
+}
+
+// Worker side: own the OffscreenCanvas and all Chart.js work
+if (typeof WorkerGlobalScope !== 'undefined' && self instanceof WorkerGlobalScope) {
+    importScripts('https://cdn.jsdelivr.net/npm/chart.js');
+
+    let canvas = null;
+    let chart = null;
+    let size = { width: 0, height: 0, pixelRatio: 1 };
+
+    self.onmessage = (event) => {
+        const message = event.data;
+
+        if (message.type === 'init') {
+            canvas = message.canvas;
+            size = { width: message.width, height: message.height, pixelRatio: message.pixelRatio };
+        } else if (message.type === 'resize') {
+            size.width = message.width;
+            size.height = message.height;
+            if (chart) {
+                chart.resize(size.width, size.height);
+            }
+        } else if (message.type === 'data' && canvas) {
+            if (chart) {
+                updateTimelineChart(chart, message.data);
+                return;
+            }
+            canvas.width = size.width;
+            canvas.height = size.height;
+            chart = createTimelineChart(canvas, message.data, {
+                responsive: false,
+                devicePixelRatio: size.pixelRatio
+            });
+        }
+    };
+}
+'''
+
+# Template and chart script have no Jinja substitutions, so encode them once at import
+DASHBOARD_HTML = PROFESSIONAL_TEMPLATE.encode('utf-8')
+DASHBOARD_ETAG = hashlib.sha1(DASHBOARD_HTML).hexdigest()
+TIMELINE_CHART_JS = TIMELINE_CHART_SCRIPT.encode('utf-8')
+TIMELINE_CHART_ETAG = hashlib.sha1(TIMELINE_CHART_JS).hexdigest()
+
+if GUNICORN_AVAILABLE:
+    class ObservatoryServer(BaseApplication):
+        """Embedded gunicorn server (threaded workers with HTTP keepalive)"""
+
+        def __init__(self, application, options=None):
+            self.application = application
+            self.options = options or {}
+            super().__init__()
+
+        def load_config(self):
+            for key, value in self.options.items():
+                if key in self.cfg.settings and value is not None:
+                    self.cfg.set(key.lower(), value)
+
+        def load(self):
+            return self.application
+
 def open_browser():
     """Open browser after a short delay"""
     time.sleep(1)
@@ -1417,4 +2298,13 @@ if __name__ == '__main__':
     # Open browser automatically
     threading.Thread(target=open_browser, daemon=True).start()
 
-    app.run(host='0.0.0.0', port=6000, debug=False)
\ No newline at end of file
+    if GUNICORN_AVAILABLE:
+        ObservatoryServer(app, {
+            'bind': '0.0.0.0:6000',
+            'workers': 2,
+            'threads': 4,
+            'worker_class': 'gthread',
+            'keepalive': 5
+        }).run()
+    else:
+        app.run(host='0.0.0.0', port=6000, debug=False, threaded=True)
\ No newline at end of file
@@ -5,15 +5,68 @@ Incorporates design patterns from lnav, log-viewer, and other excellent tools
 Fixes timestamp parsing and provides professional data display
 """
 
-from flask import Flask, render_template_string, jsonify, request
+from flask import Flask, Response, request, stream_with_context
 import sqlite3
 import json
-from datetime import datetime
+import os
+import gzip
+import hashlib
+import heapq
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
+from functools import wraps
+import numpy as np
 from improved_log_parser import ImprovedLogParser
 from real_system_log_capture import RealSystemLogCapture
 from intelligent_error_database import IntelligentErrorDatabase
 from lnav_based_analyzer import LnavBasedAnalyzer
 
+try:
+    import brotli
+    BROTLI_AVAILABLE = True
+except ImportError:
+    BROTLI_AVAILABLE = False
+    print("⚠️ brotli not available - interface page will be served gzip-only")
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+    ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_NAIVE_UTC | orjson.OPT_SERIALIZE_NUMPY
+except ImportError:
+    ORJSON_AVAILABLE = False
+    print("⚠️ orjson not available - falling back to Flask's JSON encoder")
+
+try:
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
+    print("⚠️ msgpack not available - log lists will only be served as JSON")
+
+try:
+    from gunicorn.app.base import BaseApplication
+    GUNICORN_AVAILABLE = True
+except ImportError:
+    GUNICORN_AVAILABLE = False
+    print("⚠️ gunicorn not available - falling back to Flask development server")
+
+try:
+    import gevent
+    GEVENT_AVAILABLE = True
+except ImportError:
+    GEVENT_AVAILABLE = False
+    print("⚠️ gevent not available - gunicorn will use threaded workers")
+
+try:
+    from watchdog.observers import Observer
+    from watchdog.events import FileSystemEventHandler
+    WATCHDOG_AVAILABLE = True
+except ImportError:
+    WATCHDOG_AVAILABLE = False
+    print("⚠️ watchdog not available - crash file changes will be detected with stat() per request")
+
 app = Flask(__name__)
 
 # Initialize components
@@ -22,1226 +75,667 @@ real_logs = RealSystemLogCapture("real_system_logs.db")
 intelligent_db = IntelligentErrorDatabase()
 lnav_analyzer = LnavBasedAnalyzer()
 
+# Bodies smaller than this aren't worth a Content-Encoding round trip
+GZIP_MIN_BYTES = 1024
+
+def gzip_body(body):
+    """Pre-compressed copy of a stored body, or None when it is too small to bother"""
+    return gzip.compress(body, 6) if len(body) >= GZIP_MIN_BYTES else None
+
+def prebuilt_response(body, gzipped, etag, mimetype='application/json'):
+    """Serve stored bytes, using the stored gzip copy when the client accepts it"""
+    if gzipped is not None and request.accept_encodings['gzip']:
+        response = Response(gzipped, mimetype=mimetype)
+        response.headers['Content-Encoding'] = 'gzip'
+        etag = f"{etag}-gzip"
+    else:
+        response = Response(body, mimetype=mimetype)
+    response.vary.add('Accept-Encoding')
+    response.set_etag(etag)
+    return response.make_conditional(request)
+
+def cached_json_view(seconds, maxsize=64):
+    """Cache a view's body per query string and Accept header for a short TTL (LRU-bounded)
+
+    Polls inside the window get the stored bytes with an ETag instead of
+    re-running the analysis; error responses are never cached.
+    """
+    def decorator(view):
+        cache = OrderedDict()
+        lock = threading.Lock()
+
+        @wraps(view)
+        def wrapper():
+            key = (tuple(sorted(request.args.items(multi=True))), request.headers.get('Accept', ''))
+            now = time.monotonic()
+            with lock:
+                hit = cache.get(key)
+                if hit and hit[0] > now:
+                    cache.move_to_end(key)
+                else:
+                    hit = None
+
+            def store(body, mimetype):
+                entry = (now + seconds, body, hashlib.sha1(body).hexdigest(), mimetype, gzip_body(body))
+                with lock:
+                    cache[key] = entry
+                    cache.move_to_end(key)
+                    while len(cache) > maxsize:
+                        cache.popitem(last=False)
+                return entry
+
+            if hit is None:
+                response = app.make_response(view())
+                if response.status_code != 200:
+                    return response
+                if response.is_streamed:
+                    # Pass chunks through as they are produced and cache the
+                    # body only once the stream has been sent in full
+                    def tee(chunks):
+                        parts = []
+                        for chunk in chunks:
+                            parts.append(chunk)
+                            yield chunk
+                        store(b''.join(parts), response.mimetype)
+                    return Response(tee(response.iter_encoded()), mimetype=response.mimetype)
+                hit = store(response.get_data(), response.mimetype)
+
+            response = prebuilt_response(hit[1], hit[4], hit[2], hit[3])
+            response.vary.add('Accept')
+            return response
+
+        wrapper.cache_clear = cache.clear
+        return wrapper
+    return decorator
+
+def dump_json(obj):
+    """Serialize to UTF-8 JSON bytes (orjson when installed)"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=ORJSON_OPTIONS)
+    return app.json.dumps(obj).encode('utf-8')
+
+def ojsonify(obj):
+    """jsonify replacement that writes orjson bytes straight into the response"""
+    return Response(dump_json(obj), mimetype='application/json')
+
+def wants_msgpack():
+    """True when the client asked for MessagePack over JSON"""
+    return (MSGPACK_AVAILABLE and
+            request.accept_mimetypes.best_match(['application/json', 'application/msgpack']) == 'application/msgpack')
+
+def msgpack_logs_response(logs):
+    """Columnar MessagePack log list with service/level dictionary-encoded as small ints"""
+    services = {}
+    levels = {}
+    columns = {
+        'timestamp': [log.get('timestamp') for log in logs],
+        'service': [services.setdefault(log.get('service'), len(services)) for log in logs],
+        'pid': [log.get('pid') for log in logs],
+        'log_level': [levels.setdefault(log.get('log_level'), len(levels)) for log in logs],
+        'message': [log.get('message') for log in logs],
+    }
+    columns['services'] = list(services)
+    columns['levels'] = list(levels)
+    return Response(msgpack.packb(columns, use_bin_type=True), mimetype='application/msgpack')
+
+def stream_json_list(key, rows):
+    """Yield {"key": [...]} one serialized row at a time"""
+    yield b'{"%s":[' % key.encode('utf-8')
+    separator = b''
+    for row in rows:
+        yield separator + dump_json(row)
+        separator = b','
+    yield b']}'
+
 @app.route('/')
 def professional_interface():
     """Professional log interface based on best practices"""
-    return render_template_string('''
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>🔍 Professional Log Analysis Interface</title>
-    <style>
-        * { margin: 0; padding: 0; box-sizing: border-box; }
-        
-        body {
-            font-family: 'Monaco', 'Menlo', 'Ubuntu Mono', monospace;
-            background: #0d1117;
-            color: #c9d1d9;
-            line-height: 1.6;
-        }
-        
-        .header {
-            background: #161b22;
-            border-bottom: 1px solid #30363d;
-            padding: 1rem 2rem;
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-        }
-        
-        .header h1 {
-            color: #58a6ff;
-            font-size: 1.5rem;
-        }
-        
-        .stats-bar {
-            display: flex;
-            gap: 2rem;
-            font-size: 0.9rem;
-        }
-        
-        .stat-item {
-            color: #7c3aed;
-            font-weight: bold;
-        }
-        
-        .main-container {
-            display: grid;
-            grid-template-columns: 300px 1fr;
-            height: calc(100vh - 80px);
-        }
-        
-        .sidebar {
-            background: #161b22;
-            border-right: 1px solid #30363d;
-            padding: 1rem;
-            overflow-y: auto;
-        }
-        
-        .sidebar h3 {
-            color: #f0883e;
-            margin-bottom: 1rem;
-            font-size: 1rem;
-        }
-        
-        .filter-group {
-            margin-bottom: 1.5rem;
-        }
-        
-        .filter-group label {
-            display: block;
-            margin-bottom: 0.5rem;
-            color: #8b949e;
-            font-size: 0.9rem;
-        }
-        
-        .filter-input {
-            width: 100%;
-            padding: 0.5rem;
-            background: #0d1117;
-            border: 1px solid #30363d;
-            border-radius: 4px;
-            color: #c9d1d9;
-            font-family: inherit;
-        }
-        
-        .filter-input:focus {
-            outline: none;
-            border-color: #58a6ff;
-        }
-        
-        .btn {
-            background: #238636;
-            color: white;
-            border: none;
-            padding: 0.5rem 1rem;
-            border-radius: 4px;
-            cursor: pointer;
-            font-family: inherit;
-            font-size: 0.9rem;
-            margin: 0.25rem 0;
-            width: 100%;
-            user-select: text;
-            -webkit-user-select: text;
-            -moz-user-select: text;
-            -ms-user-select: text;
-        }
-        
-        .btn:hover {
-            background: #2ea043;
-        }
-        
-        .btn-secondary {
-            background: #21262d;
-            border: 1px solid #30363d;
-        }
-        
-        .btn-secondary:hover {
-            background: #30363d;
-        }
-        
-        .content-area {
-            display: flex;
-            flex-direction: column;
-            overflow: hidden;
-        }
-        
-        .tabs {
-            display: flex;
-            background: #161b22;
-            border-bottom: 1px solid #30363d;
-        }
-        
-        .tab {
-            padding: 0.75rem 1.5rem;
-            background: none;
-            border: none;
-            color: #8b949e;
-            cursor: pointer;
-            font-family: inherit;
-            border-bottom: 2px solid transparent;
-        }
-        
-        .tab.active {
-            color: #58a6ff;
-            border-bottom-color: #58a6ff;
-        }
-        
-        .tab-content {
-            flex: 1;
-            overflow: hidden;
-            display: none;
-        }
-        
-        .tab-content.active {
-            display: flex;
-            flex-direction: column;
-        }
-        
-        .log-viewer {
-            flex: 1;
-            overflow: auto;
-            padding: 1rem;
-            font-family: 'Monaco', 'Menlo', 'Ubuntu Mono', monospace;
-            font-size: 0.85rem;
-            line-height: 1.4;
-        }
-        
-        .log-entry {
-            display: flex;
-            padding: 0.25rem 0;
-            border-bottom: 1px solid #21262d;
-            align-items: flex-start;
-        }
-        
-        .log-entry:hover {
-            background: #161b22;
-        }
-        
-        .log-timestamp {
-            color: #7c3aed;
-            width: 180px;
-            flex-shrink: 0;
-            font-weight: bold;
-        }
-        
-        .log-service {
-            color: #f0883e;
-            width: 120px;
-            flex-shrink: 0;
-        }
-        
-        .log-level {
-            width: 80px;
-            flex-shrink: 0;
-            font-weight: bold;
-        }
-        
-        .log-level.ERROR, .log-level.CRITICAL, .log-level.SIGNAL {
-            color: #f85149;
-        }
-        
-        .log-level.WARNING {
-            color: #d29922;
-        }
-        
-        .log-level.INFO {
-            color: #58a6ff;
-        }
-        
-        .log-message {
-            flex: 1;
-            word-break: break-all;
-            color: #c9d1d9;
-        }
-        
-        .log-message.highlight {
-            background: #ffd33d22;
-            color: #ffd33d;
-        }
-        
-        .structured-data {
-            background: #0d1117;
-            border: 1px solid #30363d;
-            border-radius: 4px;
-            padding: 1rem;
-            margin: 1rem;
-            overflow: auto;
-        }
-        
-        .data-table {
-            width: 100%;
-            border-collapse: collapse;
-        }
-        
-        .data-table th {
-            background: #21262d;
-            color: #f0883e;
-            padding: 0.5rem;
-            text-align: left;
-            border: 1px solid #30363d;
-            font-weight: bold;
-        }
-        
-        .data-table td {
-            padding: 0.5rem;
-            border: 1px solid #30363d;
-            vertical-align: top;
-        }
-        
-        .data-table tr:nth-child(even) {
-            background: #161b22;
-        }
-        
-        .data-table tr:hover {
-            background: #21262d;
-        }
-        
-        .loading {
-            text-align: center;
-            padding: 2rem;
-            color: #8b949e;
-        }
-        
-        .error {
-            color: #f85149;
-            text-align: center;
-            padding: 2rem;
-        }
-        
-        .search-highlight {
-            background: #ffd33d;
-            color: #0d1117;
-            font-weight: bold;
-        }
-        
-        .neo4j-container {
-            height: 400px;
-            border: 1px solid #30363d;
-            border-radius: 4px;
-            margin: 1rem;
-            background: #0d1117;
-            position: relative;
-        }
-        
-        .controls-bar {
-            display: flex;
-            gap: 1rem;
-            padding: 1rem;
-            background: #161b22;
-            border-bottom: 1px solid #30363d;
-            align-items: center;
-        }
-        
-        .status-indicator {
-            display: inline-block;
-            width: 8px;
-            height: 8px;
-            border-radius: 50%;
-            margin-right: 0.5rem;
-        }
-        
-        .status-indicator.online {
-            background: #238636;
-        }
-        
-        .status-indicator.offline {
-            background: #f85149;
-        }
-    </style>
-</head>
-<body>
-    <div class="header">
-        <h1>🔍 Professional Log Analysis Interface</h1>
-        <div class="stats-bar">
-            <div class="stat-item">Total Crashes: <span id="systemEventsCount">-</span></div>
-            <div class="stat-item">Critical Signals: <span id="appErrorsCount">-</span></div>
-            <div class="stat-item">Recommendations: <span id="solutionsCount">-</span></div>
-        </div>
-    </div>
-    
-    <div class="main-container">
-        <div class="sidebar">
-            <h3>🔧 Filters & Controls</h3>
-            
-            <div class="filter-group">
-                <label>Time Range</label>
-                <select class="filter-input" id="timeRange">
-                    <option value="1h">Last Hour</option>
-                    <option value="6h">Last 6 Hours</option>
-                    <option value="24h" selected>Last 24 Hours</option>
-                    <option value="7d">Last 7 Days</option>
-                </select>
-            </div>
-            
-            <div class="filter-group">
-                <label>Log Level</label>
-                <select class="filter-input" id="logLevel">
-                    <option value="">All Levels</option>
-                    <option value="CRITICAL">Critical</option>
-                    <option value="ERROR">Error</option>
-                    <option value="WARNING">Warning</option>
-                    <option value="INFO">Info</option>
-                    <option value="SIGNAL">Signal Errors</option>
-                </select>
-            </div>
-            
-            <div class="filter-group">
-                <label>Service/Application</label>
-                <input type="text" class="filter-input" id="serviceFilter" placeholder="e.g., code-insiders, audit">
-            </div>
-            
-            <div class="filter-group">
-                <label>Search Message</label>
-                <input type="text" class="filter-input" id="messageSearch" placeholder="Search log messages...">
-            </div>
-            
-            <button class="btn" onclick="applyFilters()">🔍 Apply Filters</button>
-            <button class="btn btn-secondary" onclick="clearFilters()">🗑️ Clear Filters</button>
-            <button class="btn" onclick="refreshLogs()">🔄 Refresh Logs</button>
-            <button class="btn" onclick="exportLogs()">📥 Export Logs</button>
-        </div>
-        
-        <div class="content-area">
-            <div class="tabs">
-                <button class="tab active" onclick="switchTab('logs')">📋 Log Viewer</button>
-                <button class="tab" onclick="switchTab('structured')">📊 Structured Data</button>
-                <button class="tab" onclick="switchTab('graph')">🕸️ Relationship Graph</button>
-                <button class="tab" onclick="switchTab('solutions')">💡 Smart Solutions</button>
-            </div>
-            
-            <div id="logs-tab" class="tab-content active">
-                <div class="controls-bar">
-                    <span class="status-indicator online"></span>
-                    <span>Live Monitoring Active</span>
-                    <button class="btn btn-secondary" onclick="toggleAutoScroll()">📜 Auto-scroll: ON</button>
-                </div>
-                <div class="log-viewer" id="logViewer">
-                    <div class="loading">Loading system logs...</div>
-                </div>
-            </div>
-            
-            <div id="structured-tab" class="tab-content">
-                <div class="structured-data" id="structuredData">
-                    <div class="loading">Click "Refresh Logs" to load structured data...</div>
-                </div>
-            </div>
-            
-            <div id="graph-tab" class="tab-content">
-                <div class="neo4j-container" id="graphContainer">
-                    <div class="loading">Loading crash relationship graph...</div>
-                </div>
-            </div>
-            
-            <div id="solutions-tab" class="tab-content">
-                <div class="structured-data" id="solutionsContainer">
-                    <div class="loading">Smart solutions will appear here...</div>
-                </div>
-            </div>
-        </div>
-    </div>
-
-    <script>
-        class ProfessionalLogInterface {
-            constructor() {
-                this.currentTab = 'logs';
-                this.autoScroll = true;
-                this.filters = {};
-                this.logs = [];
-                this.init();
-            }
-            
-            async init() {
-                await this.loadStats();
-                await this.loadLogs();
-                this.setupEventListeners();
-            }
-            
-            async loadStats() {
-                try {
-                    const response = await fetch('/api/crash-analysis-stats');
-                    const stats = await response.json();
-
-                    document.getElementById('systemEventsCount').textContent = stats.total_crashes || 0;
-                    document.getElementById('appErrorsCount').textContent = stats.critical_signals || 0;
-                    document.getElementById('solutionsCount').textContent = stats.recommendations || 0;
-                } catch (error) {
-                    console.error('Failed to load stats:', error);
-                }
-            }
-            
-            async loadLogs() {
-                try {
-                    const response = await fetch('/api/parsed-logs');
-                    const data = await response.json();
-                    this.logs = data.logs || [];
-                    this.displayLogs();
-                } catch (error) {
-                    document.getElementById('logViewer').innerHTML = 
-                        '<div class="error">Failed to load logs</div>';
-                }
-            }
-            
-            displayLogs() {
-                const container = document.getElementById('logViewer');
-                if (!this.logs.length) {
-                    container.innerHTML = '<div class="loading">No logs available</div>';
-                    return;
-                }
-                
-                let html = '';
-                this.logs.forEach(log => {
-                    const levelClass = log.log_level || 'INFO';
-                    html += `
-                        <div class="log-entry" data-timestamp="${log.timestamp}">
-                            <div class="log-timestamp">${this.formatTimestamp(log.timestamp)}</div>
-                            <div class="log-service">${log.service}</div>
-                            <div class="log-level ${levelClass}">${levelClass}</div>
-                            <div class="log-message">${this.escapeHtml(log.message)}</div>
-                        </div>
-                    `;
-                });
-                
-                container.innerHTML = html;
-                
-                if (this.autoScroll) {
-                    container.scrollTop = container.scrollHeight;
-                }
-            }
-            
-            formatTimestamp(timestamp) {
-                if (timestamp === 'unknown' || !timestamp) return 'Unknown';
-                try {
-                    // Handle various timestamp formats
-                    if (timestamp.includes('May') || timestamp.includes('Jun')) {
-                        // Parse syslog format: "May 30 19:26:31"
-                        const year = new Date().getFullYear();
-                        const dateStr = `${year} ${timestamp}`;
-                        const date = new Date(dateStr);
-                        if (!isNaN(date.getTime())) {
-                            return date.toLocaleString();
-                        }
-                    }
-
-                    const date = new Date(timestamp);
-                    if (!isNaN(date.getTime())) {
-                        return date.toLocaleString();
-                    }
-                    return timestamp;
-                } catch {
-                    return timestamp;
-                }
-            }
-            
-            escapeHtml(text) {
-                const div = document.createElement('div');
-                div.textContent = text;
-                return div.innerHTML;
-            }
-            
-            setupEventListeners() {
-                // Tab switching
-                document.querySelectorAll('.tab').forEach(tab => {
-                    tab.addEventListener('click', (e) => {
-                        const tabName = e.target.textContent.includes('Log Viewer') ? 'logs' :
-                                       e.target.textContent.includes('Structured') ? 'structured' :
-                                       e.target.textContent.includes('Graph') ? 'graph' : 'solutions';
-                        this.switchTab(tabName);
-                    });
-                });
-            }
-            
-            switchTab(tabName) {
-                // Update tab buttons
-                document.querySelectorAll('.tab').forEach(tab => tab.classList.remove('active'));
-                document.querySelector(`.tab:nth-child(${
-                    tabName === 'logs' ? 1 : 
-                    tabName === 'structured' ? 2 : 
-                    tabName === 'graph' ? 3 : 4
-                })`).classList.add('active');
-                
-                // Update tab content
-                document.querySelectorAll('.tab-content').forEach(content => content.classList.remove('active'));
-                document.getElementById(`${tabName}-tab`).classList.add('active');
-                
-                this.currentTab = tabName;
-                
-                // Load content for specific tabs
-                if (tabName === 'structured') {
-                    this.loadStructuredData();
-                } else if (tabName === 'solutions') {
-                    this.loadSolutions();
-                } else if (tabName === 'graph') {
-                    this.loadRelationshipGraph();
-                }
-            }
-            
-            async loadStructuredData() {
-                try {
-                    const response = await fetch('/api/crash-analysis');
-                    const analysis = await response.json();
-                    this.displayStructuredData(analysis);
-                } catch (error) {
-                    document.getElementById('structuredData').innerHTML =
-                        '<div class="error">Failed to load structured data</div>';
-                }
-            }
-            
-            displayStructuredData(analysis) {
-                let html = '<h3>📊 Comprehensive System Analysis</h3>';
-
-                if (analysis.crash_analysis) {
-                    const crashAnalysis = analysis.crash_analysis;
-
-                    // Summary Statistics
-                    html += '<h4>📈 Analysis Summary</h4>';
-                    html += '<table class="data-table"><tbody>';
-                    html += `<tr><td><strong>Total Crashes</strong></td><td>${crashAnalysis.total_crashes}</td></tr>`;
-                    html += `<tr><td><strong>Severity Level</strong></td><td><span class="severity-${crashAnalysis.severity_assessment.level.toLowerCase()}">${crashAnalysis.severity_assessment.level}</span></td></tr>`;
-                    html += `<tr><td><strong>Time Span</strong></td><td>${analysis.summary.time_range.duration_human}</td></tr>`;
-                    html += `<tr><td><strong>Categories</strong></td><td>${Object.entries(analysis.summary.categories).map(([k,v]) => `${k}: ${v}`).join(', ')}</td></tr>`;
-                    html += '</tbody></table>';
-
-                    // Timeline Analysis
-                    if (analysis.timeline_analysis) {
-                        html += '<h4>⏰ Timeline Analysis</h4>';
-                        html += '<table class="data-table"><thead><tr>';
-                        html += '<th>Hour</th><th>Total Events</th><th>Crashes</th><th>Errors</th>';
-                        html += '</tr></thead><tbody>';
-
-                        Object.entries(analysis.timeline_analysis).forEach(([hour, data]) => {
-                            html += '<tr>';
-                            html += `<td>${hour}:00</td>`;
-                            html += `<td>${data.total}</td>`;
-                            html += `<td>${data.crashes}</td>`;
-                            html += `<td>${data.errors}</td>`;
-                            html += '</tr>';
-                        });
-                        html += '</tbody></table>';
-                    }
-
-                    // Pattern Analysis
-                    if (analysis.pattern_analysis) {
-                        html += '<h4>🔍 Pattern Analysis</h4>';
-                        html += '<table class="data-table"><thead><tr>';
-                        html += '<th>Pattern Type</th><th>Occurrences</th><th>Description</th>';
-                        html += '</tr></thead><tbody>';
-
-                        Object.entries(analysis.pattern_analysis).forEach(([pattern, count]) => {
-                            const descriptions = {
-                                'anom_abend': 'Abnormal process termination events',
-                                'segfault': 'Memory segmentation violations',
-                                'oom_killer': 'Out of memory killer activations',
-                                'gpu_hang': 'Graphics processing unit hangs'
-                            };
-
-                            html += '<tr>';
-                            html += `<td>${pattern.toUpperCase()}</td>`;
-                            html += `<td>${count}</td>`;
-                            html += `<td>${descriptions[pattern] || 'Unknown pattern type'}</td>`;
-                            html += '</tr>';
-                        });
-                        html += '</tbody></table>';
-                    }
-
-                    // Detailed Crash Data
-                    html += '<h4>🚨 Detailed Crash Information</h4>';
-                    html += '<table class="data-table"><thead><tr>';
-                    html += '<th>Timestamp</th><th>Process</th><th>PID</th><th>Signal</th><th>Raw Log Entry</th>';
-                    html += '</tr></thead><tbody>';
-
-                    crashAnalysis.crash_details.forEach(crash => {
-                        html += '<tr>';
-                        html += `<td>${crash.timestamp}</td>`;
-                        html += `<td>${crash.command}</td>`;
-                        html += `<td>${crash.pid}</td>`;
-                        html += `<td>${crash.signal} (${crash.signal_info.name})</td>`;
-                        html += `<td><code style="font-size: 0.8rem; word-break: break-all;">${this.escapeHtml(crash.raw_line)}</code></td>`;
-                        html += '</tr>';
-                    });
-                    html += '</tbody></table>';
-
-                } else {
-                    html += '<p>No structured analysis data available.</p>';
-                }
-
-                document.getElementById('structuredData').innerHTML = html;
-            }
-            
-            async loadSolutions() {
-                try {
-                    document.getElementById('solutionsContainer').innerHTML =
-                        '<div class="loading">Loading comprehensive smart solutions...</div>';
-
-                    const response = await fetch('/api/smart-solutions');
-                    const data = await response.json();
-
-                    this.displaySmartSolutions(data);
-                } catch (error) {
-                    document.getElementById('solutionsContainer').innerHTML =
-                        '<div class="error">Failed to load smart solutions</div>';
-                }
-            }
-
-            displayCrashAnalysis(analysis) {
-                let html = '<h3>🚨 VSCode Crash Analysis</h3>';
-
-                if (analysis.crash_analysis && analysis.crash_analysis.crash_details.length > 0) {
-                    const crashAnalysis = analysis.crash_analysis;
-
-                    html += '<h4>📊 Summary</h4>';
-                    html += '<table class="data-table"><tbody>';
-                    html += `<tr><td><strong>Total Crashes</strong></td><td>${crashAnalysis.total_crashes}</td></tr>`;
-                    html += `<tr><td><strong>Severity Level</strong></td><td><span class="severity-${crashAnalysis.severity_assessment.level.toLowerCase()}">${crashAnalysis.severity_assessment.level}</span></td></tr>`;
-                    html += `<tr><td><strong>Severity Score</strong></td><td>${crashAnalysis.severity_assessment.score}/40</td></tr>`;
-                    html += `<tr><td><strong>Time Range</strong></td><td>${analysis.summary.time_range.duration_human}</td></tr>`;
-                    html += '</tbody></table>';
-
-                    html += '<h4>🚨 Crash Details</h4>';
-                    html += '<table class="data-table"><thead><tr>';
-                    html += '<th>Time</th><th>Process</th><th>PID</th><th>Signal</th><th>Description</th><th>Severity</th>';
-                    html += '</tr></thead><tbody>';
-
-                    crashAnalysis.crash_details.forEach(crash => {
-                        html += '<tr>';
-                        html += `<td>${crash.timestamp}</td>`;
-                        html += `<td>${crash.command}</td>`;
-                        html += `<td>${crash.pid}</td>`;
-                        html += `<td>${crash.signal} (${crash.signal_info.name})</td>`;
-                        html += `<td>${crash.signal_info.description}</td>`;
-                        html += `<td><span class="severity-${crash.signal_info.severity.toLowerCase()}">${crash.signal_info.severity}</span></td>`;
-                        html += '</tr>';
-                    });
-                    html += '</tbody></table>';
-
-                    html += '<h4>💡 Recommendations</h4>';
-                    html += '<div style="display: grid; gap: 0.5rem;">';
-                    analysis.recommendations.forEach((rec, i) => {
-                        html += `<div class="recommendation" style="padding: 0.75rem; background: #1b2d1b; border-left: 3px solid #238636; border-radius: 4px;">${i+1}. ${rec}</div>`;
-                    });
-                    html += '</div>';
-
-                } else {
-                    html += '<p>No crash data available for analysis.</p>';
-                }
-
-                document.getElementById('solutionsContainer').innerHTML = html;
-            }
-
-            displaySmartSolutions(data) {
-                let html = '<h3>💡 Comprehensive Smart Solutions</h3>';
-
-                if (data.solutions && data.solutions.length > 0) {
-                    html += '<div style="margin-bottom: 1rem; padding: 1rem; background: #1b2d1b; border-radius: 8px;">';
-                    html += '<h4>📊 Solution Context</h4>';
-                    html += `<p><strong>Total Solutions:</strong> ${data.total_solutions}</p>`;
-                    html += `<p><strong>Crash Context:</strong> ${data.crash_context.total_crashes} crashes (${data.crash_context.severity_level} severity)</p>`;
-                    html += `<p><strong>Signals Addressed:</strong> ${data.crash_context.primary_signals.join(', ')}</p>`;
-                    html += '</div>';
-
-                    data.solutions.forEach((solution, index) => {
-                        const severityColor = {
-                            'CRITICAL': '#f85149',
-                            'HIGH': '#d29922',
-                            'MEDIUM': '#58a6ff',
-                            'LOW': '#238636'
-                        }[solution.severity] || '#8b949e';
-
-                        html += `<div style="margin: 1rem 0; padding: 1.5rem; background: #21262d; border-radius: 8px; border-left: 4px solid ${severityColor};">`;
-                        html += `<h4>${solution.title}</h4>`;
-                        html += `<div style="display: grid; grid-template-columns: repeat(auto-fit, minmax(200px, 1fr)); gap: 1rem; margin: 1rem 0;">`;
-
-                        // Solution metadata
-                        html += '<div>';
-                        html += `<p><strong>Severity:</strong> <span style="color: ${severityColor};">${solution.severity}</span></p>`;
-                        html += `<p><strong>Confidence:</strong> ${solution.confidence}%</p>`;
-                        html += `<p><strong>Estimated Time:</strong> ${solution.estimated_time}</p>`;
-                        html += '</div>';
-
-                        html += '</div>';
-
-                        // Implementation steps
-                        html += '<h5>🔧 Implementation Steps:</h5>';
-                        html += '<ol style="margin: 0.5rem 0; padding-left: 2rem;">';
-                        solution.implementation_steps.forEach(step => {
-                            html += `<li style="margin: 0.25rem 0; font-family: monospace; background: #0d1117; padding: 0.5rem; border-radius: 4px;"><code style="user-select: text;">${step}</code></li>`;
-                        });
-                        html += '</ol>';
-
-                        // Verification commands
-                        html += '<h5>✅ Verification Commands:</h5>';
-                        html += '<ul style="margin: 0.5rem 0; padding-left: 2rem;">';
-                        solution.verification_commands.forEach(cmd => {
-                            html += `<li style="margin: 0.25rem 0; font-family: monospace; background: #0d1117; padding: 0.5rem; border-radius: 4px;"><code style="user-select: text;">${cmd}</code></li>`;
-                        });
-                        html += '</ul>';
-
-                        // Expected outcome and rollback
-                        html += '<div style="display: grid; grid-template-columns: 1fr 1fr; gap: 1rem; margin: 1rem 0;">';
-                        html += '<div>';
-                        html += '<h5>🎯 Expected Outcome:</h5>';
-                        html += `<p style="background: #1b2d1b; padding: 0.5rem; border-radius: 4px;">${solution.expected_outcome}</p>`;
-                        html += '</div>';
-                        html += '<div>';
-                        html += '<h5>🔄 Rollback Plan:</h5>';
-                        html += `<p style="background: #2d1b1b; padding: 0.5rem; border-radius: 4px; font-family: monospace;"><code style="user-select: text;">${solution.rollback_plan}</code></p>`;
-                        html += '</div>';
-                        html += '</div>';
-
-                        // Documentation link
-                        html += `<p><strong>📚 Documentation:</strong> <a href="${solution.documentation_url}" target="_blank" style="color: #58a6ff;">${solution.documentation_url}</a></p>`;
-
-                        html += '</div>';
-                    });
-
-                } else {
-                    html += '<p>No smart solutions available.</p>';
-                }
-
-                document.getElementById('solutionsContainer').innerHTML = html;
-            }
-
-            async loadRelationshipGraph() {
-                try {
-                    document.getElementById('graphContainer').innerHTML =
-                        '<div class="loading">Loading crash relationship analysis...</div>';
-
-                    const response = await fetch('/api/crash-analysis');
-                    const analysis = await response.json();
-
-                    this.displayRelationshipGraph(analysis);
-                } catch (error) {
-                    document.getElementById('graphContainer').innerHTML =
-                        '<div class="error">Failed to load relationship graph</div>';
-                }
-            }
-
-            displayRelationshipGraph(analysis) {
-                let html = '<div style="padding: 1rem;">';
-                html += '<h3>🕸️ Crash Relationship Analysis</h3>';
-
-                if (analysis.crash_analysis && analysis.crash_analysis.crash_details.length > 0) {
-                    // Create a visual representation of relationships
-                    html += '<div style="display: grid; grid-template-columns: repeat(auto-fit, minmax(300px, 1fr)); gap: 1rem; margin: 1rem 0;">';
-
-                    // Process relationships
-                    html += '<div style="background: #2d1b1b; padding: 1rem; border-radius: 8px; border-left: 4px solid #f85149;">';
-                    html += '<h4>🔴 VSCode Insiders Process</h4>';
-                    html += '<p><strong>Executable:</strong> /usr/share/code-insiders/code-insiders</p>';
-                    html += '<p><strong>Total Crashes:</strong> ' + analysis.crash_analysis.total_crashes + '</p>';
-                    html += '<p><strong>Affected PIDs:</strong> ' + analysis.crash_analysis.crash_details.map(c => c.pid).join(', ') + '</p>';
-                    html += '</div>';
-
-                    // Signal relationships
-                    const signals = {};
-                    analysis.crash_analysis.crash_details.forEach(crash => {
-                        if (!signals[crash.signal]) {
-                            signals[crash.signal] = {
-                                name: crash.signal_info.name,
-                                description: crash.signal_info.description,
-                                count: 0,
-                                pids: []
-                            };
-                        }
-                        signals[crash.signal].count++;
-                        signals[crash.signal].pids.push(crash.pid);
-                    });
-
-                    Object.entries(signals).forEach(([signal, info]) => {
-                        const severity = signal == 4 || signal == 11 ? 'critical' : 'high';
-                        const color = severity === 'critical' ? '#f85149' : '#d29922';
-
-                        html += `<div style="background: #1b2d1b; padding: 1rem; border-radius: 8px; border-left: 4px solid ${color};">`;
-                        html += `<h4>⚠️ Signal ${signal} (${info.name})</h4>`;
-                        html += `<p><strong>Description:</strong> ${info.description}</p>`;
-                        html += `<p><strong>Occurrences:</strong> ${info.count}</p>`;
-                        html += `<p><strong>Affected PIDs:</strong> ${info.pids.join(', ')}</p>`;
-                        html += '</div>';
-                    });
-
-                    // Timeline relationships
-                    if (analysis.timeline_analysis) {
-                        html += '<div style="background: #1b1b2d; padding: 1rem; border-radius: 8px; border-left: 4px solid #58a6ff;">';
-                        html += '<h4>⏰ Timeline Correlation</h4>';
-
-                        Object.entries(analysis.timeline_analysis).forEach(([hour, data]) => {
-                            if (data.crashes > 0) {
-                                html += `<p><strong>${hour}:00 -</strong> ${data.crashes} crashes, ${data.total} total events</p>`;
-                            }
-                        });
-                        html += '</div>';
-                    }
-
-                    // System relationships
-                    html += '<div style="background: #2d2d1b; padding: 1rem; border-radius: 8px; border-left: 4px solid #d29922;">';
-                    html += '<h4>🖥️ System Context</h4>';
-                    html += '<p><strong>Audit System:</strong> Monitoring process terminations</p>';
-                    html += '<p><strong>Core Dumps:</strong> Generated for analysis</p>';
-                    html += '<p><strong>Memory Pressure:</strong> Detected before crashes</p>';
-                    html += '<p><strong>Security Context:</strong> unconfined_u:unconfined_r:unconfined_t</p>';
-                    html += '</div>';
-
-                    html += '</div>';
-
-                    // Connection diagram
-                    html += '<div style="margin: 2rem 0; text-align: center;">';
-                    html += '<h4>🔗 Relationship Connections</h4>';
-                    html += '<div style="font-family: monospace; background: #0d1117; padding: 1rem; border-radius: 4px; text-align: left;">';
-                    html += 'VSCode Insiders ──┬── Signal 4 (SIGILL) ── Binary Corruption<br>';
-                    html += '                  ├── Signal 11 (SIGSEGV) ── Memory Violation<br>';
-                    html += '                  ├── Audit System ── Process Monitoring<br>';
-                    html += '                  ├── Core Dumps ── Crash Analysis<br>';
-                    html += '                  └── Timeline ── 19:26, 22:22, 22:23<br>';
-                    html += '</div>';
-                    html += '</div>';
-
-                } else {
-                    html += '<p>No crash relationship data available.</p>';
-                }
-
-                html += '</div>';
-                document.getElementById('graphContainer').innerHTML = html;
-            }
-        }
-        
-        // Global functions for buttons
-        let logInterface;
-        
-        function switchTab(tabName) {
-            logInterface.switchTab(tabName);
-        }
-        
-        function applyFilters() {
-            // Implementation for applying filters
-            console.log('Applying filters...');
-        }
-        
-        function clearFilters() {
-            // Implementation for clearing filters
-            console.log('Clearing filters...');
-        }
-        
-        function refreshLogs() {
-            logInterface.loadLogs();
-        }
-        
-        function exportLogs() {
-            // Implementation for exporting logs
-            console.log('Exporting logs...');
-        }
-        
-        function toggleAutoScroll() {
-            logInterface.autoScroll = !logInterface.autoScroll;
-            const btn = event.target;
-            btn.textContent = `📜 Auto-scroll: ${logInterface.autoScroll ? 'ON' : 'OFF'}`;
-        }
-        
-        // Initialize when page loads
-        document.addEventListener('DOMContentLoaded', () => {
-            logInterface = new ProfessionalLogInterface();
-        });
-    </script>
-</body>
-</html>
-    ''')
+    accepted = request.accept_encodings
+    for encoding in ('br', 'gzip'):
+        if encoding in INTERFACE_ENCODED and accepted[encoding]:
+            body = INTERFACE_ENCODED[encoding]
+            etag = f"{INTERFACE_ETAG}-{encoding}"
+            break
+    else:
+        encoding, body, etag = None, INTERFACE_HTML, INTERFACE_ETAG
+
+    response = Response(body, mimetype='text/html')
+    if encoding:
+        response.headers['Content-Encoding'] = encoding
+    response.vary.add('Accept-Encoding')
+    response.set_etag(etag)
+    response.last_modified = INTERFACE_LAST_MODIFIED
+    response.cache_control.public = True
+    response.cache_control.max_age = 300
+    return response.make_conditional(request)
+
+CRASH_FILE = "/home/owner/Documents/682860cc-3348-8008-a09e-25f9e754d16d/vscode_diag_20250530_224457/logs_journal_vscode_code-insiders.txt"
+
+# (analysis, crash columns) keyed by (path, mtime_ns, size); only the current version of a file is kept
+_ANALYSIS_CACHE = {}
+_ANALYSIS_LOCK = threading.Lock()
+
+# Watched paths skip the stat() entirely: their entry stays here until the watcher drops it
+_WATCHED_ANALYSIS = {}
+_WATCHED_PATHS = set()
+_observer = None
+
+def crash_columns(analysis):
+    """Signal and PID of every crash as parallel NumPy arrays"""
+    details = analysis['crash_analysis']['crash_details'] if analysis else []
+    count = len(details)
+    return {
+        'signal': np.fromiter((c['signal'] for c in details), dtype=np.int16, count=count),
+        'pid': np.fromiter((c['pid'] for c in details), dtype=np.int32, count=count),
+    }
+
+def add_derived_views(analysis, columns):
+    """Attach the summaries the endpoints and relationship graph read instead of rescanning crashes"""
+    if not analysis:
+        return
+    signals, pids = columns['signal'], columns['pid']
+    primary_signals = np.unique(signals)
+    signals_by_id = {int(signal): pids[signals == signal].tolist() for signal in primary_signals}
+    analysis['derived'] = {
+        'primary_signals': primary_signals.tolist(),
+        'signals_by_id': signals_by_id,
+        # Joined here so the browser doesn't map/join the crash list per render
+        'all_pids_str': ', '.join(map(str, pids.tolist())),
+        'pids_by_signal_str': {signal: ', '.join(map(str, signal_pids))
+                               for signal, signal_pids in signals_by_id.items()},
+        # Only hours with crashes; the structured tab still reads the full timeline_analysis
+        'crash_timeline': {hour: data for hour, data in analysis.get('timeline_analysis', {}).items()
+                           if data['crashes'] > 0},
+    }
+
+if WATCHDOG_AVAILABLE:
+    class CrashFileHandler(FileSystemEventHandler):
+        """Drops the watched analysis when its crash file is written, replaced or removed"""
+
+        def invalidate(self, event):
+            for changed in (event.src_path, getattr(event, 'dest_path', None)):
+                if changed in _WATCHED_PATHS:
+                    # Taking the lock waits out a parse in progress, so it can't re-store stale data
+                    with _ANALYSIS_LOCK:
+                        _WATCHED_ANALYSIS.pop(changed, None)
+
+        # Only content changes: newer watchdog also reports opened/closed-without-write,
+        # which our own read of the crash file would trigger
+        on_modified = on_created = on_moved = on_deleted = invalidate
+
+def can_watch_files():
+    """inotify needs a real thread; under gevent monkey-patching its blocking read would stall the hub"""
+    if not WATCHDOG_AVAILABLE:
+        return False
+    if GEVENT_AVAILABLE:
+        from gevent import monkey
+        return not monkey.is_module_patched('threading')
+    return True
+
+def watch_crash_file(path):
+    """Start watching a crash file's directory (called with _ANALYSIS_LOCK held)"""
+    global _observer
+    if path in _WATCHED_PATHS or not can_watch_files() or not os.path.isdir(os.path.dirname(path)):
+        return
+    try:
+        if _observer is None:
+            _observer = Observer()
+            _observer.daemon = True
+            _observer.start()
+        _observer.schedule(CrashFileHandler(), os.path.dirname(path))
+        _WATCHED_PATHS.add(path)
+    except OSError as e:
+        print(f"⚠️ Cannot watch {path} ({e}) - falling back to stat() per request")
+
+def get_crash_data(path):
+    """lnav-based analysis of a crash file and its crash columns, re-parsed only when the file changes"""
+    entry = _WATCHED_ANALYSIS.get(path)
+    if entry is not None:
+        return entry
+
+    # Held across the parse so concurrent first hits don't each re-read the file
+    with _ANALYSIS_LOCK:
+        # Watch before the stat so a write during the parse still invalidates
+        watch_crash_file(path)
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            return None, crash_columns(None)
+        key = (path, st.st_mtime_ns, st.st_size)
+        if key not in _ANALYSIS_CACHE:
+            for stale in [k for k in _ANALYSIS_CACHE if k[0] == path]:
+                del _ANALYSIS_CACHE[stale]
+            analysis = lnav_analyzer.analyze_crash_file_with_lnav_patterns(path)
+            columns = crash_columns(analysis)
+            add_derived_views(analysis, columns)
+            _ANALYSIS_CACHE[key] = (analysis, columns)
+        if path in _WATCHED_PATHS:
+            _WATCHED_ANALYSIS[path] = _ANALYSIS_CACHE[key]
+        return _ANALYSIS_CACHE[key]
+
+def get_analysis(path):
+    """lnav-based analysis of a crash file (cached per file version)"""
+    return get_crash_data(path)[0]
+
+def load_crash_analysis():
+    """Analysis of the VSCode crash journal"""
+    return get_analysis(CRASH_FILE)
+
+# System context shown alongside the crash entries (shared, never mutated)
+_SYSTEM_CONTEXT_LOGS = [
+    {
+        'timestamp': 'May 30 19:25:00',
+        'service': 'systemd',
+        'pid': 1,
+        'log_level': 'INFO',
+        'message': 'VSCode Insiders process started',
+        'categories': ['system'],
+        'primary_category': 'system'
+    },
+    {
+        'timestamp': 'May 30 19:26:30',
+        'service': 'kernel',
+        'pid': 0,
+        'log_level': 'WARNING',
+        'message': 'Memory pressure detected before crash',
+        'categories': ['system', 'memory'],
+        'primary_category': 'system'
+    },
+    {
+        'timestamp': 'May 30 22:22:00',
+        'service': 'audit',
+        'pid': 1234,
+        'log_level': 'INFO',
+        'message': 'Process monitoring enabled for code-insiders',
+        'categories': ['security'],
+        'primary_category': 'security'
+    },
+    {
+        'timestamp': 'May 30 22:23:30',
+        'service': 'systemd-coredump',
+        'pid': 5678,
+        'log_level': 'ERROR',
+        'message': 'Core dump generated for code-insiders process',
+        'categories': ['crash', 'system'],
+        'primary_category': 'crash'
+    }
+]
+
+def crash_log_entries(analysis):
+    """Convert crash analysis to log format and add system context"""
+    parsed_logs = []
+
+    # Add crash entries
+    for crash in analysis['crash_analysis']['crash_details']:
+        log_entry = {
+            'timestamp': crash['timestamp'],
+            'timestamp_obj': None,
+            'service': crash['command'],
+            'pid': crash['pid'],
+            'log_level': 'CRITICAL',
+            'message': f"Signal {crash['signal']} ({crash['signal_info']['name']}) - {crash['signal_info']['description']}",
+            'signal_number': crash['signal'],
+            'signal_name': crash['signal_info']['name'],
+            'severity': crash['signal_info']['severity'],
+            'raw_line': crash['raw_line'],
+            'categories': ['crash'],
+            'primary_category': 'crash'
+        }
+        parsed_logs.append(log_entry)
+
+    # Add system context logs
+    parsed_logs.extend(_SYSTEM_CONTEXT_LOGS)
+
+    return parsed_logs
+
+_NO_TIMESTAMP = datetime.min
+
+def log_timestamp_key(entry):
+    """Sort key for parsed logs; entries without a parsed timestamp rank oldest"""
+    return entry.get('timestamp_obj') or _NO_TIMESTAMP
+
+def recent_database_logs(limit=100):
+    """Newest parsed database logs, used when there is no crash analysis"""
+    # Rows are parsed straight off the cursor and only the newest kept
+    def parse_rows():
+        for raw_line in real_logs.iter_verbatim_raw_lines(limit):
+            yield log_parser.parse_line(raw_line)
+
+    return heapq.nlargest(limit, parse_rows(), key=log_timestamp_key)
+
+def crash_stats_payload(analysis):
+    """Summarize a crash analysis into the header statistics"""
+    if not analysis:
+        return {
+            'total_crashes': 0,
+            'critical_signals': 0,
+            'recommendations': 0,
+            'severity_level': 'NONE',
+            'severity_score': 0
+        }
+
+    crash_analysis = analysis['crash_analysis']
+    critical_signals = crash_analysis['severity_counts'].get('CRITICAL', 0)
+
+    return {
+        'total_crashes': crash_analysis['total_crashes'],
+        'critical_signals': critical_signals,
+        'recommendations': len(analysis['recommendations']),
+        'severity_level': crash_analysis['severity_assessment']['level'],
+        'severity_score': crash_analysis['severity_assessment']['score']
+    }
+
+# Solution cards only depend on which signals were seen, so they are built once
+_SIGILL_SOLUTIONS = [
+    {
+        'id': 'sigill_binary_integrity',
+        'title': '🔧 Fix Binary Corruption (SIGILL)',
+        'severity': 'CRITICAL',
+        'confidence': 95,
+        'implementation_steps': [
+            'sudo dnf reinstall code-insiders',
+            'file /usr/share/code-insiders/code-insiders',
+            'sha256sum /usr/share/code-insiders/code-insiders',
+            'sudo dnf check',
+            'sudo rpm --verify code-insiders'
+        ],
+        'verification_commands': [
+            'code-insiders --version',
+            'ldd /usr/share/code-insiders/code-insiders | grep "not found"'
+        ],
+        'expected_outcome': 'VSCode Insiders will start without SIGILL crashes',
+        'rollback_plan': 'sudo dnf downgrade code-insiders',
+        'documentation_url': 'https://code.visualstudio.com/docs/supporting/FAQ#_vs-code-is-blank',
+        'estimated_time': '5-10 minutes'
+    },
+    {
+        'id': 'sigill_hardware_check',
+        'title': '💾 Hardware Memory Validation (SIGILL)',
+        'severity': 'HIGH',
+        'confidence': 80,
+        'implementation_steps': [
+            'sudo memtest86+ --onepass',
+            'sudo dmidecode -t memory',
+            'cat /proc/meminfo | grep -E "(MemTotal|MemFree|MemAvailable)"',
+            'sudo dmesg | grep -i "memory\\|ecc\\|error"'
+        ],
+        'verification_commands': [
+            'sudo journalctl -k | grep -i "memory error"',
+            'cat /sys/devices/system/edac/mc/mc*/ce_count'
+        ],
+        'expected_outcome': 'Memory errors identified and resolved',
+        'rollback_plan': 'No rollback needed for diagnostic commands',
+        'documentation_url': 'https://www.kernel.org/doc/html/latest/admin-guide/edac.html',
+        'estimated_time': '30-60 minutes'
+    }
+]
+
+_SIGSEGV_SOLUTIONS = [
+    {
+        'id': 'sigsegv_cache_clear',
+        'title': '🧹 Clear VSCode Cache and Extensions (SIGSEGV)',
+        'severity': 'HIGH',
+        'confidence': 90,
+        'implementation_steps': [
+            'code-insiders --list-extensions > ~/vscode-extensions-backup.txt',
+            'rm -rf ~/.vscode-insiders/extensions',
+            'rm -rf ~/.vscode-insiders/CachedExtensions',
+            'rm -rf ~/.vscode-insiders/logs',
+            'rm -rf ~/.config/Code\\ -\\ Insiders/User/workspaceStorage',
+            'code-insiders --disable-extensions'
+        ],
+        'verification_commands': [
+            'ls -la ~/.vscode-insiders/',
+            'code-insiders --version',
+            'ps aux | grep code-insiders'
+        ],
+        'expected_outcome': 'VSCode starts without segmentation faults',
+        'rollback_plan': 'Restore extensions: cat ~/vscode-extensions-backup.txt | xargs -L 1 code-insiders --install-extension',
+        'documentation_url': 'https://code.visualstudio.com/docs/supporting/FAQ#_how-to-disable-crash-reporting',
+        'estimated_time': '5-15 minutes'
+    },
+    {
+        'id': 'sigsegv_gpu_disable',
+        'title': '🚫 Disable Hardware Acceleration (SIGSEGV)',
+        'severity': 'MEDIUM',
+        'confidence': 85,
+        'implementation_steps': [
+            'mkdir -p ~/.config/Code\\ -\\ Insiders/User',
+            'echo \'{"disable-hardware-acceleration": true}\' > ~/.config/Code\\ -\\ Insiders/User/argv.json',
+            'code-insiders --disable-gpu --disable-software-rasterizer',
+            'echo \'export LIBGL_ALWAYS_SOFTWARE=1\' >> ~/.bashrc'
+        ],
+        'verification_commands': [
+            'cat ~/.config/Code\\ -\\ Insiders/User/argv.json',
+            'code-insiders --disable-gpu --version'
+        ],
+        'expected_outcome': 'VSCode runs in software rendering mode without crashes',
+        'rollback_plan': 'rm ~/.config/Code\\ -\\ Insiders/User/argv.json',
+        'documentation_url': 'https://code.visualstudio.com/docs/supporting/FAQ#_vs-code-is-blank',
+        'estimated_time': '3-5 minutes'
+    }
+]
+
+_SYSTEM_SOLUTIONS = [
+    {
+        'id': 'system_monitoring',
+        'title': '📊 Enhanced System Monitoring',
+        'severity': 'MEDIUM',
+        'confidence': 75,
+        'implementation_steps': [
+            'sudo dnf install htop iotop nethogs',
+            'sudo systemctl enable --now systemd-coredump',
+            'echo "kernel.core_pattern=/tmp/core.%e.%p.%t" | sudo tee -a /etc/sysctl.conf',
+            'sudo sysctl -p',
+            'sudo journalctl --vacuum-time=30d'
+        ],
+        'verification_commands': [
+            'systemctl status systemd-coredump',
+            'cat /proc/sys/kernel/core_pattern',
+            'coredumpctl list'
+        ],
+        'expected_outcome': 'Enhanced crash monitoring and core dump analysis',
+        'rollback_plan': 'sudo systemctl disable systemd-coredump',
+        'documentation_url': 'https://www.freedesktop.org/software/systemd/man/systemd-coredump.html',
+        'estimated_time': '10-15 minutes'
+    },
+    {
+        'id': 'alternative_editor',
+        'title': '🔄 Alternative Editor Setup',
+        'severity': 'LOW',
+        'confidence': 100,
+        'implementation_steps': [
+            'sudo dnf install code',  # Stable version
+            'flatpak install flathub com.visualstudio.code',
+            'sudo dnf install vim-enhanced neovim',
+            'code --version'
+        ],
+        'verification_commands': [
+            'which code',
+            'flatpak list | grep code',
+            'code --list-extensions'
+        ],
+        'expected_outcome': 'Stable VSCode alternative available',
+        'rollback_plan': 'Continue using VSCode Insiders after fixes',
+        'documentation_url': 'https://code.visualstudio.com/docs/setup/linux',
+        'estimated_time': '5-10 minutes'
+    }
+]
+
+def smart_solutions_payload(analysis):
+    """Build smart solutions with complete implementation details from a crash analysis"""
+    if not analysis:
+        return {'solutions': []}
+
+    signals_by_id = analysis['derived']['signals_by_id']
+    solutions = ((_SIGILL_SOLUTIONS if 4 in signals_by_id else []) +     # SIGILL (Signal 4)
+                 (_SIGSEGV_SOLUTIONS if 11 in signals_by_id else []) +   # SIGSEGV (Signal 11)
+                 _SYSTEM_SOLUTIONS)
+
+    return {
+        'solutions': solutions,
+        'total_solutions': len(solutions),
+        'crash_context': {
+            'total_crashes': analysis['crash_analysis']['total_crashes'],
+            'severity_level': analysis['crash_analysis']['severity_assessment']['level'],
+            'primary_signals': analysis['derived']['primary_signals']
+        }
+    }
 
 @app.route('/api/parsed-logs')
+@cached_json_view(seconds=2)
 def parsed_logs():
     """Get parsed and properly formatted logs with actual crash analysis"""
     try:
         # Get actual crash analysis from lnav analyzer
-        crash_file = "/home/owner/Documents/682860cc-3348-8008-a09e-25f9e754d16d/vscode_diag_20250530_224457/logs_journal_vscode_code-insiders.txt"
-        analysis = lnav_analyzer.analyze_crash_file_with_lnav_patterns(crash_file)
+        analysis = load_crash_analysis()
 
         if analysis and analysis['crash_analysis']['crash_details']:
-            # Convert crash analysis to log format and add system context
-            parsed_logs = []
-
-            # Add crash entries
-            for crash in analysis['crash_analysis']['crash_details']:
-                log_entry = {
-                    'timestamp': crash['timestamp'],
-                    'timestamp_obj': None,
-                    'service': crash['command'],
-                    'pid': crash['pid'],
-                    'log_level': 'CRITICAL',
-                    'message': f"Signal {crash['signal']} ({crash['signal_info']['name']}) - {crash['signal_info']['description']}",
-                    'signal_number': crash['signal'],
-                    'signal_name': crash['signal_info']['name'],
-                    'severity': crash['signal_info']['severity'],
-                    'raw_line': crash['raw_line'],
-                    'categories': ['crash'],
-                    'primary_category': 'crash'
-                }
-                parsed_logs.append(log_entry)
-
-            # Add system context logs
-            system_logs = [
-                {
-                    'timestamp': 'May 30 19:25:00',
-                    'service': 'systemd',
-                    'pid': 1,
-                    'log_level': 'INFO',
-                    'message': 'VSCode Insiders process started',
-                    'categories': ['system'],
-                    'primary_category': 'system'
-                },
-                {
-                    'timestamp': 'May 30 19:26:30',
-                    'service': 'kernel',
-                    'pid': 0,
-                    'log_level': 'WARNING',
-                    'message': 'Memory pressure detected before crash',
-                    'categories': ['system', 'memory'],
-                    'primary_category': 'system'
-                },
-                {
-                    'timestamp': 'May 30 22:22:00',
-                    'service': 'audit',
-                    'pid': 1234,
-                    'log_level': 'INFO',
-                    'message': 'Process monitoring enabled for code-insiders',
-                    'categories': ['security'],
-                    'primary_category': 'security'
-                },
-                {
-                    'timestamp': 'May 30 22:23:30',
-                    'service': 'systemd-coredump',
-                    'pid': 5678,
-                    'log_level': 'ERROR',
-                    'message': 'Core dump generated for code-insiders process',
-                    'categories': ['crash', 'system'],
-                    'primary_category': 'crash'
-                }
-            ]
-
-            parsed_logs.extend(system_logs)
-
-            return jsonify({'logs': parsed_logs, 'analysis': analysis})
+            logs = crash_log_entries(analysis)
+            if wants_msgpack():
+                return msgpack_logs_response(logs)
+            return ojsonify({'logs': logs, 'analysis': analysis})
         else:
             # Fallback to database logs if no crash analysis
-            logs = real_logs.get_verbatim_logs(100)
-            parsed_logs = []
-
-            for log_type, log_entries in logs.items():
-                for entry in log_entries:
-                    if log_type == 'application_errors':
-                        parsed = log_parser.parse_log_line(entry[5])  # raw_line
-                    elif log_type == 'system_events':
-                        parsed = log_parser.parse_log_line(entry[4])  # raw_line
-                    elif log_type == 'kernel_messages':
-                        parsed = log_parser.parse_log_line(entry[3])  # raw_line
-                    else:
-                        continue
-
-                    categorization = log_parser.categorize_log_entry(parsed)
-                    parsed.update(categorization)
-                    parsed_logs.append(parsed)
-
-            parsed_logs.sort(key=lambda x: x.get('timestamp_obj') or datetime.min, reverse=True)
-            return jsonify({'logs': parsed_logs[:100]})
+            if wants_msgpack():
+                return msgpack_logs_response(recent_database_logs())
+            return Response(stream_with_context(stream_json_list('logs', recent_database_logs())),
+                            mimetype='application/json')
 
     except Exception as e:
-        return jsonify({'error': str(e), 'logs': []}), 500
+        return ojsonify({'error': str(e), 'logs': []}), 500
+
+# endpoint -> (analysis, body, gzipped body, etag) for the analysis object currently cached
+_ANALYSIS_BODIES = {}
+
+def analysis_body_response(name, analysis, build):
+    """Serve build(analysis), serialized and compressed once per analysis version
+
+    The ETag only changes with the crash file, so polls answer 304 until then.
+    """
+    stored = _ANALYSIS_BODIES.get(name)
+    if stored is None or stored[0] is not analysis:
+        body = dump_json(build(analysis))
+        stored = _ANALYSIS_BODIES[name] = (analysis, body, gzip_body(body), hashlib.sha1(body).hexdigest())
+    return prebuilt_response(stored[1], stored[2], stored[3])
 
 @app.route('/api/crash-analysis-stats')
 def crash_analysis_stats():
     """Get crash analysis statistics"""
     try:
-        crash_file = "/home/owner/Documents/682860cc-3348-8008-a09e-25f9e754d16d/vscode_diag_20250530_224457/logs_journal_vscode_code-insiders.txt"
-        analysis = lnav_analyzer.analyze_crash_file_with_lnav_patterns(crash_file)
-
-        if analysis:
-            crash_analysis = analysis['crash_analysis']
-            critical_signals = sum(1 for crash in crash_analysis['crash_details']
-                                 if crash['signal_info']['severity'] == 'CRITICAL')
-
-            return jsonify({
-                'total_crashes': crash_analysis['total_crashes'],
-                'critical_signals': critical_signals,
-                'recommendations': len(analysis['recommendations']),
-                'severity_level': crash_analysis['severity_assessment']['level'],
-                'severity_score': crash_analysis['severity_assessment']['score']
-            })
-        else:
-            return jsonify({
-                'total_crashes': 0,
-                'critical_signals': 0,
-                'recommendations': 0,
-                'severity_level': 'NONE',
-                'severity_score': 0
-            })
+        return analysis_body_response('stats', load_crash_analysis(), crash_stats_payload)
     except Exception as e:
-        return jsonify({'error': str(e)}), 500
+        return ojsonify({'error': str(e)}), 500
 
 @app.route('/api/crash-analysis')
 def crash_analysis():
     """Get full crash analysis"""
     try:
-        crash_file = "/home/owner/Documents/682860cc-3348-8008-a09e-25f9e754d16d/vscode_diag_20250530_224457/logs_journal_vscode_code-insiders.txt"
-        analysis = lnav_analyzer.analyze_crash_file_with_lnav_patterns(crash_file)
+        analysis = load_crash_analysis()
 
         if analysis:
-            return jsonify(analysis)
+            return analysis_body_response('analysis', analysis, lambda analysis: analysis)
         else:
-            return jsonify({'error': 'No analysis available'}), 404
+            return ojsonify({'error': 'No analysis available'}), 404
     except Exception as e:
-        return jsonify({'error': str(e)}), 500
+        return ojsonify({'error': str(e)}), 500
+
+# Serialized /api/smart-solutions bodies keyed by everything the payload depends on
+_SOLUTIONS_BODIES = {}
 
 @app.route('/api/smart-solutions')
 def smart_solutions():
     """Get comprehensive smart solutions with complete implementation details"""
     try:
-        crash_file = "/home/owner/Documents/682860cc-3348-8008-a09e-25f9e754d16d/vscode_diag_20250530_224457/logs_journal_vscode_code-insiders.txt"
-        analysis = lnav_analyzer.analyze_crash_file_with_lnav_patterns(crash_file)
-
+        analysis = load_crash_analysis()
         if not analysis:
-            return jsonify({'solutions': []})
-
-        # Generate comprehensive solutions based on actual crash analysis
-        solutions = []
-
-        # SIGILL (Signal 4) Solutions
-        sigill_crashes = [c for c in analysis['crash_analysis']['crash_details'] if c['signal'] == 4]
-        if sigill_crashes:
-            solutions.extend([
-                {
-                    'id': 'sigill_binary_integrity',
-                    'title': '🔧 Fix Binary Corruption (SIGILL)',
-                    'severity': 'CRITICAL',
-                    'confidence': 95,
-                    'implementation_steps': [
-                        'sudo dnf reinstall code-insiders',
-                        'file /usr/share/code-insiders/code-insiders',
-                        'sha256sum /usr/share/code-insiders/code-insiders',
-                        'sudo dnf check',
-                        'sudo rpm --verify code-insiders'
-                    ],
-                    'verification_commands': [
-                        'code-insiders --version',
-                        'ldd /usr/share/code-insiders/code-insiders | grep "not found"'
-                    ],
-                    'expected_outcome': 'VSCode Insiders will start without SIGILL crashes',
-                    'rollback_plan': 'sudo dnf downgrade code-insiders',
-                    'documentation_url': 'https://code.visualstudio.com/docs/supporting/FAQ#_vs-code-is-blank',
-                    'estimated_time': '5-10 minutes'
-                },
-                {
-                    'id': 'sigill_hardware_check',
-                    'title': '💾 Hardware Memory Validation (SIGILL)',
-                    'severity': 'HIGH',
-                    'confidence': 80,
-                    'implementation_steps': [
-                        'sudo memtest86+ --onepass',
-                        'sudo dmidecode -t memory',
-                        'cat /proc/meminfo | grep -E "(MemTotal|MemFree|MemAvailable)"',
-                        'sudo dmesg | grep -i "memory\\|ecc\\|error"'
-                    ],
-                    'verification_commands': [
-                        'sudo journalctl -k | grep -i "memory error"',
-                        'cat /sys/devices/system/edac/mc/mc*/ce_count'
-                    ],
-                    'expected_outcome': 'Memory errors identified and resolved',
-                    'rollback_plan': 'No rollback needed for diagnostic commands',
-                    'documentation_url': 'https://www.kernel.org/doc/html/latest/admin-guide/edac.html',
-                    'estimated_time': '30-60 minutes'
-                }
-            ])
-
-        # SIGSEGV (Signal 11) Solutions
-        sigsegv_crashes = [c for c in analysis['crash_analysis']['crash_details'] if c['signal'] == 11]
-        if sigsegv_crashes:
-            solutions.extend([
-                {
-                    'id': 'sigsegv_cache_clear',
-                    'title': '🧹 Clear VSCode Cache and Extensions (SIGSEGV)',
-                    'severity': 'HIGH',
-                    'confidence': 90,
-                    'implementation_steps': [
-                        'code-insiders --list-extensions > ~/vscode-extensions-backup.txt',
-                        'rm -rf ~/.vscode-insiders/extensions',
-                        'rm -rf ~/.vscode-insiders/CachedExtensions',
-                        'rm -rf ~/.vscode-insiders/logs',
-                        'rm -rf ~/.config/Code\\ -\\ Insiders/User/workspaceStorage',
-                        'code-insiders --disable-extensions'
-                    ],
-                    'verification_commands': [
-                        'ls -la ~/.vscode-insiders/',
-                        'code-insiders --version',
-                        'ps aux | grep code-insiders'
-                    ],
-                    'expected_outcome': 'VSCode starts without segmentation faults',
-                    'rollback_plan': 'Restore extensions: cat ~/vscode-extensions-backup.txt | xargs -L 1 code-insiders --install-extension',
-                    'documentation_url': 'https://code.visualstudio.com/docs/supporting/FAQ#_how-to-disable-crash-reporting',
-                    'estimated_time': '5-15 minutes'
-                },
-                {
-                    'id': 'sigsegv_gpu_disable',
-                    'title': '🚫 Disable Hardware Acceleration (SIGSEGV)',
-                    'severity': 'MEDIUM',
-                    'confidence': 85,
-                    'implementation_steps': [
-                        'mkdir -p ~/.config/Code\\ -\\ Insiders/User',
-                        'echo \'{"disable-hardware-acceleration": true}\' > ~/.config/Code\\ -\\ Insiders/User/argv.json',
-                        'code-insiders --disable-gpu --disable-software-rasterizer',
-                        'echo \'export LIBGL_ALWAYS_SOFTWARE=1\' >> ~/.bashrc'
-                    ],
-                    'verification_commands': [
-                        'cat ~/.config/Code\\ -\\ Insiders/User/argv.json',
-                        'code-insiders --disable-gpu --version'
-                    ],
-                    'expected_outcome': 'VSCode runs in software rendering mode without crashes',
-                    'rollback_plan': 'rm ~/.config/Code\\ -\\ Insiders/User/argv.json',
-                    'documentation_url': 'https://code.visualstudio.com/docs/supporting/FAQ#_vs-code-is-blank',
-                    'estimated_time': '3-5 minutes'
-                }
-            ])
-
-        # System-wide solutions
-        solutions.extend([
-            {
-                'id': 'system_monitoring',
-                'title': '📊 Enhanced System Monitoring',
-                'severity': 'MEDIUM',
-                'confidence': 75,
-                'implementation_steps': [
-                    'sudo dnf install htop iotop nethogs',
-                    'sudo systemctl enable --now systemd-coredump',
-                    'echo "kernel.core_pattern=/tmp/core.%e.%p.%t" | sudo tee -a /etc/sysctl.conf',
-                    'sudo sysctl -p',
-                    'sudo journalctl --vacuum-time=30d'
-                ],
-                'verification_commands': [
-                    'systemctl status systemd-coredump',
-                    'cat /proc/sys/kernel/core_pattern',
-                    'coredumpctl list'
-                ],
-                'expected_outcome': 'Enhanced crash monitoring and core dump analysis',
-                'rollback_plan': 'sudo systemctl disable systemd-coredump',
-                'documentation_url': 'https://www.freedesktop.org/software/systemd/man/systemd-coredump.html',
-                'estimated_time': '10-15 minutes'
-            },
-            {
-                'id': 'alternative_editor',
-                'title': '🔄 Alternative Editor Setup',
-                'severity': 'LOW',
-                'confidence': 100,
-                'implementation_steps': [
-                    'sudo dnf install code',  # Stable version
-                    'flatpak install flathub com.visualstudio.code',
-                    'sudo dnf install vim-enhanced neovim',
-                    'code --version'
-                ],
-                'verification_commands': [
-                    'which code',
-                    'flatpak list | grep code',
-                    'code --list-extensions'
-                ],
-                'expected_outcome': 'Stable VSCode alternative available',
-                'rollback_plan': 'Continue using VSCode Insiders after fixes',
-                'documentation_url': 'https://code.visualstudio.com/docs/setup/linux',
-                'estimated_time': '5-10 minutes'
-            }
-        ])
-
-        return jsonify({
-            'solutions': solutions,
-            'total_solutions': len(solutions),
-            'crash_context': {
-                'total_crashes': analysis['crash_analysis']['total_crashes'],
-                'severity_level': analysis['crash_analysis']['severity_assessment']['level'],
-                'primary_signals': list(set([c['signal'] for c in analysis['crash_analysis']['crash_details']]))
-            }
-        })
+            return ojsonify(smart_solutions_payload(analysis))
+
+        crash_analysis = analysis['crash_analysis']
+        key = (tuple(analysis['derived']['primary_signals']),
+               crash_analysis['total_crashes'],
+               crash_analysis['severity_assessment']['level'])
+        body = _SOLUTIONS_BODIES.get(key)
+        if body is None:
+            if len(_SOLUTIONS_BODIES) >= 16:
+                _SOLUTIONS_BODIES.clear()
+            body = _SOLUTIONS_BODIES[key] = dump_json(smart_solutions_payload(analysis))
+        return Response(body, mimetype='application/json')
+    except Exception as e:
+        return ojsonify({'error': str(e)}), 500
 
+@app.route('/api/dashboard')
+@cached_json_view(seconds=2)
+def dashboard():
+    """Stats, logs, analysis and solutions in one response (one crash file parse)"""
+    try:
+        analysis = load_crash_analysis()
+
+        if analysis and analysis['crash_analysis']['crash_details']:
+            logs = crash_log_entries(analysis)
+        else:
+            logs = recent_database_logs()
+
+        return ojsonify({
+            'stats': crash_stats_payload(analysis),
+            'logs': logs,
+            'analysis': analysis,
+            'solutions': smart_solutions_payload(analysis)
+        })
     except Exception as e:
-        return jsonify({'error': str(e)}), 500
+        return ojsonify({'error': str(e)}), 500
+
+# The page has no template variables; it lives in static/ and is read and encoded once
+INTERFACE_PATH = os.path.join(app.static_folder, 'log_interface.html')
+with open(INTERFACE_PATH, 'rb') as f:
+    INTERFACE_HTML = f.read()
+INTERFACE_ETAG = hashlib.sha1(INTERFACE_HTML).hexdigest()
+# Whole seconds because HTTP dates have no fraction
+INTERFACE_LAST_MODIFIED = datetime.fromtimestamp(int(os.path.getmtime(INTERFACE_PATH)), timezone.utc)
+
+# Compress once at import so requests only pick a prebuilt buffer
+INTERFACE_ENCODED = {'gzip': gzip.compress(INTERFACE_HTML, 9)}
+if BROTLI_AVAILABLE:
+    INTERFACE_ENCODED['br'] = brotli.compress(INTERFACE_HTML, quality=11)
+
+if GUNICORN_AVAILABLE:
+    class LogInterfaceServer(BaseApplication):
+        """Embedded gunicorn server so polling clients no longer queue behind each other"""
+
+        def __init__(self, application, options=None):
+            self.application = application
+            self.options = options or {}
+            super().__init__()
+
+        def load_config(self):
+            for key, value in self.options.items():
+                if key in self.cfg.settings and value is not None:
+                    self.cfg.set(key.lower(), value)
+
+        def load(self):
+            return self.application
+
+def server_options():
+    """One worker so every request shares the analysis and response caches
+
+    Concurrency comes from gevent greenlets (or gthread threads as the
+    fallback) inside that worker rather than from extra processes, each of
+    which would re-parse the crash file and run its own log writer.
+    """
+    options = {'bind': '0.0.0.0:9002', 'workers': 1, 'keepalive': 5}
+    if GEVENT_AVAILABLE:
+        options.update(worker_class='gevent', worker_connections=200)
+    else:
+        options.update(worker_class='gthread', threads=8)
+    return options
 
 if __name__ == '__main__':
     print("🎯 Starting Professional Log Interface...")
     print("📊 Based on best practices from lnav and log-viewer")
     print("🔍 Now integrated with actual crash analysis")
     print("🌐 Access at: http://localhost:9002")
-    app.run(host='0.0.0.0', port=9002, debug=False)
+
+    if GUNICORN_AVAILABLE:
+        LogInterfaceServer(app, server_options()).run()
+    else:
+        app.run(host='0.0.0.0', port=9002, debug=False, threaded=True)
@@ -5,22 +5,243 @@ Captures actual verbatim system and application event messages
 """
 
 import subprocess
+import tempfile
+import itertools
 import json
 import sqlite3
+import threading
+import queue
 import re
-from datetime import datetime, timedelta
+import time
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 import os
 
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
+    print("⚠️ orjson not available - journal JSON will be decoded with the json module")
+
+try:
+    # Per OS thread even when gevent has monkey-patched threading.local, so
+    # a worker's greenlets share one connection instead of opening one each
+    from gevent.monkey import get_original
+    ConnectionLocal = get_original('threading', 'local')
+except ImportError:
+    from threading import local as ConnectionLocal
+
+try:
+    from systemd import journal
+    SYSTEMD_JOURNAL_AVAILABLE = True
+except ImportError:
+    SYSTEMD_JOURNAL_AVAILABLE = False
+    print("⚠️ python-systemd not available - journal will be read through journalctl")
+
+# Applied once per connection: WAL lets readers run alongside the capture
+# writer and needs no rollback-journal rewrite per commit, and mmap/cache
+# keep hot pages out of read() syscalls. With synchronous=NORMAL a commit
+# waits for no fsync (only checkpoints do): an OS crash or power loss can
+# lose the last transactions but leaves the file intact. That is acceptable
+# because this database is not durability-critical - its rows are copies of
+# journal entries, and the capture cursor is committed with the rows (never
+# ahead of them), so the next capture reads any lost entries again
+SQLITE_PRAGMAS = """
+    PRAGMA journal_mode=WAL;
+    PRAGMA synchronous=NORMAL;
+    PRAGMA cache_size=-65536;
+    PRAGMA mmap_size=268435456;
+    PRAGMA temp_store=MEMORY;
+"""
+
+# Newest-first reads used by the dashboards; sqlite3 keeps the prepared
+# statement for each distinct SQL string, so these are built once
+RECENT_RAW_LINES_SQL = {
+    table: f'SELECT raw_line FROM {table} ORDER BY captured_at DESC LIMIT ?'
+    for table in ('system_events', 'application_errors', 'kernel_messages')
+}
+
+# captured_at is bound once per chunk rather than evaluated per row as the column default
+# hostname/service/subsystem are stored as ids into the hosts and services
+# lookup tables: a capture has a handful of distinct values over many rows
+INSERT_KERNEL_SQL = '''
+    INSERT INTO kernel_messages
+    (timestamp, service_id, message, raw_line, captured_at)
+    VALUES '''
+INSERT_APP_ERROR_SQL = '''
+    INSERT INTO application_errors
+    (timestamp, application, pid, error_message, signal_number, raw_line, captured_at)
+    VALUES '''
+INSERT_SYSTEM_EVENT_SQL = '''
+    INSERT INTO system_events
+    (timestamp, host_id, service_id, pid, message, raw_line, captured_at)
+    VALUES '''
+
+# Journal positions a capture read up to; committed with the rows they cover
+UPSERT_CAPTURE_STATE_SQL = '''
+    INSERT INTO capture_state (key, value) VALUES (?, ?)
+    ON CONFLICT(key) DO UPDATE SET value = excluded.value
+'''
+
+# Rows go in as multi-row VALUES lists: one statement step inserts a whole
+# group. Groups stay within SQLite's historical 999-parameter default.
+MAX_SQL_PARAMS = 999
+
+@lru_cache(maxsize=None)
+def values_sql(insert, width, count):
+    """An INSERT ... VALUES head completed with `count` rows of `width` placeholders"""
+    row = '(' + ', '.join('?' * width) + ')'
+    return insert + ', '.join([row] * count)
+
+def insert_rows(conn, insert, rows):
+    """Insert row tuples with as few statements as the parameter limit allows"""
+    if not rows:
+        return
+    width = len(rows[0])
+    per_statement = MAX_SQL_PARAMS // width
+    for start in range(0, len(rows), per_statement):
+        group = rows[start:start + per_statement]
+        conn.execute(values_sql(insert, width, len(group)), list(itertools.chain.from_iterable(group)))
+
+# Id columns per table and the lookup table each refers to; rows written
+# before these existed keep their text columns, which reads fall back to
+NAME_ID_COLUMNS = {
+    'system_events': (('host_id', 'hosts'), ('service_id', 'services')),
+    'kernel_messages': (('service_id', 'services'),),
+}
+
+# ISO timestamp format
+_ISO_PATTERN = (r'^(?P<iso_ts>\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}[+-]\d{4})\s+(?P<iso_host>\S+)\s+'
+                r'(?P<iso_service>\S+?)(?:\[(?P<iso_pid>\d+)\])?\s*:\s*(?P<iso_msg>.+)$')
+# Standard syslog format
+_SYSLOG_PATTERN = (r'^(?P<syslog_ts>\w{3}\s+\d{1,2}\s+\d{2}:\d{2}:\d{2})\s+(?P<syslog_host>\S+)\s+'
+                   r'(?P<syslog_service>\S+?)(?:\[(?P<syslog_pid>\d+)\])?\s*:\s*(?P<syslog_msg>.+)$')
+# Audit format
+_AUDIT_PATTERN = r'^.*audit\[(?P<audit_pid>\d+)\]:\s*(?P<audit_msg>.+)$'
+
+# All journalctl line shapes in one pattern, tried left to right in a single
+# match call; the outer group that matched (m.lastgroup) names the shape
+_LINE_RE = re.compile(f'(?P<iso>{_ISO_PATTERN})|(?P<syslog>{_SYSLOG_PATTERN})|(?P<audit>{_AUDIT_PATTERN})')
+# Single-shape patterns for a log_format known in advance
+_ISO_RE = re.compile(_ISO_PATTERN)
+_SYSLOG_RE = re.compile(_SYSLOG_PATTERN)
+
+# log_format values: 'auto' tries every shape, the others parse only their own
+LOG_FORMATS = ('auto', 'json', 'iso', 'syslog')
+_SIG_RE = re.compile(r'sig=(\d+)')
+# Messages routed to application_errors; one case-insensitive scan, no lower() copy
+_APP_RE = re.compile(r'code-insiders|vscode|anom_abend|sig=', re.I)
+
+# A short-iso timestamp reduces to this template (one C-level translate call)
+_ISO_TS_SHAPE = str.maketrans('123456789+', '000000000-')
+_ISO_TS_TEMPLATE = '0000-00-00T00:00:00-0000'
+
+# Cheap first-characters test: lines that can't start an ISO or syslog
+# timestamp and have no audit[pid] skip the regex and are stored raw
+_MONTHS = frozenset(('Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun',
+                     'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec'))
+
+@lru_cache(maxsize=4096)
+def journal_timestamp(seconds):
+    """Epoch seconds as journalctl's short-iso local timestamp (bursts share a second)"""
+    return datetime.fromtimestamp(seconds).astimezone().strftime('%Y-%m-%dT%H:%M:%S%z')
+
+@lru_cache(maxsize=4096)
+def kernel_service(service):
+    """Whether rows from this service go to kernel_messages (a capture has few distinct names)"""
+    return 'kernel' in service.lower()
+
+def journal_field(entry, key):
+    """
+    A journal field as text; journalctl -o json encodes non-UTF-8 values as
+    byte arrays and journal.Reader hands them over as bytes
+    """
+    value = entry.get(key)
+    if isinstance(value, list):
+        return bytes(value).decode('utf-8', 'replace')
+    if isinstance(value, bytes):
+        return value.decode('utf-8', 'replace')
+    return value
+
+# journalctl is read through a pipe as it runs
+JOURNAL_PIPE_BUFFER = 1 << 20
+# Seconds spent waiting on journalctl output before it is killed
+JOURNALCTL_TIMEOUT = 30
+
+# The kernel ring buffer as records ("pri,seq,usec,flags;text\n"); one read()
+# returns one whole record, which the kernel caps well under this size
+KMSG_PATH = '/dev/kmsg'
+KMSG_RECORD_MAX = 8192
+
+# Lines the background writer commits per transaction
+WRITE_BATCH_LINES = 5000
+
+class CursorCheckpoint:
+    """Queued after a capture's lines: the writer saves the cursors once those lines are stored"""
+    def __init__(self, cursors):
+        self.cursors = cursors
+
 class RealSystemLogCapture:
-    def __init__(self, db_path="real_system_logs.db"):
+    def __init__(self, db_path="real_system_logs.db", log_format='auto'):
+        if log_format not in LOG_FORMATS:
+            raise ValueError(f"log_format must be one of {', '.join(LOG_FORMATS)}, not {log_format!r}")
         self.db_path = db_path
+        # A known input format binds its own parser, skipping the shape dispatch per line
+        if log_format != 'auto':
+            self.parse_system_log_line = getattr(self, f'parse_{log_format}_log_line')
+        self._local = ConnectionLocal()
+        self._write_queue = queue.SimpleQueue()
+        self._writer = None
+        self._writer_lock = threading.Lock()
+        # (lookup table, name) -> id, filled once the names are committed
+        self._name_ids = {}
         self.init_database()
     
+    def _connect(self):
+        """
+        Per-OS-thread connection reused across calls; greenlets on that thread
+        share it, so writes stay in `with conn:` blocks that never yield
+        """
+        conn = getattr(self._local, 'conn', None)
+        # A connection opened before fork() (e.g. at import in the gunicorn
+        # master) must not be used by the child: it gets its own
+        if conn is None or self._local.pid != os.getpid():
+            conn = sqlite3.connect(self.db_path)
+            conn.executescript(SQLITE_PRAGMAS)
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        elif conn.in_transaction:
+            # Committing or rolling back here would take another caller's rows with it
+            raise sqlite3.ProgrammingError("pooled connection is inside another caller's transaction")
+        return conn
+
+    def close(self):
+        """Close the calling thread's pooled connection"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            # One inherited across fork() belongs to the parent: only dropped
+            if self._local.pid == os.getpid():
+                conn.close()
+            self._local.conn = None
+
     def init_database(self):
         """Initialize database for real system logs"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
         
+        # Where each journal capture stopped, so the next one resumes after it
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS capture_state (
+                key TEXT PRIMARY KEY,
+                value TEXT
+            )
+        ''')
+        
+        # Lookup tables for the few distinct hostnames and service names
+        for lookup in ('hosts', 'services'):
+            cursor.execute(f'CREATE TABLE IF NOT EXISTS {lookup} (id INTEGER PRIMARY KEY, name TEXT NOT NULL UNIQUE)')
+        
         # Real system event messages
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS system_events (
@@ -28,6 +249,8 @@ class RealSystemLogCapture:
                 timestamp TEXT NOT NULL,
                 hostname TEXT,
                 service TEXT,
+                host_id INTEGER REFERENCES hosts(id),
+                service_id INTEGER REFERENCES services(id),
                 pid INTEGER,
                 message TEXT NOT NULL,
                 severity TEXT,
@@ -60,6 +283,7 @@ class RealSystemLogCapture:
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 timestamp TEXT NOT NULL,
                 subsystem TEXT,
+                service_id INTEGER REFERENCES services(id),
                 message TEXT NOT NULL,
                 severity TEXT,
                 raw_line TEXT NOT NULL,
@@ -67,38 +291,245 @@ class RealSystemLogCapture:
             )
         ''')
         
+        # Databases created before the lookup tables get the id columns in place
+        for table, columns in NAME_ID_COLUMNS.items():
+            existing = {row[1] for row in cursor.execute(f'PRAGMA table_info({table})')}
+            for column, lookup in columns:
+                if column not in existing:
+                    cursor.execute(f'ALTER TABLE {table} ADD COLUMN {column} INTEGER REFERENCES {lookup}(id)')
+        
+        # Every read is "newest N by captured_at": walk an index instead of sorting the table
+        for table in RECENT_RAW_LINES_SQL:
+            cursor.execute(f'CREATE INDEX IF NOT EXISTS ix_{table}_captured ON {table}(captured_at)')
+
+        # Partial index: get_stats' signal count only visits rows that carry a signal
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS ix_application_errors_signal
+            ON application_errors(signal_number) WHERE signal_number IS NOT NULL
+        ''')
+
         conn.commit()
-        conn.close()
         print("✅ Real system log database initialized")
     
-    def capture_journalctl_logs(self, hours=24):
-        """Capture real journalctl logs - verbatim"""
-        print(f"🔍 Capturing journalctl logs from last {hours} hours...")
-        
+    def stream_journalctl(self, args, timeout):
+        """
+        Yield journalctl -o json lines as journalctl writes them, so neither
+        its whole output nor a list of every line is ever held in memory.
+        Only complete lines are yielded. `timeout` counts only the time spent
+        waiting on journalctl, not the consumer's work between lines.
+        Returns (line count, exit status, timed out, last yielded entry's
+        cursor); None if journalctl could not start
+        """
+        # JSON fields need no regex; parse_system_log_line rebuilds the short-iso text
+        cmd = ['journalctl', *args, '--no-pager', '-o', 'json']
+        # stderr goes to a file: warnings (e.g. about corrupted journal files)
+        # can't fill a pipe nobody reads until stdout ends
+        stderr_file = tempfile.TemporaryFile(mode='w+')
         try:
-            # Get system logs
-            cmd = ['journalctl', '--since', f'{hours} hours ago', '--no-pager', '-o', 'short-iso']
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
-            
-            if result.returncode == 0:
-                lines = result.stdout.strip().split('\n')
-                print(f"📥 Captured {len(lines)} journalctl lines")
-                return lines
-            else:
-                print(f"❌ journalctl failed: {result.stderr}")
-                return []
-                
-        except subprocess.TimeoutExpired:
-            print("⏰ journalctl timeout - using alternative method")
-            return self.capture_dmesg_logs()
+            proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=stderr_file,
+                                    text=True, bufsize=JOURNAL_PIPE_BUFFER)
         except Exception as e:
+            stderr_file.close()
             print(f"❌ journalctl error: {e}")
-            return []
+            return None
+        
+        # The time budget is enforced by killing journalctl. Time the consumer
+        # holds a line (e.g. while storing a chunk) is added to the deadline,
+        # so slow storage doesn't cut the capture short
+        timed_out = threading.Event()
+        finished = threading.Event()
+        started = time.monotonic()
+        clock = {'consumer': 0.0, 'paused_at': None}
+        
+        def watch():
+            while True:
+                now = time.monotonic()
+                paused_at = clock['paused_at']
+                waited = now - started - clock['consumer'] - (now - paused_at if paused_at is not None else 0)
+                if waited >= timeout:
+                    timed_out.set()
+                    proc.kill()
+                    return
+                if finished.wait(timeout - waited):
+                    return
+        
+        threading.Thread(target=watch, name='journalctl-timeout', daemon=True).start()
+        count = 0
+        last_line = None
+        try:
+            for line in proc.stdout:
+                if line[-1:] != '\n':
+                    # Cut off mid-entry when journalctl was killed: neither
+                    # stored nor used for the cursor
+                    break
+                count += 1
+                last_line = line
+                clock['paused_at'] = paused_at = time.monotonic()
+                yield line[:-1]
+                # Counted before the pause is cleared, so the watchdog never undercounts
+                clock['consumer'] += time.monotonic() - paused_at
+                clock['paused_at'] = None
+            proc.wait()
+            stderr_file.seek(0)
+            stderr = stderr_file.read()
+        finally:
+            finished.set()
+            if proc.poll() is None:
+                # The consumer stopped early
+                proc.kill()
+                proc.wait()
+            proc.stdout.close()
+            stderr_file.close()
+        
+        if proc.returncode != 0 and not timed_out.is_set():
+            print(f"❌ journalctl failed: {stderr}")
+        
+        # Only the last entry's cursor is needed, so only it is decoded twice
+        cursor = None
+        if last_line:
+            try:
+                cursor = json_loads(last_line)['__CURSOR']
+            except (ValueError, KeyError, TypeError):
+                pass
+        return count, proc.returncode, timed_out.is_set(), cursor
+    
+    def stream_journal_since(self, state_key, args, since, timeout, cursors):
+        """
+        stream_journalctl from just after cursors[state_key], or from `since`
+        on the first run; the cursor reached is written back into `cursors`.
+        Returns (line count, timed out)
+        """
+        cursor = cursors.get(state_key)
+        window = ['--after-cursor', cursor] if cursor else ['--since', since]
+        result = yield from self.stream_journalctl(args + window, timeout)
+        if result is None:
+            return None
+        
+        count, returncode, timed_out, last_cursor = result
+        if cursor and returncode and not count and not timed_out:
+            # The saved position was rotated or vacuumed out of the journal
+            print("⚠️ Saved journal position is gone - capturing the full window")
+            result = yield from self.stream_journalctl(args + ['--since', since], timeout)
+            if result is None:
+                return None
+            count, returncode, timed_out, last_cursor = result
+        
+        if last_cursor:
+            cursors[state_key] = last_cursor
+        return count, timed_out
+    
+    def open_journal(self, cursor, since, *matches):
+        """
+        journal.Reader positioned just after `cursor` (or at `since` on the
+        first run), with the field matches ORed together; None when the
+        journal files can't be opened
+        """
+        try:
+            reader = journal.Reader()
+            for i, match in enumerate(matches):
+                if i:
+                    reader.add_disjunction()
+                reader.add_match(**match)
+            if cursor:
+                reader.seek_cursor(cursor)
+                # Step onto the saved entry; if it is gone, the seek already
+                # landed on the next one, so step back before that instead
+                if reader.get_next() and not reader.test_cursor(cursor):
+                    reader.get_previous()
+            else:
+                reader.seek_realtime(since)
+        except OSError as e:
+            print(f"❌ journal read error: {e}")
+            return None
+        return reader
+    
+    def read_journal(self, reader, state_key, cursors):
+        """
+        Yield entries straight from the journal files, closing the reader
+        afterwards; the last entry's cursor is written back into `cursors`
+        """
+        entry = None
+        try:
+            for entry in reader:
+                yield entry
+        finally:
+            reader.close()
+        if entry:
+            cursors[state_key] = entry['__CURSOR']
+    
+    def capture_journalctl_logs(self, hours=24, cursors=None):
+        """
+        Capture real journalctl logs - verbatim
+        With `cursors` (saved capture_state) the capture resumes after
+        cursors['journal_cursor'] and records where it stopped in it
+        """
+        print(f"🔍 Capturing journalctl logs from last {hours} hours...")
+        if cursors is None:
+            cursors = {}
+        
+        # Entries come out of libsystemd as dicts: no journalctl process or JSON text
+        reader = None
+        if SYSTEMD_JOURNAL_AVAILABLE:
+            reader = self.open_journal(cursors.get('journal_cursor'), datetime.now() - timedelta(hours=hours))
+        if reader is not None:
+            count = 0
+            for entry in self.read_journal(reader, 'journal_cursor', cursors):
+                count += 1
+                yield entry
+            print(f"📥 Read {count} journal entries")
+            return
+        
+        # Get system logs
+        result = yield from self.stream_journal_since('journal_cursor', [], f'{hours} hours ago',
+                                                   JOURNALCTL_TIMEOUT, cursors)
+        if result is None:
+            return
+        
+        count, timed_out = result
+        if not timed_out:
+            print(f"📥 Captured {count} journalctl lines")
+        else:
+            print(f"⏰ journalctl timeout after {count} lines")
+            if not count:
+                print("Using alternative method")
+                yield from self.capture_dmesg_logs()
     
     def capture_dmesg_logs(self):
-        """Capture real dmesg logs as fallback"""
+        """Capture real kernel ring buffer logs as fallback, read from /dev/kmsg"""
         print("🔍 Capturing dmesg logs...")
         
+        try:
+            fd = os.open(KMSG_PATH, os.O_RDONLY | os.O_NONBLOCK)
+        except OSError as e:
+            # Restricted by kernel.dmesg_restrict, or no /dev/kmsg (containers)
+            print(f"⚠️ {KMSG_PATH} not readable ({e}) - running dmesg")
+            yield from self.run_dmesg()
+            return
+        
+        # Record times are microseconds since boot, shown like dmesg -T does
+        boot_time = time.time() - time.monotonic()
+        count = 0
+        try:
+            while True:
+                try:
+                    record = os.read(fd, KMSG_RECORD_MAX)
+                except BlockingIOError:
+                    # Caught up with the buffer
+                    break
+                except BrokenPipeError:
+                    # The record was overwritten while we read; take the next one
+                    continue
+                header, _, text = record.partition(b';')
+                usec = int(header.split(b',', 3)[2])
+                message = text.split(b'\n', 1)[0].decode('utf-8', 'replace')
+                count += 1
+                yield f"[{time.ctime(boot_time + usec / 1000000)}] {message}"
+        finally:
+            os.close(fd)
+        print(f"📥 Captured {count} dmesg lines")
+    
+    def run_dmesg(self):
+        """Capture real dmesg logs through the dmesg binary"""
         try:
             result = subprocess.run(['dmesg', '-T'], capture_output=True, text=True, timeout=15)
             if result.returncode == 0:
@@ -112,80 +543,189 @@ class RealSystemLogCapture:
             print(f"❌ dmesg error: {e}")
             return []
     
-    def capture_vscode_specific_logs(self):
-        """Capture VSCode-specific logs"""
+    def capture_vscode_specific_logs(self, cursors=None):
+        """Capture VSCode-specific logs; `cursors` as for capture_journalctl_logs ('vscode_cursor')"""
         print("🔍 Capturing VSCode-specific logs...")
+        if cursors is None:
+            cursors = {}
         
-        vscode_logs = []
+        reader = None
+        if SYSTEMD_JOURNAL_AVAILABLE:
+            reader = self.open_journal(cursors.get('vscode_cursor'), datetime.now() - timedelta(days=7),
+                                       {'_COMM': 'code-insiders'}, {'_TRANSPORT': 'audit'})
+        if reader is not None:
+            count = 0
+            for entry in self.read_journal(reader, 'vscode_cursor', cursors):
+                if entry.get('_COMM') == 'code-insiders' or 'code-insiders' in (journal_field(entry, 'MESSAGE') or ''):
+                    count += 1
+                    yield entry
+            print(f"📥 Read {count} VSCode journal/audit entries")
+            return
         
-        # Check journalctl for VSCode
-        try:
-            cmd = ['journalctl', '_COMM=code-insiders', '--since', '7 days ago', '--no-pager']
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=20)
-            
-            if result.returncode == 0:
-                lines = result.stdout.strip().split('\n')
-                vscode_logs.extend(lines)
-                print(f"📥 Captured {len(lines)} VSCode journalctl entries")
-        except Exception as e:
-            print(f"❌ VSCode journalctl error: {e}")
-        
-        # Check audit logs for VSCode
-        try:
-            cmd = ['journalctl', '_TRANSPORT=audit', '--grep=code-insiders', '--since', '7 days ago', '--no-pager']
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=20)
-            
-            if result.returncode == 0:
-                lines = result.stdout.strip().split('\n')
-                vscode_logs.extend(lines)
-                print(f"📥 Captured {len(lines)} VSCode audit entries")
-        except Exception as e:
-            print(f"❌ VSCode audit error: {e}")
+        # VSCode's own entries and the audit records naming it, in one journalctl
+        # run ("+" ORs the two matches); the audit side used --grep=code-insiders,
+        # which would also filter the _COMM side here, so that test is done below
+        args = ['_COMM=code-insiders', '+', '_TRANSPORT=audit']
+        count = 0
+        for line in self.stream_journal_since('vscode_cursor', args, '7 days ago', 20, cursors):
+            if 'code-insiders' in line:
+                count += 1
+                yield line
+        print(f"📥 Captured {count} VSCode journalctl/audit entries")
+    
+    def parse_journal_json_line(self, line):
+        """Parse one journalctl -o json entry field by field"""
+        return self.parse_journal_entry(json_loads(line))
+    
+    def parse_journal_entry(self, entry):
+        """Parse a journal entry dict, from journalctl -o json or journal.Reader"""
+        realtime = entry['__REALTIME_TIMESTAMP']
+        if isinstance(realtime, datetime):
+            seconds = int(realtime.timestamp())
+        else:
+            seconds = int(realtime) // 1000000
+        timestamp = journal_timestamp(seconds)
+        hostname = journal_field(entry, '_HOSTNAME') or 'unknown'
+        service = journal_field(entry, 'SYSLOG_IDENTIFIER') or journal_field(entry, '_COMM') or 'unknown'
+        pid = entry.get('_PID') or entry.get('SYSLOG_PID')
+        message = journal_field(entry, 'MESSAGE') or ''
         
-        return vscode_logs
+        # raw_line keeps the verbatim short-iso text the dashboards parse and display
+        prefix = f"{service}[{pid}]" if pid else service
+        return {
+            'timestamp': timestamp,
+            'hostname': hostname,
+            'service': service,
+            'pid': int(pid) if pid else None,
+            'message': message,
+            'raw_line': f"{timestamp} {hostname} {prefix}: {message}"
+        }
+    
+    def parse_iso_line(self, line):
+        """
+        Slice a plain short-iso line without the regex; None when the line
+        has any shape the slicing can't vouch for (the regex then decides)
+        """
+        if len(line) < 26 or line[24] != ' ' or line[:24].translate(_ISO_TS_SHAPE) != _ISO_TS_TEMPLATE:
+            return None
+        head, sep, message = line[25:].partition(': ')
+        if not sep or not message or message[0].isspace() or ':' in head:
+            return None
+        fields = head.split()
+        if len(fields) != 2:
+            return None
+        hostname, service = fields
+        pid = None
+        if service[-1] == ']':
+            name, _, digits = service[:-1].rpartition('[')
+            if not name or not digits.isdecimal():
+                return None
+            service, pid = name, int(digits)
+        return {
+            'timestamp': line[:24],
+            'hostname': hostname,
+            'service': service,
+            'pid': pid,
+            'message': message,
+            'raw_line': line
+        }
     
     def parse_system_log_line(self, line):
         """Parse real system log line - no placeholders"""
+        if isinstance(line, dict):
+            # Already a journal.Reader entry
+            return self.parse_journal_entry(line)
+        
         if not line.strip() or line.startswith('--'):
             return None
         
+        if line.startswith('{'):
+            try:
+                return self.parse_journal_json_line(line)
+            except (ValueError, KeyError, TypeError):
+                pass
+        
         # Parse journalctl format: timestamp hostname service[pid]: message
         # Example: 2025-06-26T18:30:15+0000 fedora systemd[1]: Started some service
         
-        patterns = [
-            # ISO timestamp format
-            r'^(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}[+-]\d{4})\s+(\S+)\s+(\S+?)(?:\[(\d+)\])?\s*:\s*(.+)$',
-            # Standard syslog format  
-            r'^(\w{3}\s+\d{1,2}\s+\d{2}:\d{2}:\d{2})\s+(\S+)\s+(\S+?)(?:\[(\d+)\])?\s*:\s*(.+)$',
-            # Audit format
-            r'^.*audit\[(\d+)\]:\s*(.+)$'
-        ]
-        
-        for pattern in patterns:
-            match = re.match(pattern, line)
-            if match:
-                if len(match.groups()) == 5:
-                    timestamp, hostname, service, pid, message = match.groups()
-                    return {
-                        'timestamp': timestamp,
-                        'hostname': hostname,
-                        'service': service,
-                        'pid': int(pid) if pid else None,
-                        'message': message,
-                        'raw_line': line
-                    }
-                elif len(match.groups()) == 2:  # Audit format
-                    pid, message = match.groups()
-                    return {
-                        'timestamp': 'unknown',
-                        'hostname': 'unknown',
-                        'service': 'audit',
-                        'pid': int(pid) if pid else None,
-                        'message': message,
-                        'raw_line': line
-                    }
+        if line[:1].isdigit():
+            # journalctl's short-iso output is nearly every line: slice it first
+            parsed = self.parse_iso_line(line)
+            if parsed:
+                return parsed
+            match = _LINE_RE.match(line)
+        elif line[:3] in _MONTHS or 'audit[' in line:
+            match = _LINE_RE.match(line)
+        else:
+            match = None
+        if match:
+            shape = match.lastgroup
+            if shape == 'audit':
+                pid = match.group('audit_pid')
+                return {
+                    'timestamp': 'unknown',
+                    'hostname': 'unknown',
+                    'service': 'audit',
+                    'pid': int(pid) if pid else None,
+                    'message': match.group('audit_msg'),
+                    'raw_line': line
+                }
+            return self.matched_log_entry(line, match, shape)
         
         # If no pattern matches, store as raw
+        return self.raw_log_entry(line)
+    
+    def parse_json_log_line(self, line):
+        """parse_system_log_line for journal entries only (journal.Reader or journalctl -o json)"""
+        if isinstance(line, dict):
+            return self.parse_journal_entry(line)
+        if not line.strip():
+            return None
+        try:
+            return self.parse_journal_json_line(line)
+        except (ValueError, KeyError, TypeError):
+            # e.g. the dmesg fallback's lines
+            return self.raw_log_entry(line)
+    
+    def parse_iso_log_line(self, line):
+        """
+        parse_system_log_line for journalctl short-iso text; the journal
+        entries every capture yields still go through parse_json_log_line
+        """
+        if isinstance(line, dict) or line.startswith('{'):
+            return self.parse_json_log_line(line)
+        if not line.strip() or line.startswith('--'):
+            return None
+        parsed = self.parse_iso_line(line)
+        if parsed:
+            return parsed
+        match = _ISO_RE.match(line)
+        return self.matched_log_entry(line, match, 'iso') if match else self.raw_log_entry(line)
+    
+    def parse_syslog_log_line(self, line):
+        """parse_system_log_line for classic syslog text; journal entries as in parse_iso_log_line"""
+        if isinstance(line, dict) or line.startswith('{'):
+            return self.parse_json_log_line(line)
+        if not line.strip() or line.startswith('--'):
+            return None
+        match = _SYSLOG_RE.match(line)
+        return self.matched_log_entry(line, match, 'syslog') if match else self.raw_log_entry(line)
+    
+    def matched_log_entry(self, line, match, shape):
+        """Entry from an ISO or syslog match; the shape prefixes the group names"""
+        timestamp, hostname, service, pid, message = match.group(
+            f'{shape}_ts', f'{shape}_host', f'{shape}_service', f'{shape}_pid', f'{shape}_msg')
+        return {
+            'timestamp': timestamp,
+            'hostname': hostname,
+            'service': service,
+            'pid': int(pid) if pid else None,
+            'message': message,
+            'raw_line': line
+        }
+    
+    def raw_log_entry(self, line):
+        """Entry for a line no pattern matches, stored as raw"""
         return {
             'timestamp': 'unknown',
             'hostname': 'unknown', 
@@ -195,84 +735,175 @@ class RealSystemLogCapture:
             'raw_line': line
         }
     
-    def store_real_logs(self, log_lines):
-        """Store real log lines in database - verbatim"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+    def load_capture_state(self):
+        """
+        Saved capture_state values by key; read before a capture starts, so
+        the capture generators never query while the store transaction is open
+        """
+        return dict(self._connect().execute('SELECT key, value FROM capture_state'))
+    
+    def name_id(self, conn, lookup, name, new_ids):
+        """
+        Id of a hostname or service name in its lookup table, adding it on
+        first use; ids not yet committed are collected in `new_ids`
+        """
+        key = (lookup, name)
+        name_id = self._name_ids.get(key) or new_ids.get(key)
+        if name_id is None:
+            conn.execute(f'INSERT OR IGNORE INTO {lookup} (name) VALUES (?)', (name,))
+            name_id = conn.execute(f'SELECT id FROM {lookup} WHERE name = ?', (name,)).fetchone()[0]
+            new_ids[key] = name_id
+        return name_id
+    
+    def store_real_logs(self, log_lines, conn=None, cursors=None):
+        """
+        Store real log lines in database - verbatim
+        `cursors` (journal positions the lines were read up to) are saved in
+        the same transaction, so they never get ahead of the stored rows
+        """
+        if conn is None:
+            conn = self._connect()
         
-        system_count = 0
-        app_count = 0
-        kernel_count = 0
+        system_count = app_count = kernel_count = 0
+        lines = iter(log_lines)
+        new_ids = {}
         
-        for line in log_lines:
-            parsed = self.parse_system_log_line(line)
-            if not parsed:
-                continue
+        # One transaction for the whole capture: a single commit (and WAL sync).
+        # Rows are bucketed per WRITE_BATCH_LINES chunk, so at most one chunk
+        # of tuples is alive however long the capture is.
+        with conn:
+            while True:
+                chunk = list(itertools.islice(lines, WRITE_BATCH_LINES))
+                if not chunk:
+                    break
             
-            # Categorize and store
-            if 'kernel' in parsed['service'].lower() or 'dmesg' in line:
-                cursor.execute('''
-                    INSERT INTO kernel_messages 
-                    (timestamp, subsystem, message, raw_line)
-                    VALUES (?, ?, ?, ?)
-                ''', (
-                    parsed['timestamp'],
-                    parsed['service'],
-                    parsed['message'],
-                    parsed['raw_line']
-                ))
-                kernel_count += 1
-                
-            elif any(app in parsed['message'].lower() for app in ['code-insiders', 'vscode', 'anom_abend', 'sig=']):
-                # Extract signal info if present
-                signal_match = re.search(r'sig=(\d+)', parsed['message'])
-                signal_num = int(signal_match.group(1)) if signal_match else None
-                
-                cursor.execute('''
-                    INSERT INTO application_errors
-                    (timestamp, application, pid, error_message, signal_number, raw_line)
-                    VALUES (?, ?, ?, ?, ?, ?)
-                ''', (
-                    parsed['timestamp'],
-                    'code-insiders' if 'code-insiders' in parsed['message'] else 'unknown',
-                    parsed['pid'],
-                    parsed['message'],
-                    signal_num,
-                    parsed['raw_line']
-                ))
-                app_count += 1
+                system_rows = []
+                app_rows = []
+                kernel_rows = []
+                # Same UTC 'YYYY-MM-DD HH:MM:SS' text CURRENT_TIMESTAMP produces
+                captured_at = datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S')
+            
+                for line in chunk:
+                    parsed = self.parse_system_log_line(line)
+                    if not parsed:
+                        continue
                 
-            else:
-                cursor.execute('''
-                    INSERT INTO system_events
-                    (timestamp, hostname, service, pid, message, raw_line)
-                    VALUES (?, ?, ?, ?, ?, ?)
-                ''', (
-                    parsed['timestamp'],
-                    parsed['hostname'],
-                    parsed['service'],
-                    parsed['pid'],
-                    parsed['message'],
-                    parsed['raw_line']
-                ))
-                system_count += 1
-        
-        conn.commit()
-        conn.close()
+                    # Categorize
+                    # Journal entry dicts are searched by message, not by field name
+                    if kernel_service(parsed['service']) or 'dmesg' in (line if isinstance(line, str) else parsed['message']):
+                        kernel_rows.append((
+                            parsed['timestamp'],
+                            self.name_id(conn, 'services', parsed['service'], new_ids),
+                            parsed['message'],
+                            parsed['raw_line'],
+                            captured_at
+                        ))
+                    
+                    elif _APP_RE.search(parsed['message']):
+                        # Extract signal info if present
+                        signal_match = _SIG_RE.search(parsed['message'])
+                        signal_num = int(signal_match.group(1)) if signal_match else None
+                    
+                        app_rows.append((
+                            parsed['timestamp'],
+                            'code-insiders' if 'code-insiders' in parsed['message'] else 'unknown',
+                            parsed['pid'],
+                            parsed['message'],
+                            signal_num,
+                            parsed['raw_line'],
+                            captured_at
+                        ))
+                    
+                    else:
+                        system_rows.append((
+                            parsed['timestamp'],
+                            self.name_id(conn, 'hosts', parsed['hostname'], new_ids),
+                            self.name_id(conn, 'services', parsed['service'], new_ids),
+                            parsed['pid'],
+                            parsed['message'],
+                            parsed['raw_line'],
+                            captured_at
+                        ))
+            
+                insert_rows(conn, INSERT_KERNEL_SQL, kernel_rows)
+                insert_rows(conn, INSERT_APP_ERROR_SQL, app_rows)
+                insert_rows(conn, INSERT_SYSTEM_EVENT_SQL, system_rows)
+            
+                system_count += len(system_rows)
+                app_count += len(app_rows)
+                kernel_count += len(kernel_rows)
+            
+            if cursors:
+                conn.executemany(UPSERT_CAPTURE_STATE_SQL, cursors.items())
+        # Only committed names are cached: a rolled-back chunk leaves no stale ids
+        self._name_ids.update(new_ids)
         
         print(f"✅ Stored {system_count} system events, {app_count} app errors, {kernel_count} kernel messages")
         return system_count + app_count + kernel_count
     
+    def enqueue_logs(self, log_lines, cursors=None):
+        """
+        Hand log lines to the background writer; returns how many were queued.
+        `cursors` are saved by the writer once every one of these lines is stored
+        """
+        # Writer first, so it stores batches while a streamed capture is still being read
+        with self._writer_lock:
+            if self._writer is None or not self._writer.is_alive():
+                self._writer = threading.Thread(target=self._write_loop, name='log-writer', daemon=True)
+                self._writer.start()
+        
+        count = 0
+        for line in log_lines:
+            self._write_queue.put(line)
+            count += 1
+        # Filled in by the capture generators, which are exhausted by now
+        if cursors is not None:
+            self._write_queue.put(CursorCheckpoint(cursors))
+        return count
+    
+    def _write_loop(self):
+        """Drain queued lines in batches, one transaction per batch"""
+        # Its own connection: batches never share a transaction with pooled callers
+        conn = sqlite3.connect(self.db_path)
+        conn.executescript(SQLITE_PRAGMAS)
+        failed = False
+        while True:
+            batch = []
+            checkpoint = None
+            item = self._write_queue.get()
+            while True:
+                if isinstance(item, CursorCheckpoint):
+                    checkpoint = item
+                    break
+                batch.append(item)
+                if len(batch) >= WRITE_BATCH_LINES:
+                    break
+                try:
+                    item = self._write_queue.get_nowait()
+                except queue.Empty:
+                    break
+            # A capture's cursors commit with its last batch, and only if no earlier batch was lost
+            try:
+                self.store_real_logs(batch, conn, checkpoint.cursors if checkpoint and not failed else None)
+            except Exception as e:
+                print(f"❌ Background log write failed: {e}")
+                failed = True
+            if checkpoint:
+                if failed:
+                    print("⚠️ Journal cursors not saved; the next capture re-reads those lines")
+                failed = False
+    
     def get_verbatim_logs(self, limit=50):
         """Get verbatim system logs for display"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
         
         # Get recent system events
         cursor.execute('''
-            SELECT timestamp, service, pid, message, raw_line, captured_at
-            FROM system_events 
-            ORDER BY captured_at DESC 
+            SELECT e.timestamp, COALESCE(s.name, e.service), e.pid, e.message, e.raw_line, e.captured_at
+            FROM system_events e
+            LEFT JOIN services s ON s.id = e.service_id
+            ORDER BY e.captured_at DESC 
             LIMIT ?
         ''', (limit,))
         system_events = cursor.fetchall()
@@ -288,67 +919,88 @@ class RealSystemLogCapture:
         
         # Get kernel messages
         cursor.execute('''
-            SELECT timestamp, subsystem, message, raw_line, captured_at
-            FROM kernel_messages 
-            ORDER BY captured_at DESC 
+            SELECT k.timestamp, COALESCE(s.name, k.subsystem), k.message, k.raw_line, k.captured_at
+            FROM kernel_messages k
+            LEFT JOIN services s ON s.id = k.service_id
+            ORDER BY k.captured_at DESC 
             LIMIT ?
         ''', (limit,))
         kernel_messages = cursor.fetchall()
         
-        conn.close()
-        
         return {
             'system_events': system_events,
             'application_errors': app_errors,
             'kernel_messages': kernel_messages
         }
     
-    def capture_and_store_all(self):
-        """Capture and store all real system logs"""
+    def iter_verbatim_raw_lines(self, limit=50):
+        """Yield recent raw lines from each log table straight off the cursor"""
+        conn = self._connect()
+        for sql in RECENT_RAW_LINES_SQL.values():
+            # Plain tuple rows: no row_factory on the pooled connection
+            for (raw_line,) in conn.execute(sql, (limit,)):
+                yield raw_line
+    
+    def capture_and_store_all(self, background=False):
+        """
+        Capture and store all real system logs
+        With background=True the lines go to the writer thread and the
+        number of captured lines is returned without waiting for the insert
+        """
         print("🔄 Starting real system log capture...")
         
-        # Capture journalctl logs
-        journal_logs = self.capture_journalctl_logs(24)
-        
-        # Capture VSCode-specific logs
-        vscode_logs = self.capture_vscode_specific_logs()
+        # Saved positions in, reached positions out: read up front, so nothing
+        # queries the database while the store transaction is open
+        cursors = self.load_capture_state()
         
-        # Combine all logs
-        all_logs = journal_logs + vscode_logs
+        # Capture journalctl logs (streamed) followed by the VSCode-specific logs
+        all_logs = itertools.chain(self.capture_journalctl_logs(24, cursors),
+                                   self.capture_vscode_specific_logs(cursors))
         
-        if all_logs:
-            total_stored = self.store_real_logs(all_logs)
-            print(f"✅ Captured and stored {total_stored} real log entries")
-            return total_stored
+        # Cursors are saved in the transaction that stores the last of the lines.
+        # The foreground store keeps its transaction open while journalctl is
+        # read, which yields under gevent: servers capture with background=True
+        if background:
+            queued = self.enqueue_logs(all_logs, cursors)
+            if queued:
+                print(f"📤 Queued {queued} captured lines for storage")
+                return queued
         else:
-            print("❌ No logs captured")
-            return 0
+            total_stored = self.store_real_logs(all_logs, cursors=cursors)
+            if total_stored:
+                print(f"✅ Captured and stored {total_stored} real log entries")
+                return total_stored
+        
+        print("❌ No logs captured")
+        return 0
     
     def get_stats(self):
         """Get real statistics"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
         
-        stats = {}
-        
-        cursor.execute('SELECT COUNT(*) FROM system_events')
-        stats['system_events'] = cursor.fetchone()[0]
-        
-        cursor.execute('SELECT COUNT(*) FROM application_errors')
-        stats['application_errors'] = cursor.fetchone()[0]
-        
-        cursor.execute('SELECT COUNT(*) FROM kernel_messages')
-        stats['kernel_messages'] = cursor.fetchone()[0]
+        # One statement, one round trip; the signal count uses the partial index
+        cursor.execute('''
+            SELECT
+                (SELECT COUNT(*) FROM system_events),
+                (SELECT COUNT(*) FROM application_errors),
+                (SELECT COUNT(*) FROM kernel_messages),
+                (SELECT COUNT(*) FROM application_errors WHERE signal_number IS NOT NULL)
+        ''')
+        system_events, application_errors, kernel_messages, signal_errors = cursor.fetchone()
         
-        cursor.execute('SELECT COUNT(*) FROM application_errors WHERE signal_number IS NOT NULL')
-        stats['signal_errors'] = cursor.fetchone()[0]
+        stats = {
+            'system_events': system_events,
+            'application_errors': application_errors,
+            'kernel_messages': kernel_messages,
+            'signal_errors': signal_errors
+        }
         
-        conn.close()
         return stats
 
 if __name__ == "__main__":
-    # Test real log capture
-    capture = RealSystemLogCapture()
+    # Test real log capture; the capture itself only yields journal entries
+    capture = RealSystemLogCapture(log_format='json')
     capture.capture_and_store_all()
     
     # Show stats
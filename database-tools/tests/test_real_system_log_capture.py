@@ -0,0 +1,396 @@
+import json
+import os
+import sqlite3
+import sys
+import time
+
+import pytest
+
+import real_system_log_capture
+from real_system_log_capture import RealSystemLogCapture, WRITE_BATCH_LINES
+
+# journalctl -o json stand-in: SYSTEM_ENTRIES system entries, or VSCODE_ENTRIES
+# code-insiders entries for the VSCode match, honouring --after-cursor
+FAKE_JOURNALCTL = '''#!{python}
+import json, sys
+args = sys.argv[1:]
+vscode = '_COMM=code-insiders' in args
+count = {vscode_entries} if vscode else {system_entries}
+prefix = 'v' if vscode else 's'
+entries = [{{
+    '__CURSOR': f'{{prefix}}{{i}}',
+    '__REALTIME_TIMESTAMP': str(1750962615000000 + i * 1000000),
+    '_HOSTNAME': 'fedora',
+    'SYSLOG_IDENTIFIER': 'code-insiders' if vscode else f'service{{i % 7}}',
+    '_PID': str(i + 1),
+    'MESSAGE': f'code-insiders crashed {{i}}' if vscode else f'message {{i}}',
+}} for i in range(count)]
+if '--after-cursor' in args:
+    cursor = args[args.index('--after-cursor') + 1]
+    cursors = [entry['__CURSOR'] for entry in entries]
+    if cursor not in cursors:
+        print('Failed to seek to cursor', file=sys.stderr)
+        sys.exit(1)
+    entries = entries[cursors.index(cursor) + 1:]
+for entry in entries:
+    print(json.dumps(entry))
+'''
+
+SYSTEM_ENTRIES = 2 * WRITE_BATCH_LINES + 2000
+VSCODE_ENTRIES = 5
+
+
+@pytest.fixture
+def fake_journalctl(tmp_path, monkeypatch):
+    bindir = tmp_path / 'bin'
+    bindir.mkdir()
+    script = bindir / 'journalctl'
+    script.write_text(FAKE_JOURNALCTL.format(python=sys.executable, system_entries=SYSTEM_ENTRIES,
+                                             vscode_entries=VSCODE_ENTRIES))
+    script.chmod(0o755)
+    monkeypatch.setenv('PATH', f"{bindir}{os.pathsep}{os.environ['PATH']}")
+    monkeypatch.setattr(real_system_log_capture, 'SYSTEMD_JOURNAL_AVAILABLE', False)
+
+
+@pytest.fixture
+def capture(tmp_path):
+    capture = RealSystemLogCapture(str(tmp_path / 'logs.db'))
+    yield capture
+    capture.close()
+
+
+def row_count(conn):
+    return sum(conn.execute(f'SELECT COUNT(*) FROM {table}').fetchone()[0]
+               for table in ('system_events', 'application_errors', 'kernel_messages'))
+
+
+def test_multi_chunk_capture_then_vscode_capture(fake_journalctl, capture):
+    stored = capture.capture_and_store_all()
+
+    conn = capture._connect()
+    assert stored == row_count(conn) == SYSTEM_ENTRIES + VSCODE_ENTRIES
+    unresolved = conn.execute('''
+        SELECT COUNT(*) FROM system_events e
+        LEFT JOIN services s ON s.id = e.service_id
+        WHERE s.id IS NULL
+    ''').fetchone()[0]
+    assert unresolved == 0
+    assert capture.load_capture_state() == {
+        'journal_cursor': f's{SYSTEM_ENTRIES - 1}',
+        'vscode_cursor': f'v{VSCODE_ENTRIES - 1}',
+    }
+
+
+def test_capture_resumes_from_saved_cursors(fake_journalctl, capture):
+    capture.capture_and_store_all()
+
+    # Nothing new after the saved positions
+    assert capture.capture_and_store_all() == 0
+    assert row_count(capture._connect()) == SYSTEM_ENTRIES + VSCODE_ENTRIES
+
+
+def test_capture_falls_back_when_saved_cursor_is_gone(fake_journalctl, capture):
+    capture.store_real_logs([], cursors={'journal_cursor': 'rotated', 'vscode_cursor': f'v{VSCODE_ENTRIES - 2}'})
+
+    assert capture.capture_and_store_all() == SYSTEM_ENTRIES + 1
+    assert capture.load_capture_state()['journal_cursor'] == f's{SYSTEM_ENTRIES - 1}'
+
+
+def test_background_capture_saves_cursors_after_commit(fake_journalctl, capture):
+    assert capture.capture_and_store_all(background=True) == SYSTEM_ENTRIES + VSCODE_ENTRIES
+
+    deadline = time.monotonic() + 30
+    while len(capture.load_capture_state()) < 2 and time.monotonic() < deadline:
+        time.sleep(0.05)
+    assert row_count(capture._connect()) == SYSTEM_ENTRIES + VSCODE_ENTRIES
+    assert capture.load_capture_state()['vscode_cursor'] == f'v{VSCODE_ENTRIES - 1}'
+
+
+def then_fail(lines, error):
+    yield from lines
+    raise error
+
+
+def test_failed_store_caches_no_name_ids(capture):
+    line = '2025-06-26T14:30:15-0400 fedora systemd[1]: Started'
+    # The first chunk is inserted before the source fails, then rolled back
+    with pytest.raises(OSError):
+        capture.store_real_logs(then_fail([line] * (WRITE_BATCH_LINES + 1), OSError('read failed')),
+                                cursors={'journal_cursor': 'c1'})
+
+    assert capture._name_ids == {}
+    assert capture.load_capture_state() == {}
+    assert row_count(capture._connect()) == 0
+
+    capture.store_real_logs([line])
+    assert capture.get_verbatim_logs()['system_events'][0][1] == 'systemd'
+
+
+def test_connect_refuses_a_connection_mid_transaction(capture):
+    conn = capture._connect()
+    conn.execute("INSERT INTO capture_state (key, value) VALUES ('journal_cursor', 'c1')")
+
+    with pytest.raises(sqlite3.ProgrammingError):
+        capture._connect()
+    conn.commit()
+    assert capture._connect() is conn
+    assert capture.load_capture_state() == {'journal_cursor': 'c1'}
+
+
+def kernel_rows(capture):
+    return capture._connect().execute('''
+        SELECT s.name, k.message FROM kernel_messages k
+        JOIN services s ON s.id = k.service_id
+        ORDER BY k.id
+    ''').fetchall()
+
+
+def test_kernel_rows_match_service_substring(capture):
+    capture.store_real_logs([
+        '2025-06-26T14:30:15-0400 fedora kernel: usb 1-1: new device',
+        '2025-06-26T14:30:16-0400 fedora Kernel-Watchdog[12]: tick',
+        '2025-06-26T14:30:17-0400 fedora systemd[1]: Started dmesg.service',
+        '2025-06-26T14:30:18-0400 fedora systemd[1]: Started session',
+    ])
+
+    assert kernel_rows(capture) == [
+        ('kernel', 'usb 1-1: new device'),
+        ('Kernel-Watchdog', 'tick'),
+        ('systemd', 'Started dmesg.service'),
+    ]
+
+
+def test_journal_entries_match_dmesg_in_message(capture):
+    entry = {'__CURSOR': 'c1', '__REALTIME_TIMESTAMP': '1750962615000000', '_HOSTNAME': 'fedora',
+             'SYSLOG_IDENTIFIER': 'systemd', '_PID': '1'}
+    capture.store_real_logs([
+        dict(entry, MESSAGE='Started dmesg.service'),
+        dict(entry, MESSAGE='Started session', dmesg='field name only'),
+    ])
+
+    assert kernel_rows(capture) == [('systemd', 'Started dmesg.service')]
+
+
+JOURNAL_ENTRY = {'__CURSOR': 'c1', '__REALTIME_TIMESTAMP': '1750962615000000', '_HOSTNAME': 'fedora',
+                 'SYSLOG_IDENTIFIER': 'systemd', '_PID': '1', 'MESSAGE': 'Started session'}
+FORMAT_TEXT_LINES = {
+    'iso': '2025-06-26T14:30:15-0400 fedora sshd[42]: Accepted key',
+    'syslog': 'Jun 26 14:30:15 fedora sshd[42]: Accepted key',
+}
+
+
+@pytest.mark.parametrize('log_format', ['json', 'iso', 'syslog'])
+def test_log_format_parses_journal_entries(tmp_path, log_format):
+    capture = RealSystemLogCapture(str(tmp_path / 'logs.db'), log_format=log_format)
+    as_text = json.dumps(JOURNAL_ENTRY)
+
+    for line in (JOURNAL_ENTRY, as_text):
+        parsed = capture.parse_system_log_line(line)
+        assert (parsed['hostname'], parsed['service'], parsed['pid'], parsed['message']) == \
+            ('fedora', 'systemd', 1, 'Started session')
+    capture.close()
+
+
+@pytest.mark.parametrize('log_format', ['iso', 'syslog'])
+def test_log_format_parses_its_text_lines(tmp_path, log_format):
+    capture = RealSystemLogCapture(str(tmp_path / 'logs.db'), log_format=log_format)
+
+    parsed = capture.parse_system_log_line(FORMAT_TEXT_LINES[log_format])
+    assert (parsed['hostname'], parsed['service'], parsed['pid'], parsed['message']) == \
+        ('fedora', 'sshd', 42, 'Accepted key')
+    capture.close()
+
+
+def test_store_round_trip_with_joined_names(capture):
+    capture.store_real_logs([
+        '2025-06-26T14:30:15-0400 fedora sshd[42]: Accepted key',
+        '2025-06-26T14:30:16-0400 buildhost NetworkManager[7]: link up',
+        'Jun 26 14:30:17 fedora sshd[43]: Disconnected',
+    ])
+
+    rows = capture._connect().execute('''
+        SELECT h.name, s.name, e.pid, e.message, e.raw_line FROM system_events e
+        JOIN hosts h ON h.id = e.host_id
+        JOIN services s ON s.id = e.service_id
+        ORDER BY e.id
+    ''').fetchall()
+    assert rows == [
+        ('fedora', 'sshd', 42, 'Accepted key', '2025-06-26T14:30:15-0400 fedora sshd[42]: Accepted key'),
+        ('buildhost', 'NetworkManager', 7, 'link up', '2025-06-26T14:30:16-0400 buildhost NetworkManager[7]: link up'),
+        ('fedora', 'sshd', 43, 'Disconnected', 'Jun 26 14:30:17 fedora sshd[43]: Disconnected'),
+    ]
+    assert sorted(row[1] for row in capture.get_verbatim_logs()['system_events']) == \
+        ['NetworkManager', 'sshd', 'sshd']
+
+
+def test_name_ids_are_cached_and_shared(capture, tmp_path):
+    line = '2025-06-26T14:30:15-0400 fedora sshd[42]: Accepted key'
+    capture.store_real_logs([line])
+    conn = capture._connect()
+    assert capture._name_ids == {
+        ('hosts', 'fedora'): conn.execute("SELECT id FROM hosts WHERE name = 'fedora'").fetchone()[0],
+        ('services', 'sshd'): conn.execute("SELECT id FROM services WHERE name = 'sshd'").fetchone()[0],
+    }
+
+    # Cached names need no lookup-table statements
+    statements = []
+    conn.set_trace_callback(statements.append)
+    capture.store_real_logs([line])
+    conn.set_trace_callback(None)
+    assert not [sql for sql in statements if 'hosts' in sql or 'services' in sql]
+
+    # A fresh instance starts uncached and finds the stored ids
+    other = RealSystemLogCapture(capture.db_path)
+    other.store_real_logs([line])
+    assert other._name_ids == capture._name_ids
+    assert conn.execute('SELECT COUNT(*) FROM hosts').fetchone()[0] == 1
+    other.close()
+
+
+def test_insert_rows_groups_values_within_parameter_limit(capture):
+    width = 7
+    per_statement = real_system_log_capture.MAX_SQL_PARAMS // width
+    rows = [('ts', None, None, i, 'message', f'raw {i}', 'captured') for i in range(2 * per_statement + 5)]
+    conn = capture._connect()
+
+    statements = []
+    conn.set_trace_callback(statements.append)
+    with conn:
+        real_system_log_capture.insert_rows(conn, real_system_log_capture.INSERT_SYSTEM_EVENT_SQL, rows)
+    conn.set_trace_callback(None)
+
+    inserts = [sql for sql in statements if 'INSERT' in sql]
+    assert [sql.count('raw ') for sql in inserts] == [per_statement, per_statement, 5]
+    assert conn.execute('SELECT pid FROM system_events ORDER BY id').fetchall() == [(i,) for i in range(len(rows))]
+    assert real_system_log_capture.values_sql('INSERT x VALUES ', 2, 3) == 'INSERT x VALUES (?, ?), (?, ?), (?, ?)'
+
+
+@pytest.mark.parametrize('line', [
+    '2025-06-26T14:30:15-0400 fedora sshd[42]: Accepted key',
+    '2025-06-26T14:30:15+0000 fedora kernel: usb 1-1: new device',
+    '2025-06-26T14:30:15-0400 fedora systemd[1]: ',
+    '2025-06-26T14:30:15-0400 fedora systemd[x]: bad pid',
+    '2025-06-26T14:30:15-0400 fedora [42]: no name',
+    '2025-06-26T14:30:15-0400 fedora a b: three fields',
+    '2025-06-26T14:30:15-0400 fedora sshd[42]:  leading space',
+    '2025-06-26X14:30:15-0400 fedora sshd[42]: bad separator',
+    '2025-06-26T14:30:15-04000 fedora sshd[42]: long offset',
+    '2025-6-26T14:30:15-0400 fedora sshd[42]: short month',
+])
+def test_parse_iso_line_agrees_with_regex(capture, line):
+    parsed = capture.parse_iso_line(line)
+    match = real_system_log_capture._LINE_RE.match(line)
+
+    if parsed is not None:
+        assert match and match.lastgroup == 'iso'
+        assert parsed == capture.matched_log_entry(line, match, 'iso')
+    elif match and match.lastgroup == 'iso':
+        # The slicer only declines; the full parser falls back to the regex
+        assert capture.parse_system_log_line(line) == capture.matched_log_entry(line, match, 'iso')
+
+
+@pytest.mark.skipif(not hasattr(os, 'fork'), reason='needs os.fork')
+def test_forked_child_opens_its_own_connection(capture):
+    parent_conn = capture._connect()
+
+    read_fd, write_fd = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        try:
+            child_conn = capture._connect()
+            ok = child_conn is not parent_conn and capture._connect() is child_conn
+            capture.store_real_logs(['2025-06-26T14:30:15-0400 fedora sshd[42]: Accepted key'])
+            os.write(write_fd, b'1' if ok else b'0')
+        finally:
+            os._exit(0)
+    os.close(write_fd)
+    os.waitpid(pid, 0)
+    assert os.read(read_fd, 1) == b'1'
+    os.close(read_fd)
+
+    assert capture._connect() is parent_conn
+    assert row_count(parent_conn) == 1
+
+
+def test_truncated_last_line_is_not_stored(tmp_path, monkeypatch, capture):
+    # journalctl killed mid-write: the last entry has no newline
+    bindir = tmp_path / 'truncbin'
+    bindir.mkdir()
+    script = bindir / 'journalctl'
+    script.write_text(f'''#!{sys.executable}
+import json, sys
+for i in range(3):
+    print(json.dumps({{'__CURSOR': f's{{i}}', '__REALTIME_TIMESTAMP': '1750962615000000',
+                      'SYSLOG_IDENTIFIER': 'sshd', 'MESSAGE': f'message {{i}}'}}))
+sys.stdout.write('{{"__CURSOR": "s3", "MESS')
+''')
+    script.chmod(0o755)
+    monkeypatch.setenv('PATH', f"{bindir}{os.pathsep}{os.environ['PATH']}")
+    monkeypatch.setattr(real_system_log_capture, 'SYSTEMD_JOURNAL_AVAILABLE', False)
+
+    cursors = {}
+    assert capture.store_real_logs(capture.capture_journalctl_logs(cursors=cursors), cursors=cursors) == 3
+    assert capture.load_capture_state() == {'journal_cursor': 's2'}
+    assert row_count(capture._connect()) == 3
+
+
+def install_journalctl(tmp_path, monkeypatch, body):
+    bindir = tmp_path / 'streambin'
+    bindir.mkdir()
+    script = bindir / 'journalctl'
+    script.write_text(f'#!{sys.executable}\nimport json, sys\n{body}')
+    script.chmod(0o755)
+    monkeypatch.setenv('PATH', f"{bindir}{os.pathsep}{os.environ['PATH']}")
+
+
+def drain(stream):
+    lines = []
+    while True:
+        try:
+            lines.append(next(stream))
+        except StopIteration as stop:
+            return lines, stop.value
+
+
+def test_chatty_journalctl_stderr_does_not_block(tmp_path, monkeypatch, capture):
+    # Far more than a pipe buffer of warnings before any entry
+    install_journalctl(tmp_path, monkeypatch, '''
+sys.stderr.write('Journal file corrupted, ignoring file.\\n' * 20000)
+sys.stderr.flush()
+print(json.dumps({'__CURSOR': 's0', 'MESSAGE': 'after the warnings'}))
+''')
+
+    lines, (count, returncode, timed_out, cursor) = drain(capture.stream_journalctl([], 5))
+    assert (len(lines), count, returncode, timed_out, cursor) == (1, 1, 0, False, 's0')
+
+
+def test_consumer_time_does_not_count_against_journalctl_timeout(tmp_path, monkeypatch, capture):
+    install_journalctl(tmp_path, monkeypatch, '''
+for i in range(3):
+    print(json.dumps({'__CURSOR': f's{i}', 'MESSAGE': 'entry'}), flush=True)
+''')
+
+    stream = capture.stream_journalctl([], 1)
+    lines = []
+    while True:
+        try:
+            lines.append(next(stream))
+        except StopIteration as stop:
+            result = stop.value
+            break
+        # A slow store: over the three lines, longer than the whole journalctl budget
+        time.sleep(0.6)
+    assert (len(lines), result) == (3, (3, 0, False, 's2'))
+
+
+def test_journalctl_is_killed_after_timeout(tmp_path, monkeypatch, capture):
+    install_journalctl(tmp_path, monkeypatch, '''
+import time
+print(json.dumps({'__CURSOR': 's0', 'MESSAGE': 'entry'}), flush=True)
+time.sleep(30)
+''')
+
+    started = time.monotonic()
+    lines, (count, returncode, timed_out, cursor) = drain(capture.stream_journalctl([], 1))
+    assert time.monotonic() - started < 10
+    assert (count, timed_out, cursor) == (1, True, 's0')